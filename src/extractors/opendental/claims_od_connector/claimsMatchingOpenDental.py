@@ -1,8 +1,20 @@
-from typing import TypedDict, Any, Dict, Optional, List, Union, Set # Added Set
-from dataclasses import dataclass
+from typing import TypedDict, Any, Dict, Optional, List, Union, FrozenSet
+from dataclasses import dataclass, field
+from functools import lru_cache, cached_property
 from datetime import datetime, date # Added for SearchCriteria and potential use in methods
 import re # Added import for regular expressions
 import collections # Added import for collections module
+import logging
+import sys
+import threading
+import time
+import traceback
+import copy
+import heapq
+import itertools
+from bisect import bisect_right
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter, is_
 
 # Import logging configuration to match celery task logging
 from backend.logging_config import get_logger, LOG_INFO, LOG_ERROR, LOG_SUCCESS, LOG_WARNING, LOG_SECTION_START, LOG_SECTION_END, LOG_SUBSECTION
@@ -10,6 +22,580 @@ from backend.logging_config import get_logger, LOG_INFO, LOG_ERROR, LOG_SUCCESS,
 # Configure a logger for this module
 logger = get_logger(__name__, worker_type="CLAIMS-WORKER")
 
+try:
+    from rapidfuzz.distance import Levenshtein as _RFLevenshtein  # Optional C++ edit distance
+except ImportError:
+    _RFLevenshtein = None
+try:
+    from rapidfuzz.distance import OSA as _RFOSA  # Not in every rapidfuzz build
+except ImportError:
+    _RFOSA = None
+try:
+    from polyleven import levenshtein as _polyleven_distance  # Optional C edit distance
+except ImportError:
+    _polyleven_distance = None
+
+# GET responses that describe people and coverage (not claim state) are reused for a short
+# time, since the same patient/subscriber is commonly looked up for several EOBs in a batch.
+# Claims and claimprocs are never cached: their status changes as payments are posted.
+_CACHEABLE_GET_PREFIXES = ('patients/', 'patplans?', 'inssubs?')
+_GET_CACHE_TTL_SECONDS = 300
+_GET_CACHE_MAXSIZE = 2048
+# OpenDentalAPI.make_request waits 150 ms before each request so that requests reach Open Dental
+# at least that far apart. Lookups fetched on a thread pool keep that spacing through a shared
+# _RequestThrottle; the pool only lets round trips overlap. Each pooled request holds a worker
+# for that 150 ms wait plus its round trip while a new one may start every 150 ms, so 4 workers
+# keep the throttle busy for round trips up to ~450 ms; more would only queue on the throttle.
+_API_REQUEST_INTERVAL_SECONDS = 0.150
+_API_FETCH_MAX_WORKERS = 4
+# match_source label for cached claims, keyed by the procedure override that passed them
+_CACHE_MATCH_SOURCE_BY_OVERRIDE = {
+    'fee': 'database_alternate_benefit',
+    'count': 'database_count_match',
+}
+
+# Maps name separators (hyphens, apostrophes) to spaces so str.split() tokenizes names
+_NAME_TOKEN_TRANS = str.maketrans({'-': ' ', "'": ' '})
+# Runs of whitespace, apostrophes or hyphens between name parts
+_LN_SPLIT_RE = re.compile(r"[\s'\-]+")
+
+class _RequestThrottle:
+    """Spaces request starts at least `interval` seconds apart across threads."""
+    def __init__(self, interval: float):
+        self.interval = interval
+        self._next_start = 0.0
+        self._lock = threading.Lock()
+
+    def wait(self):
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next_start)
+            self._next_start = start + self.interval
+        if start > now:
+            time.sleep(start - now)
+
+
+def _strip_common_affix(s1: str, s2: str) -> tuple:
+    """
+    s1 and s2 without their shared prefix and suffix. Those never add edits, so the
+    bit-parallel distances below only scan the differing middle.
+    """
+    start = 0
+    end1, end2 = len(s1), len(s2)
+    while start < end1 and start < end2 and s1[start] == s2[start]:
+        start += 1
+    while end1 > start and end2 > start and s1[end1 - 1] == s2[end2 - 1]:
+        end1 -= 1
+        end2 -= 1
+    if start or end1 < len(s1) or end2 < len(s2):
+        return s1[start:end1], s2[start:end2]
+    return s1, s2
+
+
+def _myers_levenshtein_distance(s1: str, s2: str, max_distance: Optional[int] = None) -> int:
+    """
+    Levenshtein distance via Hyyro's bit-parallel form of Myers' algorithm: one pass over the
+    longer string, with each DP column of the shorter one held as bits of a Python int.
+    Same result as the classic row-by-row DP in O(len) big-int operations.
+    With max_distance set, returns max_distance + 1 as soon as the distance must exceed it.
+    """
+    s1, s2 = _strip_common_affix(s1, s2)
+    if len(s1) < len(s2):
+        s1, s2 = s2, s1
+    m = len(s2)
+    if max_distance is not None and len(s1) - m > max_distance:
+        return max_distance + 1
+    if m == 0:
+        return len(s1)
+
+    peq: Dict[str, int] = {}  # char -> bitmask of its positions in the shorter string
+    for i, c in enumerate(s2):
+        peq[c] = peq.get(c, 0) | (1 << i)
+
+    all_ones = (1 << m) - 1
+    high_bit = 1 << (m - 1)
+    pv, mv = all_ones, 0  # vertical +1 / -1 deltas
+    dist = m
+    # Each remaining character can lower the distance by at most one
+    remaining = len(s1)
+    for c in s1:
+        eq = peq.get(c, 0)
+        xv = eq | mv
+        xh = (((eq & pv) + pv) ^ pv) | eq
+        ph = mv | ~(xh | pv)
+        mh = pv & xh
+        if ph & high_bit:
+            dist += 1
+        elif mh & high_bit:
+            dist -= 1
+        ph = (ph << 1) | 1
+        mh <<= 1
+        pv = (mh | ~(xv | ph)) & all_ones
+        mv = ph & xv & all_ones
+        remaining -= 1
+        if max_distance is not None and dist - remaining > max_distance:
+            return max_distance + 1
+    return dist
+
+
+def _myers_osa_distance(s1: str, s2: str, max_distance: Optional[int] = None) -> int:
+    """
+    Optimal string alignment distance (Levenshtein plus adjacent transpositions at cost 1,
+    each substring edited at most once) via Hyyro's bit-parallel extension of the Myers
+    recurrence above. max_distance behaves as in _myers_levenshtein_distance.
+    """
+    s1, s2 = _strip_common_affix(s1, s2)
+    if len(s1) < len(s2):
+        s1, s2 = s2, s1
+    m = len(s2)
+    if max_distance is not None and len(s1) - m > max_distance:
+        return max_distance + 1
+    if m == 0:
+        return len(s1)
+
+    peq: Dict[str, int] = {}  # char -> bitmask of its positions in the shorter string
+    for i, c in enumerate(s2):
+        peq[c] = peq.get(c, 0) | (1 << i)
+
+    all_ones = (1 << m) - 1
+    high_bit = 1 << (m - 1)
+    pv, mv = all_ones, 0  # vertical +1 / -1 deltas
+    d0 = 0  # diagonal zero-deltas of the previous column
+    prev_eq = 0
+    dist = m
+    remaining = len(s1)
+    for c in s1:
+        eq = peq.get(c, 0)
+        # Cells where swapping this character with the previous one matches
+        tr = ((~d0 & eq) << 1) & prev_eq
+        d0 = ((((eq & pv) + pv) ^ pv) | eq | mv | tr) & all_ones
+        ph = mv | ~(d0 | pv)
+        mh = d0 & pv
+        if ph & high_bit:
+            dist += 1
+        elif mh & high_bit:
+            dist -= 1
+        ph = (ph << 1) | 1
+        mh <<= 1
+        pv = (mh | ~(d0 | ph)) & all_ones
+        mv = ph & d0
+        prev_eq = eq
+        remaining -= 1
+        if max_distance is not None and dist - remaining > max_distance:
+            return max_distance + 1
+    return dist
+
+
+def _levenshtein_distance(s1: str, s2: str, max_distance: Optional[int] = None) -> int:
+    """
+    Levenshtein distance via rapidfuzz when installed, then polyleven, then the pure-Python
+    bit-parallel form. Distances above max_distance (when given) come back as max_distance + 1.
+    """
+    if _RFLevenshtein is not None:
+        return _RFLevenshtein.distance(s1, s2, score_cutoff=max_distance)
+    if _polyleven_distance is not None:
+        if max_distance is None:
+            return _polyleven_distance(s1, s2)
+        return _polyleven_distance(s1, s2, max_distance)
+    return _myers_levenshtein_distance(s1, s2, max_distance)
+
+
+def _osa_distance(s1: str, s2: str, max_distance: Optional[int] = None) -> int:
+    """Optimal string alignment distance via rapidfuzz when installed, else the pure-Python bit-parallel form."""
+    if _RFOSA is not None:
+        return _RFOSA.distance(s1, s2, score_cutoff=max_distance)
+    return _myers_osa_distance(s1, s2, max_distance)
+
+
+def _normalized_similarity(distance_func, s1: str, s2: str, min_similarity: float) -> float:
+    """
+    1 - distance_func(s1, s2) / max(len). Like rapidfuzz's score_cutoff, a similarity below
+    min_similarity is returned as 0.0, which lets the distance computation stop early once
+    the cutoff is out of reach.
+    """
+    max_len = max(len(s1), len(s2))
+    if max_len == 0:
+        return 1.0
+    if min_similarity <= 0.0:
+        return 1.0 - (distance_func(s1, s2) / max_len)
+    # One edit of slack keeps float rounding at the boundary on the exact path
+    max_distance = int((1.0 - min_similarity) * max_len) + 1
+    distance = distance_func(s1, s2, max_distance)
+    if distance > max_distance:
+        return 0.0
+    similarity = 1.0 - (distance / max_len)
+    return similarity if similarity >= min_similarity else 0.0
+
+
+def _levenshtein_similarity(s1: str, s2: str, min_similarity: float = 0.0) -> float:
+    """
+    Normalized Levenshtein similarity, 1 - distance / max(len), cut off below min_similarity.
+    Uses rapidfuzz's normalized_similarity directly when installed.
+    """
+    if _RFLevenshtein is not None:
+        return _RFLevenshtein.normalized_similarity(s1, s2, score_cutoff=min_similarity)
+    return _normalized_similarity(_levenshtein_distance, s1, s2, min_similarity)
+
+
+def _osa_similarity(s1: str, s2: str, min_similarity: float = 0.0) -> float:
+    """
+    Normalized optimal string alignment similarity, 1 - distance / max(len), cut off below
+    min_similarity. A swapped pair of letters ('jhon'/'john') costs one edit instead of two.
+    """
+    if _RFOSA is not None:
+        return _RFOSA.normalized_similarity(s1, s2, score_cutoff=min_similarity)
+    return _normalized_similarity(_osa_distance, s1, s2, min_similarity)
+
+
+def _token_match_pct(claim_name: str, crit_token_variations: tuple) -> int:
+    """
+    Percentage (0-100) of criteria tokens whose variations intersect the claim name's tokens.
+    Returns 0 unless the first criteria token matches, so 'Mary Ann' does not match a bare 'Ann'.
+    """
+    if not crit_token_variations:
+        return 0
+    claim_tokens = set(claim_name.lower().translate(_NAME_TOKEN_TRANS).split())
+    if not claim_tokens or crit_token_variations[0].isdisjoint(claim_tokens):
+        return 0
+    matched = sum(1 for variations in crit_token_variations if not variations.isdisjoint(claim_tokens))
+    return (100 * matched) // len(crit_token_variations)
+
+
+def _split_ln_parts(name: str) -> List[str]:
+    """Parts of a (last) name longer than one character, e.g. 'de la cruz' -> ['de', 'la', 'cruz']."""
+    return [part for part in _LN_SPLIT_RE.split(name) if len(part) > 1]
+
+
+def _name_swap_can_match(crit_fn_norm: str, crit_ln_norm: str) -> bool:
+    """
+    Cheap gate for the first/last name swap retry. The swap can only change the score when
+    the criteria last name (the swapped first name) is present and differs from the first
+    name; otherwise it scores 0 or repeats the original attempt. A claim without a first
+    name scores 0 either way, so callers also skip the swap in that case.
+    """
+    return bool(crit_ln_norm) and crit_ln_norm != crit_fn_norm
+
+
+def _proc_code_match_pct(eob_code_set: frozenset, claim_codes) -> float:
+    """
+    Fraction of the EOB's distinct (normalized) codes present among the claim's codes.
+    The common case of the claim covering every EOB code returns 1.0 without building
+    an intersection.
+    """
+    if not eob_code_set:
+        return 0.0
+    claim_code_set = claim_codes if isinstance(claim_codes, (set, frozenset)) else frozenset(claim_codes)
+    if eob_code_set <= claim_code_set:
+        return 1.0
+    return len(eob_code_set & claim_code_set) / len(eob_code_set)
+
+
+def _fees_match(pms_fee: float, eob_fee: float) -> bool:
+    """Whether a PMS fee and an EOB fee agree within $1 or 2% of the larger one (rounding differences)."""
+    fee_diff = abs(pms_fee - eob_fee)
+    if fee_diff <= 1.0:
+        return True
+    larger_fee = max(pms_fee, eob_fee)
+    return (fee_diff / larger_fee if larger_fee > 0 else 0) <= 0.02
+
+
+def _procedure_override_possible(claim_procedures: list, eob_procedures: list, eob_fees_sorted: tuple) -> bool:
+    """
+    Name-independent precondition for the alternate benefit (fee) and count overrides.
+    The count override needs equal procedure counts; the fee override needs one positive
+    PMS fee per positive EOB fee, so at least that many claim procedures.
+    """
+    claim_count = len(claim_procedures) if claim_procedures else 0
+    eob_count = len(eob_procedures) if eob_procedures else 0
+    if claim_count == eob_count:
+        return True
+    return bool(eob_fees_sorted) and claim_count >= len(eob_fees_sorted)
+
+
+# Alternate keys a cached (MongoDB) claim may carry for one field, in lookup order
+_CACHED_CLAIM_KEY_ALIASES = {
+    'claim_num': ('claim_num', 'ClaimNum'),
+    'pat_num': ('pat_num', 'PatNum'),
+    'date_of_service': ('date_of_service', 'claim_date', 'DateService'),
+    'claim_status': ('claim_status', 'ClaimStatus'),
+    'claim_fee': ('claim_fee', 'ClaimFee'),
+    'claim_note': ('claim_note', 'ClaimNote'),
+    'patient_first_name': ('patient_first_name', 'pat_fn'),
+    'patient_last_name': ('patient_last_name', 'pat_ln'),
+}
+
+
+def _pick(record: Dict[str, Any], keys: tuple, default: Any = None) -> Any:
+    """
+    First truthy record[key] over keys. When none is truthy, returns default, or with no
+    default the last key's value, as `get(a) or get(b)` does (so a PatNum of 0 stays 0).
+    """
+    value = None
+    for key in keys:
+        value = record.get(key)
+        if value:
+            return value
+    return value if default is None else default
+
+
+def _int_or_zero(value: Any) -> int:
+    """int(value), or 0 for None and values that do not convert."""
+    if value is None:
+        return 0
+    try:
+        return int(value)
+    except (ValueError, TypeError):
+        return 0
+
+
+def _cached_proc_for_match(code_norm: str, proc_data: Dict[str, Any]) -> Dict[str, Any]:
+    """ClaimMatch claim_procs entry for a cached (MongoDB) procedure whose code is already normalized."""
+    return {
+        "CodeSent": code_norm,
+        "FeeBilled": float(_pick(proc_data, ('fee_billed', 'FeeBilled'), 0)),
+        "ClaimProcNum": _int_or_zero(_pick(proc_data, ('claim_proc_num', 'ClaimProcNum'))),
+        "WriteOff": float(_pick(proc_data, ('writeoff', 'WriteOff'), 0)),
+        "InsPayAmt": float(_pick(proc_data, ('ins_pay_amt', 'InsPayAmt'), 0)),
+        "DedApplied": float(_pick(proc_data, ('ded_applied', 'DedApplied'), 0)),
+        "Status": _pick(proc_data, ('status', 'status_val'), proc_data.get('Status')), # MongoDB uses 'status'
+        "DateInsFinalized": proc_data.get('date_ins_finalized', proc_data.get('DateInsFinalized', proc_data.get('DateSuppReceived', ''))),
+        "ToothNum": _pick(proc_data, ('tooth_num', 'ToothNum'), ''), # MongoDB uses 'tooth_num'
+        "Remarks": _pick(proc_data, ('remarks', 'Remarks'), ''), # MongoDB uses 'remarks'
+        # UCR fields from cached claims
+        "matchesUCR": proc_data.get('matchesUCR', False),
+        "ucr_amount": float(proc_data.get('ucr_amount') or 0)
+    }
+
+
+def _api_proc_for_match(code_sent: Any, proc_raw: Dict[str, Any]) -> Dict[str, Any]:
+    """ClaimMatch claim_procs entry for an Open Dental API claimproc; CodeSent is passed in as the caller stores it."""
+    proc_get = proc_raw.get
+    return {
+        "CodeSent": code_sent,
+        "FeeBilled": float(proc_get('FeeBilled') or 0),
+        "ClaimProcNum": _int_or_zero(proc_get('ClaimProcNum')),
+        "WriteOff": float(proc_get('WriteOff') or 0),
+        "InsPayAmt": float(proc_get('InsPayAmt') or 0),
+        "DedApplied": float(proc_get('DedApplied') or 0),
+        "Status": proc_get('Status'),
+        "DateInsFinalized": proc_get('DateInsFinalized', proc_get('DateSuppReceived', '')),
+        # UCR fields from API calls
+        "matchesUCR": proc_get('matchesUCR', False),
+        "ucr_amount": float(proc_get('ucr_amount') or 0)
+    }
+
+
+def _is_ortho_flag(value: Any) -> bool:
+    """IsOrtho as a bool: True, or a string equal to 'true' in any case. Anything else (None, 1, 'Y') is False."""
+    return value is True or (isinstance(value, str) and value.lower() == 'true')
+
+
+def _is_iso_date_shape(value: str) -> bool:
+    """True for zero-padded 'YYYY-MM-DD' strings (not validated as a real date)."""
+    return len(value) == 10 and value[4] == '-' and value[7] == '-'
+
+
+def _is_target_service_date(value: str, target_key: str, target_date: date) -> bool:
+    """
+    True when a claim's DateService is the target date. Zero-padded values are compared as
+    strings against target_key (target_date.isoformat()) without parsing; other shapes are
+    parsed and may raise ValueError like _parse_iso_date.
+    """
+    if _is_iso_date_shape(value):
+        return value == target_key
+    return _parse_iso_date(value) == target_date
+
+
+@lru_cache(maxsize=4096)
+def _parse_iso_date(value: str) -> date:
+    """
+    Parse a 'YYYY-MM-DD' date, raising ValueError like strptime. Zero-padded values take the
+    C fromisoformat path; anything else (e.g. '2024-1-5') falls back to strptime so the set
+    of accepted inputs is unchanged. Cached per string, since a patient's claims and the
+    criteria tend to share a handful of dates (failures are not cached and re-raise).
+    """
+    if _is_iso_date_shape(value):
+        return date.fromisoformat(value)
+    return datetime.strptime(value, '%Y-%m-%d').date()
+
+
+@lru_cache(maxsize=4096)
+def _normalize_proc_code(code: str) -> str:
+    """Canonical CDT code: 'D' prefix, leading zeros stripped down to 4 digits (D00120 -> D0120)."""
+    if not code:
+        return code
+    if code.startswith('D') and len(code) > 5 and code[1:].isdigit():
+        digits = code[1:].lstrip('0')
+        if len(digits) < 4:
+            digits = digits.rjust(4, '0')
+        code = 'D' + digits
+    elif not code.startswith('D') and code.isdigit():
+        code = 'D' + code
+    return code
+
+
+def _norm_name(name: Optional[str]) -> str:
+    """Stripped, lowercased name for matching; '' for missing values."""
+    return name.strip().lower() if name else ""
+
+
+# Pattern families used by ClaimMatcher._build_regex_for_name_part, parameterized on the
+# escaped token (tok) and derived pieces. Which families apply depends on token length.
+_NAME_PART_TEMPLATES: Dict[str, str] = {
+    'initial': r'(?:\b{tok}(?:\.|[a-z]*)\b)',
+    'short': r'\b{tok}[a-z]{{0,3}}\b',
+    'full': r'\b{tok}[a-z]*\b',
+    'suffix': r'[a-z]*{tok}\b',
+    'substring': r'\b[a-z]*{tok}[a-z]*\b',
+    'fuzzy_middle': r'\b{first}[a-z]{{{lo},{hi}}}{last}[a-z]*\b',
+}
+
+
+@lru_cache(maxsize=4096)
+def _token_pattern(token: str) -> str:
+    """Regex string for a single lowercased name token (cached per token)."""
+    tmpl = _NAME_PART_TEMPLATES
+    tok = re.escape(token)
+
+    if len(token) == 1:  # Initial, possibly followed by dot or longer name
+        return tmpl['initial'].format(tok=tok)
+
+    if len(token) == 2:  # Very short name or partial: restrictive but flexible
+        patterns = [tmpl[key].format(tok=tok) for key in ('short', 'suffix', 'substring')]
+        return f'(?:{"|".join(patterns)})'
+
+    # Longer name part: full, suffix and substring matches
+    patterns = [tmpl[key].format(tok=tok) for key in ('full', 'suffix', 'substring')]
+
+    # Drop the first letter for typos like Dthunell -> Thunell
+    if len(token) >= 5:
+        patterns.append(tmpl['full'].format(tok=re.escape(token[1:])))
+
+    # First letter + fuzzy middle + last letter(s), e.g. catherine vs katherine
+    if len(token) >= 4:
+        last_part = tok[-2:] if len(token) > 4 else tok[-1]
+        middle_len = len(token) - len(last_part) - 1
+        patterns.append(tmpl['fuzzy_middle'].format(
+            first=tok[0], lo=max(1, middle_len - 1), hi=middle_len + 1, last=re.escape(last_part)
+        ))
+
+    # Prefix matching with adaptive length
+    min_prefix_len = min(2, len(token) - 1)
+    for prefix_len in range(len(token) - 1, min_prefix_len - 1, -1):
+        patterns.append(tmpl['full'].format(tok=re.escape(token[:prefix_len])))
+
+    return f'(?:{"|".join(patterns)})'
+
+
+@lru_cache(maxsize=1024)
+def _last_name_pattern(last_name: str) -> str:
+    """
+    Regex matching either the full (normalized) last name or any single part of a
+    multi-part last name, e.g. 'navarro cedillo' also matches 'cedillo'.
+    """
+    full_pattern = ClaimMatcher._build_regex_for_name_part(last_name)
+    ln_parts = last_name.translate(_NAME_TOKEN_TRANS).split()
+    if len(ln_parts) < 2:
+        return full_pattern
+    alternatives = [full_pattern] + [_token_pattern(part) for part in ln_parts]
+    return '|'.join(f'(?:{pattern})' for pattern in alternatives)
+
+
+# Honorifics and generational suffixes dropped by _normalize_name_for_matching
+_NAME_PREFIXES = frozenset({'dr.', 'dr', 'mr.', 'mr', 'mrs.', 'mrs', 'ms.', 'ms', 'miss'})
+_NAME_SUFFIXES = frozenset({'jr.', 'jr', 'sr.', 'sr', 'ii', 'iii', 'iv'})
+# Hyphens, apostrophes and periods separate name parts like whitespace does
+_NAME_PART_SEPARATOR_TRANS = str.maketrans({'-': ' ', "'": ' ', '.': ' '})
+# OCR fixes, applied in this order: number/letter confusion, then the multi-character
+# shape confusions and ligatures, then scanner artifacts. The two single-character
+# stages can each run as one translate() since none of their outputs feed another fix
+# in the same stage.
+_OCR_DIGIT_TABLE = str.maketrans({'0': 'o', '1': 'l', '5': 's', '8': 'b'})
+_OCR_MULTI_CHAR_FIXES = (
+    # Character shape confusion
+    ('rn', 'm'), ('cl', 'd'), ('vv', 'w'), ('ii', 'n'),
+    # Common OCR errors
+    ('ﬁ', 'fi'), ('ﬂ', 'fl'), ('oe', 'ce'), ('ae', 'a'),
+)
+_OCR_ARTIFACT_TABLE = str.maketrans({'.': '', '_': '', '|': 'l', '\\': '', '/': ''})
+
+
+@lru_cache(maxsize=16384)
+def _normalize_name_for_matching(name: str) -> str:
+    """
+    Implementation of ClaimMatcher.normalize_name_for_matching, cached per raw name. Results
+    are interned, so raw spellings that normalize alike share one object and the equality
+    check in calculate_enhanced_similarity short-circuits on identity.
+    """
+    if not name or not name.strip():
+        return ""
+
+    # Split into parts for processing
+    parts = name.lower().translate(_NAME_PART_SEPARATOR_TRANS).split()
+    if not parts:
+        return ""
+
+    # Remove prefix/suffix parts; fall back to the original parts if all were removed
+    cleaned_parts = [part for part in parts if part not in _NAME_PREFIXES and part not in _NAME_SUFFIXES]
+    if not cleaned_parts:
+        cleaned_parts = parts
+
+    result_parts = []
+    for part in cleaned_parts:
+        fixed_part = part.translate(_OCR_DIGIT_TABLE)
+        for bad_chars, good_chars in _OCR_MULTI_CHAR_FIXES:
+            fixed_part = fixed_part.replace(bad_chars, good_chars)
+        fixed_part = fixed_part.translate(_OCR_ARTIFACT_TABLE)
+
+        # Handle double letters that might be OCR artifacts
+        # But be careful not to break legitimate double letters
+        if len(fixed_part) > 2:
+            dedupe_part = ''.join(char for char, _ in itertools.groupby(fixed_part))
+            if len(dedupe_part) >= 2:  # Don't reduce to single character
+                fixed_part = dedupe_part
+
+        result_parts.append(fixed_part)
+
+    return sys.intern(' '.join(result_parts))
+
+
+@lru_cache(maxsize=4096)
+def _char_mask(name: str) -> int:
+    """Set of distinct characters in name as an int with bit ord(c) set for each character."""
+    mask = 0
+    for char in set(name):
+        mask |= 1 << ord(char)
+    return mask
+
+
+# Deletes the vowels _simple_soundex drops after the first letter
+_SOUNDEX_VOWEL_TRANS = str.maketrans('', '', 'aeiou')
+
+
+@lru_cache(maxsize=4096)
+def _simple_soundex(name: str) -> str:
+    """
+    Basic soundex-like key: first letter, then the remaining letters without vowels and with
+    consecutive repeats collapsed (vowels do not break a run), padded/truncated to 4 chars.
+    """
+    if not name:
+        return ""
+    key = ''.join(char for char, _ in itertools.groupby(name[0] + name[1:].translate(_SOUNDEX_VOWEL_TRANS)))
+    return key[:4].ljust(4, '0')
+
+
+# Levenshtein similarity tiers for calculate_enhanced_similarity: bisect_right over the
+# cutoffs indexes the (match_type, score) entry; index 0 (below 0.6) is no tier at all
+_SIMILARITY_TIER_CUTOFFS = (0.6, 0.7, 0.8, 0.9)
+_SIMILARITY_TIERS = (
+    None,
+    ('weak_similarity', 5),
+    ('fair_similarity', 8),
+    ('good_similarity', 10),
+    ('high_similarity', 12),
+)
+
+
 # NicknameMapper Class Definition (as provided by user)
 class NicknameMapper:
     # Bidirectional nickname mappings
@@ -88,6 +674,7 @@ class NicknameMapper:
     def __init__(self):
         # Build lookup dictionaries for O(1) access
         self._nickname_to_group = {}
+        self._variations_by_name: Dict[str, FrozenSet[str]] = {}
         self._build_lookup_tables()
     
     def _build_lookup_tables(self):
@@ -95,19 +682,21 @@ class NicknameMapper:
         for idx, name_group in enumerate(self.NICKNAME_GROUPS):
             for name in name_group:
                 self._nickname_to_group[name.lower()] = idx
+        # Materialize each name's variation set once; a name listed in several
+        # groups resolves to the last one, same as _nickname_to_group
+        for name, group_idx in self._nickname_to_group.items():
+            self._variations_by_name[name] = frozenset(
+                n.lower() for n in self.NICKNAME_GROUPS[group_idx]
+            ) | {name}
     
-    def get_name_variations(self, name: str) -> Set[str]:
+    def get_name_variations(self, name: str) -> FrozenSet[str]:
         """Get all possible variations of a name including nicknames"""
         name_lower = name.lower().strip()
         
-        # Always include the original name
-        variations = {name_lower}
-        
-        # Find the nickname group this name belongs to
-        if name_lower in self._nickname_to_group:
-            group_idx = self._nickname_to_group[name_lower]
-            variations.update(self.NICKNAME_GROUPS[group_idx])
-        
+        # Precomputed group (which already contains the name), or just the name itself
+        variations = self._variations_by_name.get(name_lower)
+        if variations is None:
+            return frozenset((name_lower,))
         return variations
     
     def are_names_related(self, name1: str, name2: str) -> bool:
@@ -117,7 +706,7 @@ class NicknameMapper:
         name2_lower = name2.lower().strip()
         if not name1_lower or not name2_lower:
             return False # Cannot be related if one is empty
-        return bool(self.get_name_variations(name1_lower) & self.get_name_variations(name2_lower))
+        return not self.get_name_variations(name1_lower).isdisjoint(self.get_name_variations(name2_lower))
 
 @dataclass
 class ProcedurePayment: # Copied from claimsOpenDental.py as it's used by PaymentInfo
@@ -140,6 +729,32 @@ class PaymentInfo: # Copied from claimsOpenDental.py as it's used by SearchCrite
     pay_type: int | None = None
     note: str | None = None
 
+    @cached_property
+    def normalized_proc_codes(self) -> frozenset:
+        """Normalized codes of all EOB procedures that have one, built once per payment."""
+        return frozenset(_normalize_proc_code(p.proc_code) for p in self.procedures if p.proc_code)
+
+    @cached_property
+    def normalized_proc_codes_with_blanks(self) -> frozenset:
+        """
+        Like normalized_proc_codes, but EOB procedures without a code add their blank code too;
+        the API-path match percentage has always counted those in its denominator.
+        """
+        return frozenset(_normalize_proc_code(p.proc_code) for p in self.procedures)
+
+    @cached_property
+    def total_paid(self) -> float:
+        """Sum of amount_paid over the EOB procedures, computed once per payment."""
+        return sum(p.amount_paid for p in self.procedures) if self.procedures else 0.0
+
+    @cached_property
+    def sorted_submitted_fees(self) -> tuple:
+        """Positive EOB submitted amounts in ascending order, for fee-based alternate benefit checks."""
+        return tuple(sorted(
+            float(p.submitted_amt) for p in self.procedures
+            if hasattr(p, 'submitted_amt') and p.submitted_amt > 0
+        ))
+
 @dataclass
 class SearchCriteria:
     date_of_service: str
@@ -148,6 +763,118 @@ class SearchCriteria:
     subscriber_first_name: str
     subscriber_last_name: str
     payment_info: PaymentInfo
+    # Stripped/lowercased names, computed once so scoring does no string work per candidate
+    patient_first_name_norm: str = field(init=False, repr=False)
+    patient_last_name_norm: str = field(init=False, repr=False)
+    subscriber_first_name_norm: str = field(init=False, repr=False)
+    subscriber_last_name_norm: str = field(init=False, repr=False)
+
+    def __post_init__(self):
+        # Interned like the cached claim columns' names, so equal names compare by identity
+        self.patient_first_name_norm = sys.intern(_norm_name(self.patient_first_name))
+        self.patient_last_name_norm = sys.intern(_norm_name(self.patient_last_name))
+        self.subscriber_first_name_norm = sys.intern(_norm_name(self.subscriber_first_name))
+        self.subscriber_last_name_norm = sys.intern(_norm_name(self.subscriber_last_name))
+
+@dataclass
+class _NameQuery:
+    """Criteria-side name data prebuilt once per search and reused for every candidate."""
+    fn: str  # normalized criteria first name
+    ln: str  # normalized criteria last name
+    fn_variations: FrozenSet[str]  # nickname variations of the full first name
+    fn_token_variations: tuple  # nickname variations per first-name token
+    fn_pattern: str  # nickname-aware first-name regex
+    ln_pattern: str  # full-or-parts last-name regex ('' if no last name)
+
+@dataclass
+class _CachedClaimColumns:
+    """
+    Parallel per-field lists over the cached claims of one date of service, with the
+    alternate-key lookups ('claim_status' or 'ClaimStatus', ...) resolved once.
+    """
+    claims: List[Dict[str, Any]]
+    claim_nums: List[Any]
+    date_strs: List[str]
+    statuses: List[Optional[str]]
+    is_secondary: List[bool]
+    patient_fns: List[Optional[str]]  # normalized; None when the cache has no first name
+    patient_lns: List[Optional[str]]  # normalized; None when the cache has no last name
+    pat_nums: List[Any]  # raw 'pat_num' or 'PatNum'
+    procs: List[List[Dict[str, Any]]]  # 'procedures' or 'claim_procs'
+    subscriber_fns: List[Optional[str]]  # normalized; None when missing or blank
+    subscriber_lns: List[Optional[str]]  # normalized; None when missing or blank
+
+    @classmethod
+    def from_claims(cls, claims: List[Dict[str, Any]]) -> '_CachedClaimColumns':
+        columns = cls(
+            claims=claims, claim_nums=[], date_strs=[], statuses=[], is_secondary=[],
+            patient_fns=[], patient_lns=[], pat_nums=[], procs=[], subscriber_fns=[], subscriber_lns=[]
+        )
+        aliases = _CACHED_CLAIM_KEY_ALIASES
+        # A patient usually has several claims on one date; each distinct raw name is normalized
+        # once and interned, so the name-score memo keys share one string object per name
+        normalized_names: Dict[str, str] = {}
+
+        def normalize(raw_name: str) -> str:
+            name_norm = normalized_names.get(raw_name)
+            if name_norm is None:
+                name_norm = normalized_names[raw_name] = sys.intern(_norm_name(raw_name))
+            return name_norm
+
+        for claim in claims:
+            columns.claim_nums.append(_pick(claim, aliases['claim_num'], 'UnknownDBClaimNum'))
+            columns.pat_nums.append(_pick(claim, aliases['pat_num']))
+            # Cached procedures might be under 'procedures', 'claim_procs', etc.
+            columns.procs.append(claim.get('procedures', claim.get('claim_procs', [])))
+            columns.date_strs.append(_pick(claim, aliases['date_of_service']))
+            columns.statuses.append(_pick(claim, aliases['claim_status']))
+            is_secondary = claim.get('is_secondary', claim.get('IsSecondary', False))
+            if isinstance(is_secondary, str):
+                is_secondary = is_secondary.lower() == 'true'
+            columns.is_secondary.append(bool(is_secondary))
+            # Cached claim patient names might be under keys like 'patient_first_name', 'pat_fn', etc.
+            patient_fn_raw = _pick(claim, aliases['patient_first_name'])
+            patient_ln_raw = _pick(claim, aliases['patient_last_name'])
+            columns.patient_fns.append(normalize(patient_fn_raw) if patient_fn_raw else None)
+            columns.patient_lns.append(normalize(patient_ln_raw) if patient_ln_raw else None)
+            # Subscriber names only feed the bonus check, which skips blank values
+            subscriber_fn = _norm_name(claim.get('subscriber_first_name'))
+            subscriber_ln = _norm_name(claim.get('subscriber_last_name'))
+            columns.subscriber_fns.append(subscriber_fn or None)
+            columns.subscriber_lns.append(subscriber_ln or None)
+        return columns
+
+@dataclass
+class _CachedClaimScanContext:
+    """Per-search state shared (read-only) by every cached-claim evaluation in filter_cached_claims."""
+    criteria: SearchCriteria
+    target_date_obj: date
+    columns: _CachedClaimColumns
+    primary_name_scores: Dict[tuple, int]  # (fn, ln) -> primary name score
+    swapped_name_query: _NameQuery
+    subscriber_name_query: _NameQuery
+    swap_possible: bool
+    criteria_name_fn: str  # criteria name used for matching (patient, or subscriber as patient)
+    criteria_name_ln: str
+    payment_proc_codes_normalized: List[str]
+    eob_procedures: list  # criteria.payment_info.procedures
+    eob_proc_codes: FrozenSet[str]  # criteria.payment_info.normalized_proc_codes
+    eob_fees_sorted: tuple  # criteria.payment_info.sorted_submitted_fees
+    check_subscriber: bool  # criteria has both subscriber first and last names
+    log_prefix: str
+    log_info: bool
+
+@dataclass
+class _ClaimsDateIndex:
+    """Date-of-service index over one cached claims list, kept by ClaimMatcher between searches."""
+    claims: tuple  # the indexed claim dicts, compared by identity to spot a changed claims list
+    by_date: Dict[str, List[Dict[str, Any]]]  # ISO date of service -> claims
+    undated_count: int  # claims without a parseable date of service
+    columns_by_date: Dict[str, _CachedClaimColumns] = field(default_factory=dict)  # filled per searched date
+
+    def covers(self, db_claims: List[Dict[str, Any]]) -> bool:
+        """Whether db_claims holds exactly the indexed claim dicts, in order."""
+        return len(db_claims) == len(self.claims) and all(map(is_, db_claims, self.claims))
 
 class ClaimMatch(TypedDict):
     claim_num: int
@@ -175,7 +902,52 @@ class ClaimMatcher:
         self.pms_data = pms_data # Will be used by methods needing it
         self.nickname_mapper = NicknameMapper()  # Add nickname support
         self._compiled_regex_cache = {} # Cache compiled regexes
+        self._get_cache: 'collections.OrderedDict[str, tuple]' = collections.OrderedDict()  # endpoint -> (fetched_at, response), LRU order
+        self._get_cache_lock = threading.Lock()  # patplans are fetched from worker threads
+        self._request_throttle = _RequestThrottle(_API_REQUEST_INTERVAL_SECONDS)  # Shared by pooled fetches
         self._nickname_cache = {}  # Cache nickname lookups (currently unused based on provided NicknameMapper)
+        self._name_score_cache: Dict[tuple, int] = {}  # (claim_fn, claim_ln, crit_fn, crit_ln) -> name score, reset per search
+        self._name_query_cache: Dict[tuple, _NameQuery] = {}  # (crit_fn, crit_ln) -> prebuilt criteria name data
+        self._claims_date_index: Optional[_ClaimsDateIndex] = None  # Date index of the last cached claims searched
+
+    def _get(self, endpoint: str) -> Any:
+        """
+        GET via make_request, reusing recent responses for endpoints in _CACHEABLE_GET_PREFIXES.
+        Requests that reach make_request are spaced by the shared request throttle, so calls from
+        worker threads keep make_request's per-request pacing.
+        """
+        if not endpoint.startswith(_CACHEABLE_GET_PREFIXES):
+            self._request_throttle.wait()
+            return self.make_request(endpoint)
+
+        with self._get_cache_lock:
+            cached = self._get_cache.get(endpoint)
+            if cached is not None and time.monotonic() - cached[0] < _GET_CACHE_TTL_SECONDS:
+                self._get_cache.move_to_end(endpoint)
+            else:
+                cached = None
+        if cached is not None:
+            return copy.deepcopy(cached[1])
+
+        self._request_throttle.wait()
+        response = self.make_request(endpoint)
+        if isinstance(response, (list, dict)):
+            self._store_get_response(endpoint, response)
+        return response
+
+    def _store_get_response(self, endpoint: str, response: Any) -> None:
+        """Cache a GET response, dropping expired entries and then the least recently used past _GET_CACHE_MAXSIZE"""
+        snapshot = copy.deepcopy(response)
+        with self._get_cache_lock:
+            now = time.monotonic()
+            cache = self._get_cache
+            cache.pop(endpoint, None)
+            expired = [key for key, (fetched_at, _) in cache.items() if now - fetched_at >= _GET_CACHE_TTL_SECONDS]
+            for key in expired:
+                del cache[key]
+            cache[endpoint] = (now, snapshot)
+            while len(cache) > _GET_CACHE_MAXSIZE:
+                cache.popitem(last=False)
 
     @staticmethod
     def _build_regex_for_name_part(query_part: str) -> str:
@@ -189,71 +961,13 @@ class ClaimMatcher:
         query_part_normalized = query_part.lower().strip()
         
         # Split by sequences of hyphens, spaces, or apostrophes to get name tokens
-        name_tokens = re.split(r'[-\s\']+', query_part_normalized)
+        name_tokens = _LN_SPLIT_RE.split(query_part_normalized)
         name_tokens = [token for token in name_tokens if token]  # Remove empty strings
         
         if not name_tokens:
             return r".*"
             
-        regex_parts = []
-        
-        for token in name_tokens:
-            escaped_token = re.escape(token)
-            
-            # Handle different patterns based on token length
-            if len(token) == 1:  # Initial
-                # Match as initial (possibly followed by dot or longer name)
-                regex_parts.append(fr'(?:\b{escaped_token}(?:\.|[a-z]*)\b)')
-            elif len(token) == 2:  # Very short name or partial
-                # For very short names, be more restrictive but still allow flexibility
-                patterns = [
-                    fr'\b{escaped_token}[a-z]{{0,3}}\b',  # Original pattern
-                    fr'[a-z]*{escaped_token}\b',          # ENHANCED: Match as suffix
-                    fr'\b[a-z]*{escaped_token}[a-z]*\b'   # ENHANCED: Match as contained substring
-                ]
-                regex_parts.append(f'(?:{"|".join(patterns)})')
-            else:  # Longer name part
-                # Dynamic minimum prefix length based on name length
-                min_prefix_len = min(2, len(token) - 1)  # Smaller threshold for shorter names
-                
-                patterns = []
-                
-                # Full match (possibly with additional characters)
-                patterns.append(fr'\b{escaped_token}[a-z]*\b')
-                
-                # ENHANCED: Add suffix matching for truncated names
-                if len(token) >= 2:
-                    patterns.append(fr'[a-z]*{escaped_token}\b')  # Match as suffix
-                
-                # ENHANCED: Add substring matching for partial names
-                if len(token) >= 3:
-                    patterns.append(fr'\b[a-z]*{escaped_token}[a-z]*\b')  # Match as substring
-                
-                # NEW: Try matching without the first letter (for typos like Dthunell -> Thunell)
-                if len(token) >= 5:  # Only for reasonably long names
-                    without_first = token[1:]
-                    escaped_without_first = re.escape(without_first)
-                    patterns.append(fr'\b{escaped_without_first}[a-z]*\b')
-                
-                # First letter + fuzzy middle + last letter(s) for longer names
-                # This helps catch spelling variations like "catherine" vs "katherine"
-                if len(token) >= 4:
-                    first_letter = escaped_token[0]
-                    last_part = escaped_token[-2:] if len(token) > 4 else escaped_token[-1]
-                    middle_len = len(token) - len(last_part) - 1
-                    # Allow flexible middle with some length constraints
-                    patterns.append(fr'\b{first_letter}[a-z]{{{max(1, middle_len-1)},{middle_len+1}}}' + 
-                                re.escape(last_part) + r'[a-z]*\b')
-                
-                # Prefix matching with adaptive length
-                for prefix_len in range(len(token)-1, min_prefix_len-1, -1):
-                    prefix = token[:prefix_len]
-                    escaped_prefix = re.escape(prefix)
-                    # More permissive pattern for longer prefixes
-                    patterns.append(fr'\b{escaped_prefix}[a-z]*\b')
-                
-                # Combine all patterns for this token
-                regex_parts.append(f'(?:{"|".join(patterns)})')
+        regex_parts = [_token_pattern(token) for token in name_tokens]
         
         # Join with flexible pattern between tokens
         # The (?:.*?| ) means either some characters or just a space between tokens
@@ -262,78 +976,52 @@ class ClaimMatcher:
 
     @staticmethod
     def levenshtein_distance(s1: str, s2: str) -> int:
-        if len(s1) < len(s2):
-            return ClaimMatcher.levenshtein_distance(s2, s1)
-        if len(s2) == 0:
-            return len(s1)
-        previous_row = range(len(s2) + 1)
-        for i, c1 in enumerate(s1):
-            current_row = [i + 1]
-            for j, c2 in enumerate(s2):
-                insertions = previous_row[j + 1] + 1
-                deletions = current_row[j] + 1
-                substitutions = previous_row[j] + (c1 != c2)
-                current_row.append(min(insertions, deletions, substitutions))
-            previous_row = current_row
-        return previous_row[-1]
+        return _levenshtein_distance(s1, s2)
 
     @staticmethod
     def normalize_procedure_code(code: str) -> str:
-        if not code:
-            return code
-        if code.startswith('D') and len(code) > 5 and code[1:].isdigit():
-            digits = code[1:]
-            if len(digits) > 4:
-                while len(digits) > 4 and digits[0] == '0':
-                    digits = digits[1:]
-            code = 'D' + digits
-        elif not code.startswith('D') and code.isdigit():
-            code = 'D' + code
-        return code
+        return _normalize_proc_code(code)
 
     def _match_procedure_codes(self, payment_codes: List[str], db_codes: List[str]) -> Dict[str, Union[float, int, List[str]]]:
         """
         Compare procedure codes from the payment and database to calculate match percentage.
         Enhanced to handle ortho claims with multiple identical codes.
+        Either argument may be a list or a (frozen)set; each distinct code is normalized once.
         """
         if not payment_codes or not db_codes:
             return {'match_percentage': 0.0, 'matched_codes': []}
         
+        payment_code_set = set(payment_codes)
+        db_code_set = set(db_codes)
+
         # Special case for ortho claims (multiple identical codes)
-        if len(set(payment_codes)) == 1 and len(set(db_codes)) == 1:
+        if len(payment_code_set) == 1 and len(db_code_set) == 1:
             # If both lists contain exclusively one unique code (repeated multiple times)
-            payment_unique_code = payment_codes[0]
-            db_unique_code = db_codes[0]
+            payment_unique_code = next(iter(payment_code_set))
+            db_unique_code = next(iter(db_code_set))
             
             # If the unique codes match (after normalization)
-            if self.normalize_procedure_code(payment_unique_code) == self.normalize_procedure_code(db_unique_code):
+            if _normalize_proc_code(payment_unique_code) == _normalize_proc_code(db_unique_code):
                 return {
                     'match_percentage': 1.0,
                     'matched_codes': [payment_unique_code]
                 }
         
         # Regular matching for non-ortho or mixed code scenarios
-        matched_codes = []
-        payment_code_set = set(payment_codes)
-        db_code_set = set(db_codes)
-        
-        # First, normalize all codes for comparison
-        normalized_payment_codes = {self.normalize_procedure_code(code) for code in payment_code_set}
-        normalized_db_codes = {self.normalize_procedure_code(code) for code in db_code_set}
+        # Normalize each distinct code once, keeping the original payment codes for the result
+        normalized_by_payment_code = {code: _normalize_proc_code(code) for code in payment_code_set}
+        normalized_payment_codes = set(normalized_by_payment_code.values())
+        normalized_db_codes = {_normalize_proc_code(code) for code in db_code_set}
         
         # Find intersection of normalized codes
-        matching_normalized_codes = normalized_payment_codes.intersection(normalized_db_codes)
-        
-        # Count matches using original payment codes to preserve them for the result
-        for pcode in payment_code_set:
-            if self.normalize_procedure_code(pcode) in matching_normalized_codes:
-                matched_codes.append(pcode)
-        
-        # Calculate match percentage based on unique codes
-        total_unique_codes = len(normalized_payment_codes.union(normalized_db_codes))
-        match_count = len(matching_normalized_codes)
+        matching_normalized_codes = normalized_payment_codes & normalized_db_codes
+        matched_codes = [
+            pcode for pcode, pcode_norm in normalized_by_payment_code.items()
+            if pcode_norm in matching_normalized_codes
+        ]
         
-        match_percentage = match_count / len(normalized_payment_codes) if normalized_payment_codes else 0.0
+        # Calculate match percentage based on unique payment codes
+        match_percentage = len(matching_normalized_codes) / len(normalized_payment_codes)
         
         return {
             'match_percentage': match_percentage,
@@ -354,7 +1042,7 @@ class ClaimMatcher:
         query_name_clean = query_name.strip().lower()
         
         # Split the query name into parts (handle spaces, hyphens, apostrophes)
-        name_parts = re.split(r'[-\s\']+', query_name_clean)
+        name_parts = _LN_SPLIT_RE.split(query_name_clean)
         name_parts = [part for part in name_parts if part]  # Remove empty strings
         
         if not name_parts:
@@ -424,47 +1112,123 @@ class ClaimMatcher:
         log_prefix: str = ""
     ) -> int:
         """Enhanced name matching with nickname support"""
-        
-        if not criteria_patient_fn_query:
-            logger.warning(LOG_WARNING.format(f"{log_prefix} Name score: 0 (criteria_patient_fn_query missing or empty)"))
-            return 0
+        return self._score_normalized_names(
+            _norm_name(claim_patient_fn), _norm_name(claim_patient_ln),
+            _norm_name(criteria_patient_fn_query), _norm_name(criteria_patient_ln_query),
+            log_prefix
+        )
+
+    def _score_normalized_names(
+        self,
+        claim_fn_clean: str,
+        claim_ln_clean: str,
+        crit_fn_q: str,
+        crit_ln_q: str,
+        log_prefix: str = ""
+    ) -> int:
+        """Name score for already stripped/lowercased names"""
+        return self._score_name_fast(claim_fn_clean, claim_ln_clean, self._get_name_query(crit_fn_q, crit_ln_q), log_prefix)
+
+    def _get_name_query(self, crit_fn_q: str, crit_ln_q: str) -> _NameQuery:
+        """Builds (or returns the cached) criteria-side name data for normalized criteria names"""
+        cache_key = (crit_fn_q, crit_ln_q)
+        name_query = self._name_query_cache.get(cache_key)
+        if name_query is None:
+            fn_token_variations = tuple(
+                self.nickname_mapper.get_name_variations(token)
+                for token in crit_fn_q.translate(_NAME_TOKEN_TRANS).split()
+            )
+            name_query = _NameQuery(
+                fn=crit_fn_q,
+                ln=crit_ln_q,
+                fn_variations=self.nickname_mapper.get_name_variations(crit_fn_q) if crit_fn_q else frozenset(),
+                fn_token_variations=fn_token_variations,
+                fn_pattern=self._build_regex_for_name_with_nicknames(crit_fn_q) if crit_fn_q else '',
+                ln_pattern=_last_name_pattern(crit_ln_q) if crit_ln_q else ''
+            )
+            self._name_query_cache[cache_key] = name_query
+        return name_query
+
+    def _score_name_fast(
+        self,
+        claim_fn_clean: str,
+        claim_ln_clean: str,
+        name_query: _NameQuery,
+        log_prefix: str = ""
+    ) -> int:
+        """Name score against a prebuilt criteria name query (memoized per search)"""
+        log_info = logger.isEnabledFor(logging.INFO)
+        cache_key = (claim_fn_clean, claim_ln_clean, name_query.fn, name_query.ln)
+        cached_score = self._name_score_cache.get(cache_key)
+        if cached_score is not None:
+            if log_info:
+                logger.info(LOG_INFO.format(f"{log_prefix} Final Name Score: {cached_score}/30 (cached)"))
+            return cached_score
+
+        score = self._compute_name_match_score(claim_fn_clean, claim_ln_clean, name_query, log_prefix)
+        self._name_score_cache[cache_key] = score
+        return score
+
+    def _score_name_batch(self, name_pairs, name_query: _NameQuery, log_prefix: str = "") -> Dict[tuple, int]:
+        """Scores each distinct normalized (first, last) claim name once against name_query"""
+        return {
+            pair: self._score_name_fast(pair[0], pair[1], name_query, log_prefix)
+            for pair in dict.fromkeys(name_pairs)
+        }
 
-        crit_fn_q = criteria_patient_fn_query.strip().lower()
-        crit_ln_q = criteria_patient_ln_query.strip().lower() if criteria_patient_ln_query else ""
+    def _compute_name_match_score(
+        self,
+        claim_fn_clean: str,
+        claim_ln_clean: str,
+        name_query: _NameQuery,
+        log_prefix: str = ""
+    ) -> int:
+        """Uncached name score. Claim names must already be normalized via _norm_name."""
+        log_info = logger.isEnabledFor(logging.INFO)  # Skip building per-candidate messages when INFO is off
+        crit_fn_q = name_query.fn
+        crit_ln_q = name_query.ln
 
         if not crit_fn_q:
-            logger.warning(LOG_WARNING.format(f"{log_prefix} Name score: 0 (crit_fn_q empty post-strip)"))
+            logger.warning(LOG_WARNING.format(f"{log_prefix} Name score: 0 (criteria first name missing or empty)"))
             return 0
 
-        claim_fn_clean = claim_patient_fn.strip().lower() if claim_patient_fn else ""
-        claim_ln_clean = claim_patient_ln.strip().lower() if claim_patient_ln else ""
-
         if not claim_fn_clean:
-            logger.info(LOG_INFO.format(f"{log_prefix} Name score: 0 (Claim has no first name ('{claim_fn_clean}') to match criteria '{crit_fn_q}')"))
+            if log_info:
+                logger.info(LOG_INFO.format(f"{log_prefix} Name score: 0 (Claim has no first name ('{claim_fn_clean}') to match criteria '{crit_fn_q}')"))
             return 0
 
         # First name matching with nickname support
         fn_score_component = 0
         
         # Try direct nickname relationship first (faster)
-        if self.nickname_mapper.are_names_related(crit_fn_q, claim_fn_clean):
+        if not name_query.fn_variations.isdisjoint(self.nickname_mapper.get_name_variations(claim_fn_clean)):
             fn_score_component = 15
-            logger.info(LOG_INFO.format(
-                f"{log_prefix}   FN match: YES via nickname relationship ('{claim_fn_clean}' ~ '{crit_fn_q}'). FN Score: 15"
-            ))
+            if log_info:
+                logger.info(LOG_INFO.format(
+                    f"{log_prefix}   FN match: YES via nickname relationship ('{claim_fn_clean}' ~ '{crit_fn_q}'). FN Score: 15"
+                ))
+        elif _token_match_pct(claim_fn_clean, name_query.fn_token_variations) >= 50:
+            # Token set match covers multi-part names without building a regex
+            fn_score_component = 15
+            if log_info:
+                logger.info(LOG_INFO.format(
+                    f"{log_prefix}   FN match: YES via name tokens ('{claim_fn_clean}' ~ '{crit_fn_q}'). FN Score: 15"
+                ))
         else:
-            # Fall back to regex matching with nickname variations
+            # Fall back to regex matching with nickname variations (substring/typo cases)
             try:
-                fn_regex_pattern = self._build_regex_for_name_with_nicknames(crit_fn_q)
+                fn_regex_pattern = name_query.fn_pattern
                 if self._get_compiled_regex(fn_regex_pattern).search(claim_fn_clean):
                     fn_score_component = 15
-                    logger.info(LOG_INFO.format(
-                        f"{log_prefix}   FN match: YES ('{claim_fn_clean}' vs nickname-aware regex for '{crit_fn_q}'). FN Score: 15"
-                    ))
+                    if log_info:
+                        logger.info(LOG_INFO.format(
+                            f"{log_prefix}   FN match: YES ('{claim_fn_clean}' vs nickname-aware regex for '{crit_fn_q}'). FN Score: 15"
+                        ))
                 else:
-                    logger.info(LOG_INFO.format(
-                        f"{log_prefix}   FN match: NO ('{claim_fn_clean}' vs nickname-aware regex for '{crit_fn_q}'). FN Score: 0. Total Name Score: 0"
-                    ))
+                    if log_info:
+                        logger.info(LOG_INFO.format(
+                            f"{log_prefix}   FN match: NO ('{claim_fn_clean}' vs nickname-aware regex for '{crit_fn_q}'). FN Score: 0. Total Name Score: 0"
+                        ))
                     return 0 # First name must match
             except re.error as e:
                 logger.error(LOG_ERROR.format(f"{log_prefix} Regex error during FN scoring: {e}. Query FN: '{crit_fn_q}'. Pattern: '{fn_regex_pattern if 'fn_regex_pattern' in locals() else 'N/A'}'. Returning 0."))
@@ -474,36 +1238,20 @@ class ClaimMatcher:
         ln_score_component = 0
         if crit_ln_q:
             if not claim_ln_clean:
-                logger.info(LOG_INFO.format(f"{log_prefix}   LN match: Claim has no LN to match criteria LN '{crit_ln_q}'. LN Score: 0"))
+                if log_info:
+                    logger.info(LOG_INFO.format(f"{log_prefix}   LN match: Claim has no LN to match criteria LN '{crit_ln_q}'. LN Score: 0"))
             else:
                 try:
-                    # Attempt 1: Match full criteria LN against claim LN
-                    full_ln_regex_pattern = ClaimMatcher._build_regex_for_name_part(crit_ln_q)
-                    if self._get_compiled_regex(full_ln_regex_pattern).search(claim_ln_clean):
+                    # Full criteria LN or any of its parts, as one regex and one search
+                    ln_regex_pattern = name_query.ln_pattern
+                    if self._get_compiled_regex(ln_regex_pattern).search(claim_ln_clean):
                         ln_score_component = 15
-                        logger.info(LOG_INFO.format(f"{log_prefix}   LN full match: YES ('{claim_ln_clean}' vs regex for full '{crit_ln_q}'). LN Score: 15"))
+                        if log_info:
+                            logger.info(LOG_INFO.format(f"{log_prefix}   LN match: YES ('{claim_ln_clean}' vs regex for full/parts of '{crit_ln_q}'). LN Score: 15"))
                     else:
-                        logger.info(LOG_INFO.format(f"{log_prefix}   LN full match: NO ('{claim_ln_clean}' vs regex for full '{crit_ln_q}'). Trying parts if applicable."))
+                        if log_info:
+                            logger.info(LOG_INFO.format(f"{log_prefix}   LN match: NO ('{claim_ln_clean}' vs regex for full/parts of '{crit_ln_q}'). Trying similarity."))
 
-                        # Attempt 2: If full LN didn't match AND criteria LN has multiple parts
-                        if ln_score_component < 15: # Check if not already a perfect match
-                            crit_ln_parts = re.split(r'[\s\'\-]+', crit_ln_q) # Escaped hyphen and apostrophe for regex split
-                            crit_ln_parts = [part for part in crit_ln_parts if part] 
-                            
-                            if len(crit_ln_parts) > 1:
-                                logger.info(LOG_INFO.format(f"{log_prefix}     Criteria LN '{crit_ln_q}' has multiple parts: {crit_ln_parts}. Attempting match with each part against claim LN '{claim_ln_clean}'."))
-                                for part in crit_ln_parts:
-                                    if not part: continue 
-                                    part_ln_regex_pattern = ClaimMatcher._build_regex_for_name_part(part)
-                                    if self._get_compiled_regex(part_ln_regex_pattern).search(claim_ln_clean):
-                                        ln_score_component = 15 
-                                        logger.info(LOG_INFO.format(f"{log_prefix}       LN partial match: SUCCESS. Claim LN '{claim_ln_clean}' matched criteria part '{part}' (from '{crit_ln_q}'). LN Score set to 15."))
-                                        break 
-                                    else:
-                                        logger.info(LOG_INFO.format(f"{log_prefix}       LN partial match: FAIL. Claim LN '{claim_ln_clean}' did not match criteria part '{part}' (pattern: '{part_ln_regex_pattern}')."))
-                                if ln_score_component < 15: 
-                                    logger.info(LOG_INFO.format(f"{log_prefix}     LN partial match: All parts of criteria LN '{crit_ln_q}' failed to match claim LN '{claim_ln_clean}'. LN Score remains {ln_score_component}"))
-                        
                         # ENHANCED: Use comprehensive similarity analysis
                         if ln_score_component == 0:
                             # Use enhanced similarity calculation that handles OCR errors, truncation, etc.
@@ -511,22 +1259,27 @@ class ClaimMatcher:
                             
                             if similarity_result['score'] > 0:
                                 ln_score_component = similarity_result['score']
-                                logger.info(LOG_INFO.format(f"{log_prefix}     LN Enhanced match: '{claim_ln_clean}' vs '{crit_ln_q}' → {similarity_result['match_type']} ({similarity_result['similarity']*100:.1f}% similarity). Awarding LN Score: {ln_score_component}"))
+                                if log_info:
+                                    logger.info(LOG_INFO.format(f"{log_prefix}     LN Enhanced match: '{claim_ln_clean}' vs '{crit_ln_q}' → {similarity_result['match_type']} ({similarity_result['similarity']*100:.1f}% similarity). Awarding LN Score: {ln_score_component}"))
                             else:
-                                logger.info(LOG_INFO.format(f"{log_prefix}     LN Enhanced match: No sufficient similarity found between '{claim_ln_clean}' and '{crit_ln_q}' ({similarity_result['match_type']})."))
+                                if log_info:
+                                    logger.info(LOG_INFO.format(f"{log_prefix}     LN Enhanced match: No sufficient similarity found between '{claim_ln_clean}' and '{crit_ln_q}' ({similarity_result['match_type']})."))
                 except re.error as e:
-                    logger.error(LOG_ERROR.format(f"{log_prefix} Regex error during LN scoring: {e}. Query LN: '{crit_ln_q}'. Pattern: '{full_ln_regex_pattern if 'full_ln_regex_pattern' in locals() else (part_ln_regex_pattern if 'part_ln_regex_pattern' in locals() else 'N/A')}'. LN Score set to 0."))
+                    logger.error(LOG_ERROR.format(f"{log_prefix} Regex error during LN scoring: {e}. Query LN: '{crit_ln_q}'. Pattern: '{ln_regex_pattern if 'ln_regex_pattern' in locals() else 'N/A'}'. LN Score set to 0."))
                     ln_score_component = 0
             
             if ln_score_component == 0 and claim_ln_clean : 
-                 logger.info(LOG_INFO.format(f"{log_prefix}   LN match: FINAL. Claim LN '{claim_ln_clean}' did not match criteria '{crit_ln_q}' (full or parts). LN Score: 0"))
+                 if log_info:
+                     logger.info(LOG_INFO.format(f"{log_prefix}   LN match: FINAL. Claim LN '{claim_ln_clean}' did not match criteria '{crit_ln_q}' (full or parts). LN Score: 0"))
         else:  # No criteria last name provided
             if fn_score_component == 15: 
                 ln_score_component = 15 
-                logger.info(LOG_INFO.format(f"{log_prefix}   LN: No criteria LN provided. FN matched, so awarding 15 for LN component."))
+                if log_info:
+                    logger.info(LOG_INFO.format(f"{log_prefix}   LN: No criteria LN provided. FN matched, so awarding 15 for LN component."))
 
         total_score = fn_score_component + ln_score_component
-        logger.info(LOG_INFO.format(f"{log_prefix} Final Name Score: {total_score}/30 (FN: {fn_score_component}, LN: {ln_score_component})"))
+        if log_info:
+            logger.info(LOG_INFO.format(f"{log_prefix} Final Name Score: {total_score}/30 (FN: {fn_score_component}, LN: {ln_score_component})"))
         return total_score
 
     def _score_api_claim_candidate(
@@ -545,21 +1298,28 @@ class ClaimMatcher:
         - Procedures: >75% match (30 points)
         Returns tuple of (total score, alternate_benefit_used_flag, override_type), or (0, False, '') if critical mismatches.
         """
+        log_info = logger.isEnabledFor(logging.INFO)  # Skip building per-candidate messages when INFO is off
+        # Bound once per call; these format every per-candidate log line
+        info_fmt = LOG_INFO.format
+        success_fmt = LOG_SUCCESS.format
+        warning_fmt = LOG_WARNING.format
         current_score = 0
         used_alternate_benefit = False
         override_type = ''
         # print(f"{log_prefix} Scoring API ClaimNum: {api_claim_data.get('ClaimNum')}")
-        logger.info(LOG_INFO.format(f"{log_prefix} Scoring API ClaimNum: {api_claim_data.get('ClaimNum')}"))
+        if log_info:
+            logger.info(info_fmt(f"{log_prefix} Scoring API ClaimNum: {api_claim_data.get('ClaimNum')}"))
 
         # 1. Date Match (Exact Match Required)
         try:
-            claim_date_obj = datetime.strptime(api_claim_data.get('DateService', ''), '%Y-%m-%d').date()
-            target_date_obj = datetime.strptime(criteria.date_of_service, '%Y-%m-%d').date()
+            claim_date_obj = _parse_iso_date(api_claim_data.get('DateService', ''))
+            target_date_obj = _parse_iso_date(criteria.date_of_service)
             if claim_date_obj == target_date_obj:
                 # current_score += 30 # Points awarded later if all checks pass
-                logger.info(LOG_INFO.format(f"{log_prefix}  Date: PASS (Match: {claim_date_obj})"))
+                if log_info:
+                    logger.info(info_fmt(f"{log_prefix}  Date: PASS (Match: {claim_date_obj})"))
             else:
-                logger.warning(LOG_WARNING.format(f"{log_prefix}  Date: FAIL (Mismatch: Claim {claim_date_obj} vs Target {target_date_obj}). Critical mismatch, returning 0."))
+                logger.warning(warning_fmt(f"{log_prefix}  Date: FAIL (Mismatch: Claim {claim_date_obj} vs Target {target_date_obj}). Critical mismatch, returning 0."))
                 return 0, False, '' # Critical mismatch
         except ValueError:
                 logger.error(LOG_ERROR.format(f"{log_prefix}  Date: FAIL (Invalid date format for claim {api_claim_data.get('ClaimNum')} or criteria). Critical mismatch, returning 0."))
@@ -569,9 +1329,10 @@ class ClaimMatcher:
         claim_status = api_claim_data.get('ClaimStatus')
         if claim_status in ['S', 'H']:
             # current_score += 10 # Points awarded later
-            logger.info(LOG_INFO.format(f"{log_prefix}  Status: PASS (Status: {claim_status})"))
+            if log_info:
+                logger.info(info_fmt(f"{log_prefix}  Status: PASS (Status: {claim_status})"))
         else:
-            logger.warning(LOG_WARNING.format(f"{log_prefix}  Status: FAIL (Status: {claim_status} not S or H). Critical mismatch, returning 0."))
+            logger.warning(warning_fmt(f"{log_prefix}  Status: FAIL (Status: {claim_status} not S or H). Critical mismatch, returning 0."))
             return 0, False, '' # Critical mismatch
 
         # 3. Name Match (Must be >65%, i.e., score >= 20 out of 30)
@@ -581,49 +1342,62 @@ class ClaimMatcher:
 
         claim_owner_fn = claim_owner_patient_details.get('FName')
         claim_owner_ln = claim_owner_patient_details.get('LName')
-
-        name_score = self._calculate_name_match_score_with_nicknames(
-            claim_patient_fn=claim_owner_fn,
-            claim_patient_ln=claim_owner_ln,
-            criteria_patient_fn_query=crit_patient_fn_full, # Pass full name
-            criteria_patient_ln_query=crit_patient_ln_full, # Pass full name
+        claim_owner_fn_norm = _norm_name(claim_owner_fn)
+        claim_owner_ln_norm = _norm_name(claim_owner_ln)
+
+        name_score = self._score_normalized_names(
+            claim_owner_fn_norm,
+            claim_owner_ln_norm,
+            criteria.patient_first_name_norm, # Full name
+            criteria.patient_last_name_norm,  # Full name
             log_prefix=f"{log_prefix}    "
         )
         
         # FALLBACK: If initial name matching fails, try swapping first and last name
+        if name_score < 20 and not (
+            claim_owner_fn_norm
+            and _name_swap_can_match(criteria.patient_first_name_norm, criteria.patient_last_name_norm)
+        ):
+            logger.warning(warning_fmt(f"{log_prefix}  Name: FAIL (Score: {name_score}/30). Name swap cannot match, returning 0."))
+            return 0, False, ''
         if name_score < 20:
-            logger.info(LOG_INFO.format(f"{log_prefix}  Name: FAIL (Score: {name_score}/30). Attempting name swap fallback..."))
+            if log_info:
+                logger.info(info_fmt(f"{log_prefix}  Name: FAIL (Score: {name_score}/30). Attempting name swap fallback..."))
             
             # Try swapping the criteria names (patient's first and last name)
             swapped_criteria_fn = crit_patient_ln_full
             swapped_criteria_ln = crit_patient_fn_full
             
-            swapped_name_score = self._calculate_name_match_score_with_nicknames(
-                claim_patient_fn=claim_owner_fn,
-                claim_patient_ln=claim_owner_ln,
-                criteria_patient_fn_query=swapped_criteria_fn,  # Swapped: last name as first
-                criteria_patient_ln_query=swapped_criteria_ln,  # Swapped: first name as last
+            swapped_name_score = self._score_normalized_names(
+                claim_owner_fn_norm,
+                claim_owner_ln_norm,
+                criteria.patient_last_name_norm,   # Swapped: last name as first
+                criteria.patient_first_name_norm,  # Swapped: first name as last
                 log_prefix=f"{log_prefix}    [NameSwap] " # Indent for sub-logging with swap indicator
             )
             
             if swapped_name_score >= 20:
                 name_score = swapped_name_score
-                logger.info(LOG_SUCCESS.format(f"{log_prefix}  Name: PASS via SWAP (Score: {name_score}/30). Original: '{crit_patient_fn_full} {crit_patient_ln_full}' -> Swapped: '{swapped_criteria_fn} {swapped_criteria_ln}'"))
+                if log_info:
+                    logger.info(success_fmt(f"{log_prefix}  Name: PASS via SWAP (Score: {name_score}/30). Original: '{crit_patient_fn_full} {crit_patient_ln_full}' -> Swapped: '{swapped_criteria_fn} {swapped_criteria_ln}'"))
             else:
-                logger.warning(LOG_WARNING.format(f"{log_prefix}  Name: FAIL via SWAP (Score: {swapped_name_score}/30). Both original and swapped attempts failed. Critical mismatch, returning 0."))
+                logger.warning(warning_fmt(f"{log_prefix}  Name: FAIL via SWAP (Score: {swapped_name_score}/30). Both original and swapped attempts failed. Critical mismatch, returning 0."))
                 return 0, False, ''
         else:
-            logger.info(LOG_INFO.format(f"{log_prefix}  Name: PASS (Score: {name_score}/30. Claim Owner: '{claim_owner_fn} {claim_owner_ln}' vs Criteria: '{crit_patient_fn_full} {crit_patient_ln_full}')"))
+            if log_info:
+                logger.info(info_fmt(f"{log_prefix}  Name: PASS (Score: {name_score}/30. Claim Owner: '{claim_owner_fn} {claim_owner_ln}' vs Criteria: '{crit_patient_fn_full} {crit_patient_ln_full}')"))
 
 
         # 4. Procedure Match (Must be >75%)
         procedure_match_percentage = 0.0
-        if criteria.payment_info and criteria.payment_info.procedures and claim_procedures_from_api:
-            payment_proc_codes_normalized = [p.proc_code for p in criteria.payment_info.procedures] # Already normalized
+        payment_info = criteria.payment_info
+        eob_procedures = payment_info.procedures if payment_info else None
+        if eob_procedures and claim_procedures_from_api:
+            payment_proc_codes_normalized = [p.proc_code for p in eob_procedures] # Already normalized
             
-            api_claim_proc_codes_normalized = [
-                self.normalize_procedure_code(proc.get('CodeSent', '')) for proc in claim_procedures_from_api
-            ]
+            api_claim_proc_codes_normalized = list(map(
+                _normalize_proc_code, (proc.get('CodeSent', '') for proc in claim_procedures_from_api)
+            ))
             
             if not payment_proc_codes_normalized and not api_claim_proc_codes_normalized: # Both empty
                 procedure_match_percentage = 1.0 # Perfect match if no procs expected and no procs found
@@ -640,50 +1414,54 @@ class ClaimMatcher:
                  # Given "100% confidence" goal, treating as mismatch.
                 procedure_match_percentage = 0.0
             else: # Both have procedures
-                proc_match_details = self._match_procedure_codes(payment_proc_codes_normalized, api_claim_proc_codes_normalized)
-                procedure_match_percentage = proc_match_details.get('match_percentage', 0.0)
+                # Fraction of the EOB's distinct codes (a blank code included) present on the claim
+                procedure_match_percentage = _proc_code_match_pct(
+                    payment_info.normalized_proc_codes_with_blanks, api_claim_proc_codes_normalized
+                )
             
             if procedure_match_percentage > 0.49:
                 # current_score += 30 # Points awarded later
-                logger.info(LOG_INFO.format(f"{log_prefix}  Procedures: PASS (Match %: {procedure_match_percentage*100:.2f}% > 49%. EOB Procs Cnt: {len(payment_proc_codes_normalized)}, Claim Procs Cnt: {len(api_claim_proc_codes_normalized)})"))
+                if log_info:
+                    logger.info(info_fmt(f"{log_prefix}  Procedures: PASS (Match %: {procedure_match_percentage*100:.2f}% > 49%. EOB Procs Cnt: {len(payment_proc_codes_normalized)}, Claim Procs Cnt: {len(api_claim_proc_codes_normalized)})"))
             else:
                 # Check for alternate benefit override if procedure codes don't match
-                payment_total = sum(p.amount_paid for p in criteria.payment_info.procedures) if criteria.payment_info and criteria.payment_info.procedures else 0.0
-                claim_fee_value = float(api_claim_data.get('ClaimFee', 0))
-                
                 if self._has_strong_non_procedure_match_with_fees(
                     claim_date_obj=claim_date_obj,
                     target_date_obj=target_date_obj,
                     name_score=name_score,
                     claim_procedures=claim_procedures_from_api,  # API procedures with FeeBilled
-                    eob_procedures=criteria.payment_info.procedures,  # EOB procedures with submitted_amt
+                    eob_procedures=eob_procedures,  # EOB procedures with submitted_amt
+                    eob_fees_sorted=payment_info.sorted_submitted_fees,
                     log_prefix=f"{log_prefix}    [AlternateBenefit] "
                 ):
                     used_alternate_benefit = True
                     override_type = 'fee_match'
-                    logger.info(LOG_INFO.format(f"{log_prefix}  Procedures: ALTERNATE BENEFIT OVERRIDE (Enhanced fee matching overrides {procedure_match_percentage*100:.2f}% proc match)"))
+                    if log_info:
+                        logger.info(info_fmt(f"{log_prefix}  Procedures: ALTERNATE BENEFIT OVERRIDE (Enhanced fee matching overrides {procedure_match_percentage*100:.2f}% proc match, EOB paid total ${payment_info.total_paid:.2f})"))
                 elif self._has_procedure_count_match(
                     claim_date_obj=claim_date_obj,
                     target_date_obj=target_date_obj,
                     name_score=name_score,
                     claim_procedures=claim_procedures_from_api,  # API procedures
-                    eob_procedures=criteria.payment_info.procedures,  # EOB procedures
+                    eob_procedures=eob_procedures,  # EOB procedures
                     log_prefix=f"{log_prefix}    [CountMatch] "
                 ):
                     used_alternate_benefit = True
                     override_type = 'count_match'
-                    logger.info(LOG_INFO.format(f"{log_prefix}  Procedures: COUNT MATCH OVERRIDE (Procedure count matching overrides {procedure_match_percentage*100:.2f}% proc match)"))
+                    if log_info:
+                        logger.info(info_fmt(f"{log_prefix}  Procedures: COUNT MATCH OVERRIDE (Procedure count matching overrides {procedure_match_percentage*100:.2f}% proc match)"))
                 else:
-                    logger.warning(LOG_WARNING.format(f"{log_prefix}  Procedures: FAIL (Match %: {procedure_match_percentage*100:.2f}% <= 49%. EOB Procs Cnt: {len(payment_proc_codes_normalized)}, Claim Procs Cnt: {len(api_claim_proc_codes_normalized)}). Critical mismatch, returning 0."))
+                    logger.warning(warning_fmt(f"{log_prefix}  Procedures: FAIL (Match %: {procedure_match_percentage*100:.2f}% <= 49%. EOB Procs Cnt: {len(payment_proc_codes_normalized)}, Claim Procs Cnt: {len(api_claim_proc_codes_normalized)}). Critical mismatch, returning 0."))
                     return 0, False, ''
-        elif not (criteria.payment_info and criteria.payment_info.procedures) and not claim_procedures_from_api: # No procedures on EOB criteria and no procedures on API claim
+        elif not eob_procedures and not claim_procedures_from_api: # No procedures on EOB criteria and no procedures on API claim
             # current_score += 30 # Perfect proc score
-            logger.info(LOG_INFO.format(f"{log_prefix}  Procedures: PASS (No procedures on EOB criteria and no procedures on API claim)"))
-        elif not (criteria.payment_info and criteria.payment_info.procedures) and claim_procedures_from_api: # No procedures on EOB criteria, but API claim has them
-            logger.warning(LOG_WARNING.format(f"{log_prefix}  Procedures: FAIL (No EOB procs, but API claim has {len(claim_procedures_from_api)} procs). Critical mismatch, returning 0."))
+            if log_info:
+                logger.info(info_fmt(f"{log_prefix}  Procedures: PASS (No procedures on EOB criteria and no procedures on API claim)"))
+        elif not eob_procedures and claim_procedures_from_api: # No procedures on EOB criteria, but API claim has them
+            logger.warning(warning_fmt(f"{log_prefix}  Procedures: FAIL (No EOB procs, but API claim has {len(claim_procedures_from_api)} procs). Critical mismatch, returning 0."))
             return 0, False, ''
-        elif (criteria.payment_info and criteria.payment_info.procedures) and not claim_procedures_from_api: # Procedures on EOB criteria, but API claim has none
-            logger.warning(LOG_WARNING.format(f"{log_prefix}  Procedures: FAIL (EOB has {len(criteria.payment_info.procedures)} procs, but API claim has no procs). Critical mismatch, returning 0."))
+        elif eob_procedures and not claim_procedures_from_api: # Procedures on EOB criteria, but API claim has none
+            logger.warning(warning_fmt(f"{log_prefix}  Procedures: FAIL (EOB has {len(eob_procedures)} procs, but API claim has no procs). Critical mismatch, returning 0."))
             return 0, False, ''
         # else: one has procs, other doesn't - already handled by procedure_match_percentage calculation if both had lists (one empty)
 
@@ -691,35 +1469,96 @@ class ClaimMatcher:
         # Date: 30, Status: 10, Procedures: 30. Name: variable (name_score)
         current_score = 30 + 10 + name_score + 30
         
-        logger.info(LOG_SUCCESS.format(f"{log_prefix}  ALL CHECKS PASSED. FINAL SCORE for ClaimNum {api_claim_data.get('ClaimNum')}: {current_score}"))
+        if log_info:
+            logger.info(success_fmt(f"{log_prefix}  ALL CHECKS PASSED. FINAL SCORE for ClaimNum {api_claim_data.get('ClaimNum')}: {current_score}"))
         return current_score, used_alternate_benefit, override_type
 
-    def _check_secondary_insurance(self, claim: Dict) -> bool:
+    def _fetch_pat_plans(self, claim: Dict) -> Any:
+        """
+        The /patplans response _check_secondary_insurance needs for claim, the exception the
+        lookup raised, or None when the claim lists no secondary plan or has no PatNum.
+        Logs nothing, so lookups for several claims can run on a thread pool.
+        """
+        if not (int(claim.get('InsSubNum2', 0)) > 0 or int(claim.get('PlanNum2', 0)) > 0) or not claim.get('PatNum'):
+            return None
+        try:
+            return self._get(f"patplans?PatNum={claim.get('PatNum')}")
+        except Exception as patplan_err:
+            return patplan_err
+
+    def _check_secondary_insurance(self, claim: Dict, pat_plans: Any) -> bool:
+        """Whether claim has a secondary plan, confirmed against its _fetch_pat_plans result."""
         has_secondary_plan_initial = int(claim.get('InsSubNum2', 0)) > 0 or int(claim.get('PlanNum2', 0)) > 0
         has_secondary_plan = has_secondary_plan_initial
         
         if has_secondary_plan_initial:
             pat_num = claim.get('PatNum')
             if pat_num:
-                try:
-                    print(f"    Double checking plans for PatNum={pat_num} via /patplans")
-                    pat_plans = self.make_request(f"patplans?PatNum={pat_num}")
-                    if isinstance(pat_plans, list):
-                        print(f"    /patplans response: {len(pat_plans)} plan(s) found")
-                        if len(pat_plans) <= 1:
-                            print(f"    Overriding has_secondary_plan to False based on /patplans check.")
-                            has_secondary_plan = False
-                        else:
-                            print(f"    Confirmed multiple plans via /patplans.")
+                logger.info(LOG_INFO.format(f"    Double checking plans for PatNum={pat_num} via /patplans"))
+                if isinstance(pat_plans, Exception):
+                    logger.warning(LOG_WARNING.format(f"    Error calling /patplans endpoint: {pat_plans}"))
+                elif isinstance(pat_plans, list):
+                    logger.info(LOG_INFO.format(f"    /patplans response: {len(pat_plans)} plan(s) found"))
+                    if len(pat_plans) <= 1:
+                        logger.info(LOG_INFO.format(f"    Overriding has_secondary_plan to False based on /patplans check."))
+                        has_secondary_plan = False
                     else:
-                        print(f"    Warning: Unexpected response format from /patplans: {type(pat_plans)}")
-                except Exception as patplan_err:
-                    print(f"    Warning: Error calling /patplans endpoint: {patplan_err}")
+                        logger.info(LOG_INFO.format(f"    Confirmed multiple plans via /patplans."))
+                else:
+                    logger.warning(LOG_WARNING.format(f"    Unexpected response format from /patplans: {type(pat_plans)}"))
             else:
-                print(f"    Warning: PatNum not found in claim data, cannot double check /patplans.")
+                logger.warning(LOG_WARNING.format(f"    PatNum not found in claim data, cannot double check /patplans."))
         
         return has_secondary_plan
 
+    @staticmethod
+    def _build_api_claim_match(
+        api_claim: Dict[str, Any],
+        claim_procs: List[Dict[str, Any]],
+        *,
+        pat_num: Any,
+        claim_fee: Any,
+        has_secondary_plan: bool,
+        match_score: Optional[int],
+        match_source: str,
+        is_supplemental: bool,
+        carrier_name: Optional[str],
+        claim_status: Optional[str]
+    ) -> ClaimMatch:
+        """
+        ClaimMatch for an Open Dental API claim. Fields read straight off the claim (dates, note,
+        ClaimType, IsOrtho and ortho details) are filled in here; the strict and supplemental
+        paths pass the ones they derive differently.
+        """
+        is_ortho = _is_ortho_flag(api_claim.get('IsOrtho'))
+        ortho_details = {}
+        if is_ortho:
+            ortho_details = {
+                "ortho_remain_m": api_claim.get('OrthoRemainM', 0),
+                "ortho_date": api_claim.get('OrthoDate', '0001-01-01'),
+                "ortho_total_m": api_claim.get('OrthoTotalM', 0)
+            }
+        return ClaimMatch(
+            claim_num=api_claim['ClaimNum'],
+            pat_num=pat_num,
+            claim_fee=claim_fee,
+            date_of_service=api_claim['DateService'],
+            date_sent=api_claim.get('DateSent'),  # Added DateSent field
+            date_received=api_claim.get('DateReceived'),  # Added DateReceived field
+            claim_note=api_claim.get('ClaimNote', ''),
+            is_secondary=api_claim.get('ClaimType') == 'S',
+            has_secondary_plan=has_secondary_plan,
+            has_pending_secondary=False,
+            match_score=match_score,
+            match_source=match_source,
+            claim_procs=claim_procs,
+            isOrtho=is_ortho,
+            ortho_details=ortho_details,
+            is_supplemental=is_supplemental,
+            carrier_name=carrier_name,
+            claim_status=claim_status
+        )
+
     def _get_entity_data(self, last_name: str, first_name: str, entity_type: str = "patient") -> Dict[str, Any]:
         try:
             is_patient = entity_type.lower() == "patient"
@@ -734,19 +1573,18 @@ class ClaimMatcher:
             
             # Attempt 1: Query with the full last name and first name
             logger.info(LOG_INFO.format(f"  [{entity_label} API Query via ClaimMatcher] Initial attempt: LName='{last_name}', FName='{first_name}', PatStatus='Patient'"))
-            initial_entities = self.make_request(f"patients/Simple?LName={last_name}&FName={first_name}&PatStatus=Patient")
+            initial_entities = self._get(f"patients/Simple?LName={last_name}&FName={first_name}&PatStatus=Patient")
             
             # Attempt 2: If no results and last_name has multiple parts, try each part
             if not initial_entities and first_name:
                 # Split last name by common delimiters (space, hyphen, apostrophe)
-                last_name_parts = re.split(r'[\s\'\-]+', last_name)
-                last_name_parts = [part for part in last_name_parts if part and len(part) > 1] # Use parts with more than 1 char
+                last_name_parts = _split_ln_parts(last_name) # Use parts with more than 1 char
 
                 if len(last_name_parts) > 1: # Only if there are multiple valid parts
                     logger.info(LOG_INFO.format(f"  [{entity_label} API Query via ClaimMatcher] Initial attempt failed for full LName '{last_name}'. Trying parts: {last_name_parts}"))
                     for part_ln in last_name_parts:
                         logger.info(LOG_INFO.format(f"    Attempting with LName part: '{part_ln}', FName: '{first_name}'"))
-                        entities_from_part = self.make_request(f"patients/Simple?LName={part_ln}&FName={first_name}&PatStatus=Patient")
+                        entities_from_part = self._get(f"patients/Simple?LName={part_ln}&FName={first_name}&PatStatus=Patient")
                         if entities_from_part: # If any part yields a result with the first name
                             logger.info(LOG_INFO.format(f"      SUCCESS: Found {len(entities_from_part)} {entity_label}(s) using LName part '{part_ln}'. Using these results."))
                             initial_entities = entities_from_part
@@ -759,7 +1597,7 @@ class ClaimMatcher:
             # Attempt 3: If still no entities, try last name only search (existing fallback)
             if not entities_to_process and first_name: # first_name check ensures we have something to filter by later
                 logger.info(LOG_INFO.format(f"  [{entity_label} API Query via ClaimMatcher] No exact or partial LName match with FName found. Trying full last name '{last_name}' only search."))
-                all_last_name_entities = self.make_request(f"patients/Simple?LName={last_name}&PatStatus=Patient")
+                all_last_name_entities = self._get(f"patients/Simple?LName={last_name}&PatStatus=Patient")
                 
                 if all_last_name_entities:
                     logger.info(LOG_INFO.format(f"  [{entity_label} API Query via ClaimMatcher] Found {len(all_last_name_entities)} {entity_label}(s) with full last name '{last_name}'. Filtering by FName '{first_name}'."))
@@ -779,19 +1617,17 @@ class ClaimMatcher:
                         elif first_name_lower.startswith(entity_first_name):
                             score = 0.8
                         else: # Fallback to Levenshtein for more distant matches if necessary
-                            distance = ClaimMatcher.levenshtein_distance(entity_first_name, first_name_lower)
-                            max_len = max(len(entity_first_name), len(first_name_lower))
-                            if max_len > 0:
-                                similarity = 1.0 - (distance / max_len)
-                                if similarity >= 0.6: # Threshold for considering a Levenshtein match
-                                    score = similarity * 0.7 # Weight Levenshtein matches lower than direct/prefix
+                            similarity = _levenshtein_similarity(entity_first_name, first_name_lower)
+                            if similarity >= 0.6: # Threshold for considering a Levenshtein match
+                                score = similarity * 0.7 # Weight Levenshtein matches lower than direct/prefix
                         
                         if score > 0.75: # Stricter threshold for selecting from last-name-only list
                             best_matches.append({"entity": entity_candidate, "score": score})
                             logger.info(LOG_INFO.format(f"    Potential FName match: '{entity_candidate.get('FName')}' vs '{first_name}' (Score: {score:.2f})"))
                     
                     if best_matches:
-                        best_matches = sorted(best_matches, key=lambda x: x["score"], reverse=True)
+                        # Only the top two are compared; nlargest is a stable partial sort
+                        best_matches = heapq.nlargest(2, best_matches, key=itemgetter("score"))
                         # Select the top match if its score is high enough and significantly better than the next
                         if best_matches[0]["score"] >= 0.70: # High confidence in this filtered match
                             if len(best_matches) == 1 or best_matches[0]["score"] > best_matches[1]["score"] + 0.1: # Reasonably unambiguous
@@ -810,13 +1646,12 @@ class ClaimMatcher:
             # and the original last_name had multiple parts, try the *last* part of the original last_name as a final attempt.
             # This handles cases like "Navarro Cedillo" where "Cedillo" might be the primary stored LN.
             if not entities_to_process and first_name:
-                original_last_name_parts = re.split(r'[\s\'\-]+', last_name) # original last_name from input
-                original_last_name_parts = [part for part in original_last_name_parts if part and len(part) > 1]
+                original_last_name_parts = _split_ln_parts(last_name) # original last_name from input
                 if len(original_last_name_parts) > 1:
                     last_part_of_original_ln = original_last_name_parts[-1]
                     if last_part_of_original_ln.lower() not in [p.lower() for p in last_name_parts]: # Ensure we haven't tried this exact part
                         logger.info(LOG_INFO.format(f"  [{entity_label} API Query via ClaimMatcher] Final attempt: Using last part of original LName '{last_part_of_original_ln}' with FName '{first_name}'."))
-                        entities_from_last_part = self.make_request(f"patients/Simple?LName={last_part_of_original_ln}&FName={first_name}&PatStatus=Patient")
+                        entities_from_last_part = self._get(f"patients/Simple?LName={last_part_of_original_ln}&FName={first_name}&PatStatus=Patient")
                         if entities_from_last_part:
                             logger.info(LOG_INFO.format(f"    SUCCESS: Found {len(entities_from_last_part)} {entity_label}(s) using last LName part '{last_part_of_original_ln}'. Using these results."))
                             entities_to_process = entities_from_last_part
@@ -833,7 +1668,7 @@ class ClaimMatcher:
 
             if is_patient:
                 logger.info(LOG_INFO.format(f"  [{entity_label} API Query via ClaimMatcher] Querying claims for PatNum={entity['PatNum']}"))
-                claims = self.make_request(f"claims?PatNum={entity['PatNum']}")
+                claims = self._get(f"claims?PatNum={entity['PatNum']}")
                 logger.info(LOG_INFO.format(f"  [{entity_label} API Query via ClaimMatcher] RESULT: Found {len(claims)} claims"))
                 
                 return {
@@ -842,7 +1677,7 @@ class ClaimMatcher:
                 }
             else: # subscriber
                 logger.info(LOG_INFO.format(f"  [{entity_label} API Query via ClaimMatcher] Querying subscriptions for Subscriber={entity['PatNum']}"))
-                inssubs = self.make_request(f"inssubs?Subscriber={entity['PatNum']}")
+                inssubs = self._get(f"inssubs?Subscriber={entity['PatNum']}")
                 logger.info(LOG_INFO.format(f"  [{entity_label} API Query via ClaimMatcher] RESULT: Found {len(inssubs)} insurance subscriptions"))
                 
                 if not inssubs:
@@ -851,10 +1686,11 @@ class ClaimMatcher:
                         'inssubs': None
                     }
                 
+                today = datetime.now().date()
                 active_inssub = next(
                     (sub for sub in inssubs 
                     if sub['DateTerm'] == "0001-01-01"
-                    or datetime.strptime(sub['DateTerm'], '%Y-%m-%d').date() > datetime.now().date()),
+                    or _parse_iso_date(sub['DateTerm']) > today),
                     inssubs[0] if inssubs else None
                 )
                 
@@ -872,8 +1708,43 @@ class ClaimMatcher:
             logger.error(LOG_ERROR.format(f"  [{entity_label} API Query via ClaimMatcher] ERROR: {str(e)}"))
             return {}
 
+    def _ensure_claims_date_index(self, db_claims: List[Dict[str, Any]]) -> _ClaimsDateIndex:
+        """
+        Returns the date-of-service index for db_claims, building it once and keeping it on the
+        matcher so later searches over the same cached claims reuse it. Claims without a parseable
+        date are left out and counted in undated_count. The index is rebuilt whenever db_claims no
+        longer holds the same claim dicts in the same order; callers must not mutate the claim
+        dicts themselves after the first search.
+        """
+        if self._claims_date_index is not None and self._claims_date_index.covers(db_claims):
+            return self._claims_date_index
+
+        claims_by_date: Dict[str, List[Dict[str, Any]]] = {}
+        undated_count = 0
+        date_keys = _CACHED_CLAIM_KEY_ALIASES['date_of_service']
+        for claim in db_claims:
+            claim_date_str = _pick(claim, date_keys)
+            if not claim_date_str:
+                undated_count += 1
+                continue
+            # Keyed by the canonical form, so '2024-1-5' joins '2024-01-05'; impossible dates such
+            # as '2024-13-45' count as missing data, not as a date mismatch
+            try:
+                claim_date_str = _parse_iso_date(claim_date_str).isoformat()
+            except ValueError:
+                undated_count += 1
+                continue
+            claims_by_date.setdefault(claim_date_str, []).append(claim)
+
+        self._claims_date_index = _ClaimsDateIndex(
+            claims=tuple(db_claims), by_date=claims_by_date, undated_count=undated_count
+        )
+        return self._claims_date_index
+
     def filter_cached_claims(self, criteria: SearchCriteria, claims_data: Dict[str, Any]) -> list[ClaimMatch]:
         log_prefix = f"[DB Match via ClaimMatcher: {criteria.patient_first_name or 'N/A'} {criteria.patient_last_name or 'N/A'} (Sub: {criteria.subscriber_first_name or 'N/A'} {criteria.subscriber_last_name or 'N/A'})]"
+        self._name_score_cache.clear()
+        self._name_query_cache.clear()
         
         logger.info("") # Newline
         logger.info(LOG_SECTION_START.format("DB MATCHING PROCESS - STRICT THRESHOLDS"))
@@ -891,7 +1762,7 @@ class ClaimMatcher:
         potential_matches = []
         target_date_obj: Optional[date] = None
         try:
-            target_date_obj = datetime.strptime(criteria.date_of_service, '%Y-%m-%d').date()
+            target_date_obj = _parse_iso_date(criteria.date_of_service)
         except ValueError:
             logger.error(LOG_ERROR.format(f"Invalid date format in search criteria: {criteria.date_of_service}. Cannot perform DB search."))
             logger.info(LOG_SECTION_END.format("DB MATCHING PROCESS - STRICT THRESHOLDS COMPLETED"))
@@ -906,12 +1777,16 @@ class ClaimMatcher:
            criteria.patient_last_name and criteria.patient_last_name.strip():
             criteria_name_fn_to_use = criteria.patient_first_name
             criteria_name_ln_to_use = criteria.patient_last_name
+            criteria_name_fn_norm = criteria.patient_first_name_norm
+            criteria_name_ln_norm = criteria.patient_last_name_norm
             criteria_name_source_for_log = "Patient"
             logger.info(LOG_INFO.format(f"{log_prefix} Using {criteria_name_source_for_log} Name from criteria for cache matching: '{criteria_name_fn_to_use} {criteria_name_ln_to_use}'"))
         elif criteria.subscriber_first_name and criteria.subscriber_first_name.strip() and \
              criteria.subscriber_last_name and criteria.subscriber_last_name.strip():
             criteria_name_fn_to_use = criteria.subscriber_first_name
             criteria_name_ln_to_use = criteria.subscriber_last_name
+            criteria_name_fn_norm = criteria.subscriber_first_name_norm
+            criteria_name_ln_norm = criteria.subscriber_last_name_norm
             criteria_name_source_for_log = "Subscriber (as Patient)"
             logger.info(LOG_INFO.format(f"{log_prefix} Criteria Patient Name missing/empty. Using {criteria_name_source_for_log} Name from criteria for cache matching against cached Patient Name: '{criteria_name_fn_to_use} {criteria_name_ln_to_use}'"))
         else:
@@ -922,289 +1797,76 @@ class ClaimMatcher:
         logger.info(LOG_INFO.format(f"Evaluating {len(db_claims)} claims from database cache using strict thresholds (matching against criteria's {criteria_name_source_for_log} Name)."))
 
         # Normalize EOB procedure codes once
-        payment_proc_codes_normalized = [self.normalize_procedure_code(p.proc_code) for p in criteria.payment_info.procedures if p.proc_code]
+        payment_proc_codes_normalized = [_normalize_proc_code(p.proc_code) for p in criteria.payment_info.procedures if p.proc_code]
         
         logger.info(LOG_INFO.format(f"EOB Procedure Codes (Normalized): {payment_proc_codes_normalized}"))
         # logger.info(LOG_INFO.format(f"Search Criteria - Patient: '{crit_patient_fn_full} {crit_patient_ln_full}'")) # Original line, crit_patient_fn_full not defined here anymore
         # Updated log line to show which criteria name is being used:
         logger.info(LOG_INFO.format(f"Name matching in cache will use Criteria {criteria_name_source_for_log} Name: '{criteria_name_fn_to_use} {criteria_name_ln_to_use}'"))
 
-        claims_evaluated = 0
-        date_skips = 0
+        # Criteria-side name data is built once here rather than per cached claim
+        name_query = self._get_name_query(criteria_name_fn_norm, criteria_name_ln_norm)
+        swapped_name_query = self._get_name_query(criteria_name_ln_norm, criteria_name_fn_norm)
+        swap_possible = _name_swap_can_match(criteria_name_fn_norm, criteria_name_ln_norm)
+        subscriber_name_query = self._get_name_query(criteria.subscriber_first_name_norm, criteria.subscriber_last_name_norm)
+
+        # Only claims on the target date are visited; the rest are counted from the date index
+        claims_date_index = self._ensure_claims_date_index(db_claims)
+        target_date_key = target_date_obj.isoformat()
+        same_day_claims = claims_date_index.by_date.get(target_date_key, [])
+        columns_by_date = claims_date_index.columns_by_date
+        same_day_columns = columns_by_date.get(target_date_key)
+        if same_day_columns is None:
+            same_day_columns = columns_by_date[target_date_key] = _CachedClaimColumns.from_claims(same_day_claims)
+        undated_claims = claims_date_index.undated_count
+
+        claims_evaluated = len(db_claims)
+        date_skips = len(db_claims) - len(same_day_claims) - undated_claims
         status_skips = 0
         name_skips = 0
         procedure_skips = 0
-        missing_data_skips = 0
-        
-        for claim in db_claims:
-            claims_evaluated += 1
-            claim_num_for_log = claim.get('claim_num') or claim.get('ClaimNum', 'UnknownDBClaimNum')
-            current_log_prefix = f"{log_prefix} [CacheClaim#{claim_num_for_log}]"
-
-            # 1. DATE SCORING (Exact Match Required)
-            claim_date_str = claim.get('date_of_service') or claim.get('claim_date') or claim.get('DateService')
-            if not claim_date_str:
-                missing_data_skips += 1
-                continue
-            try:
-                claim_date_obj = datetime.strptime(claim_date_str, '%Y-%m-%d').date()
-                if claim_date_obj != target_date_obj:
-                    date_skips += 1
-                    continue
-                logger.info(LOG_INFO.format(f"{current_log_prefix} Date: PASS (Exact Match: {claim_date_obj})"))
-            except ValueError:
-                missing_data_skips += 1
-                continue
-
-            # 2. STATUS SCORING (Exact Match 'S' or 'H' Required, or 'R' with matching Secondary)
-            # Note: Cached claims might not always have 'ClaimStatus' in the same way API claims do.
-            # We'll check for 'claim_status' or 'ClaimStatus'. Adjust if your cache uses different keys.
-            claim_status = claim.get('claim_status') or claim.get('ClaimStatus')
-            
-            if claim_status in ['S', 'H']:
-                logger.info(LOG_INFO.format(f"{current_log_prefix} Status: PASS (Status: {claim_status})"))
-            elif claim_status == 'R':
-                # For 'R' status, only allow Primary claims (not secondary)
-                is_secondary = claim.get('is_secondary', claim.get('IsSecondary', False))
-                if isinstance(is_secondary, str):
-                    is_secondary = is_secondary.lower() == 'true'
-                
-                if not is_secondary:  # Primary claim
-                    logger.info(LOG_INFO.format(f"{current_log_prefix} Status: PASS (Status: R, Primary claim - is_secondary={is_secondary})"))
-                else:
-                    # Secondary claim with 'R' status - skip
-                    logger.info(LOG_INFO.format(f"{current_log_prefix} Status: FAIL (Status: R but is a Secondary claim)"))
-                    status_skips += 1
-                    continue
-            else:
-                status_skips += 1
-                continue
-
-            # 3. NAME SCORING (Must be >65%, i.e., score >= 20 out of 30)
-            # Cached claim patient names might be under keys like 'patient_first_name', 'pat_fn', etc.
-            patient_fn_raw = claim.get('patient_first_name') or claim.get('pat_fn')
-            patient_ln_raw = claim.get('patient_last_name') or claim.get('pat_ln')
-
-            if not patient_fn_raw or not patient_ln_raw: # Both first and last name must be present in cache
-                missing_data_skips += 1
-                continue
-
-            # Initial name matching attempt
-            name_score = self._calculate_name_match_score_with_nicknames(
-                claim_patient_fn=patient_fn_raw,          # This is from the cache claim (e.g., pat_fn)
-                claim_patient_ln=patient_ln_raw,          # This is from the cache claim (e.g., pat_ln) - CORRECTED
-                criteria_patient_fn_query=criteria_name_fn_to_use, # Name from criteria (either patient or subscriber)
-                criteria_patient_ln_query=criteria_name_ln_to_use, # Name from criteria (either patient or subscriber)
-                log_prefix=f"{current_log_prefix}    " # Indent for sub-logging
+        missing_data_skips = undated_claims
+        
+        # Score every distinct cached patient name that can reach the name check in one pass;
+        # claims of the same patient on this date then share a single name computation.
+        eligible_name_pairs = [
+            (fn, ln)
+            for status, is_secondary, fn, ln in zip(
+                same_day_columns.statuses, same_day_columns.is_secondary,
+                same_day_columns.patient_fns, same_day_columns.patient_lns
             )
-            
-            # FALLBACK: If initial name matching fails, try swapping first and last name
-            if name_score < 20:
-                logger.info(LOG_INFO.format(f"{current_log_prefix} Name: FAIL (Score: {name_score}/30). Attempting name swap fallback..."))
-                
-                # Try swapping the criteria names (patient's first and last name)
-                swapped_criteria_fn = criteria_name_ln_to_use
-                swapped_criteria_ln = criteria_name_fn_to_use
-                
-                swapped_name_score = self._calculate_name_match_score_with_nicknames(
-                    claim_patient_fn=patient_fn_raw,
-                    claim_patient_ln=patient_ln_raw,
-                    criteria_patient_fn_query=swapped_criteria_fn,  # Swapped: last name as first
-                    criteria_patient_ln_query=swapped_criteria_ln,  # Swapped: first name as last
-                    log_prefix=f"{current_log_prefix}    [NameSwap] " # Indent for sub-logging with swap indicator
-                )
-                
-                if swapped_name_score >= 20:
-                    name_score = swapped_name_score
-                    logger.info(LOG_SUCCESS.format(f"{current_log_prefix} Name: PASS via SWAP (Score: {name_score}/30). Original: '{criteria_name_fn_to_use} {criteria_name_ln_to_use}' -> Swapped: '{swapped_criteria_fn} {swapped_criteria_ln}'"))
-                else:
-                    logger.info(LOG_INFO.format(f"{current_log_prefix} Name: FAIL via SWAP (Score: {swapped_name_score}/30). Both original and swapped attempts failed."))
-                    name_skips += 1
-                    continue
-            else:
-                logger.info(LOG_INFO.format(f"{current_log_prefix} Name: PASS (Score: {name_score}/30)"))
-
-
-            # 4. PROCEDURE SCORING (Must be >75%)
-            db_claim_proc_codes_normalized = []
-            # Cached procedures might be under 'procedures', 'claim_procs', etc.
-            # And procedure codes themselves under 'proc_code', 'code', 'CodeSent'
-            cached_procs_list = claim.get('procedures', claim.get('claim_procs', []))
-            for proc_item in cached_procs_list:
-                code = proc_item.get('proc_code') or proc_item.get('code') or proc_item.get('CodeSent')
-                if code:
-                    db_claim_proc_codes_normalized.append(self.normalize_procedure_code(code))
-
-            procedure_match_percentage = 0.0
-            alternate_benefit_override = False
-            
-            if not payment_proc_codes_normalized and not db_claim_proc_codes_normalized: # Both empty
-                procedure_match_percentage = 1.0
-            elif payment_proc_codes_normalized and not db_claim_proc_codes_normalized:
-                procedure_match_percentage = 0.0
-            elif not payment_proc_codes_normalized and db_claim_proc_codes_normalized:
-                procedure_match_percentage = 0.0 # EOB has no procs, but cache claim does
-            else: # Both have procedures
-                proc_match_details = self._match_procedure_codes(payment_proc_codes_normalized, db_claim_proc_codes_normalized)
-                procedure_match_percentage = proc_match_details.get('match_percentage', 0.0)
-
-            # Check for alternate benefit override if procedure codes don't match
-            if procedure_match_percentage <= 0.49:
-                # Check if this could be an alternate benefit scenario using enhanced fee-based matching
-                if self._has_strong_non_procedure_match_with_fees(
-                    claim_date_obj=claim_date_obj,
-                    target_date_obj=target_date_obj,
-                    name_score=name_score,
-                    claim_procedures=cached_procs_list,  # Database procedures with fee_billed
-                    eob_procedures=criteria.payment_info.procedures,  # EOB procedures with submitted_amt
-                    log_prefix=f"{current_log_prefix}    [AlternateBenefit] "
-                ):
-                    alternate_benefit_override = True
-                    logger.info(LOG_INFO.format(f"{current_log_prefix} Procedures: ALTERNATE BENEFIT OVERRIDE (Enhanced fee matching overrides {procedure_match_percentage*100:.2f}% proc match)"))
-                elif self._has_procedure_count_match(
-                    claim_date_obj=claim_date_obj,
-                    target_date_obj=target_date_obj,
-                    name_score=name_score,
-                    claim_procedures=cached_procs_list,  # Database procedures
-                    eob_procedures=criteria.payment_info.procedures,  # EOB procedures
-                    log_prefix=f"{current_log_prefix}    [CountMatch] "
-                ):
-                    alternate_benefit_override = True
-                    logger.info(LOG_INFO.format(f"{current_log_prefix} Procedures: COUNT MATCH OVERRIDE (Procedure count matching overrides {procedure_match_percentage*100:.2f}% proc match)"))
-                else:
-                    procedure_skips += 1
-                    continue
-            else:
-                logger.info(LOG_INFO.format(f"{current_log_prefix} Procedures: PASS (Match %: {procedure_match_percentage*100:.2f}% > 49%)"))
-
-            # ALL CHECKS PASSED - This is a confident match (based on primary name match)
-            logger.info(LOG_SUCCESS.format(f"{current_log_prefix} ALL PRIMARY CHECKS PASSED. Calculating score and checking subscriber if applicable."))
-            
-            subscriber_bonus_points = 0
-            if criteria.subscriber_first_name and criteria.subscriber_first_name.strip() and \
-               criteria.subscriber_last_name and criteria.subscriber_last_name.strip():
-                
-                cached_claim_sub_fn = claim.get('subscriber_first_name') 
-                cached_claim_sub_ln = claim.get('subscriber_last_name')
-
-                if cached_claim_sub_fn and cached_claim_sub_fn.strip() and \
-                   cached_claim_sub_ln and cached_claim_sub_ln.strip():
-                    
-                    sub_name_score_value = self._calculate_name_match_score_with_nicknames(
-                        claim_patient_fn=cached_claim_sub_fn.strip(), # from cached claim's subscriber fields
-                        claim_patient_ln=cached_claim_sub_ln.strip(), # from cached claim's subscriber fields
-                        criteria_patient_fn_query=criteria.subscriber_first_name, # from criteria's subscriber fields
-                        criteria_patient_ln_query=criteria.subscriber_last_name,  # from criteria's subscriber fields
-                        log_prefix=f"{current_log_prefix}    [SubMatch] "
-                    )
-                    
-                    if sub_name_score_value == 30: # Perfect subscriber F+L match
-                        subscriber_bonus_points = 15
-                        logger.info(LOG_INFO.format(f"{current_log_prefix}    Subscriber Name: FULL MATCH. Bonus: +{subscriber_bonus_points}"))
-                    elif sub_name_score_value >= 15: # Partial subscriber F or L match (score includes at least one full name part)
-                        subscriber_bonus_points = 8 
-                        logger.info(LOG_INFO.format(f"{current_log_prefix}    Subscriber Name: PARTIAL MATCH (Score {sub_name_score_value}). Bonus: +{subscriber_bonus_points}"))
-                    else:
-                        logger.info(LOG_INFO.format(f"{current_log_prefix}    Subscriber Name: NO MATCH (Score {sub_name_score_value}). No bonus."))
-                else:
-                    logger.info(LOG_INFO.format(f"{current_log_prefix}    Subscriber Name: Cached claim missing subscriber name details. No bonus check."))
-            else:
-                logger.info(LOG_INFO.format(f"{current_log_prefix}    Subscriber Name: Criteria missing subscriber name details. No bonus check."))
-
-            # Construct claim_procs for the ClaimMatch object, ensuring correct structure
-            # This part needs to be robust to how procedures are stored in your cache.
-            # Assuming cached procs are similar to API procs or need transformation.
-            claim_procs_for_match_obj = []
-            for proc_data in cached_procs_list: # Use the same list as for code extraction
-                code_sent = proc_data.get('proc_code') or proc_data.get('code') or proc_data.get('CodeSent')
-                if not code_sent: continue # Skip procs without codes
-
-                claim_proc_num_val = proc_data.get('claim_proc_num') or proc_data.get('ClaimProcNum')
-                try:
-                    claim_proc_num_int = int(claim_proc_num_val) if claim_proc_num_val is not None else 0
-                except (ValueError, TypeError):
-                    claim_proc_num_int = 0
-                
-                claim_procs_for_match_obj.append({
-                    "CodeSent": self.normalize_procedure_code(code_sent),
-                    "FeeBilled": float(proc_data.get('fee_billed') or proc_data.get('FeeBilled') or 0),
-                    "ClaimProcNum": claim_proc_num_int,
-                    "WriteOff": float(proc_data.get('writeoff') or proc_data.get('WriteOff') or 0),
-                    # Add other fields if they exist in your cache and are needed for ClaimMatch
-                    "InsPayAmt": float(proc_data.get('ins_pay_amt') or proc_data.get('InsPayAmt') or 0),
-                    "DedApplied": float(proc_data.get('ded_applied') or proc_data.get('DedApplied') or 0),
-                    "Status": proc_data.get('status') or proc_data.get('status_val') or proc_data.get('Status'), # MongoDB uses 'status'
-                    "DateInsFinalized": proc_data.get('date_ins_finalized', proc_data.get('DateInsFinalized', proc_data.get('DateSuppReceived', ''))),
-                    "ToothNum": proc_data.get('tooth_num') or proc_data.get('ToothNum') or '', # MongoDB uses 'tooth_num'
-                    "Remarks": proc_data.get('remarks') or proc_data.get('Remarks') or '', # MongoDB uses 'remarks'
-                    # Add new UCR fields from cached claims
-                    "matchesUCR": proc_data.get('matchesUCR', False),
-                    "ucr_amount": float(proc_data.get('ucr_amount') or 0)
-                })
-            
-            # name_score here is the primary_name_score (patient name vs chosen criteria name)
-            final_calculated_score = 30 + 10 + name_score + 30 + subscriber_bonus_points 
-
-            # Ortho details from cached claim
-            is_ortho_cached = claim.get('IsOrtho', claim.get('isOrtho'))
-            is_ortho_bool = False
-            if isinstance(is_ortho_cached, str):
-                is_ortho_bool = is_ortho_cached.lower() == 'true'
-            elif isinstance(is_ortho_cached, bool):
-                is_ortho_bool = is_ortho_cached
-            
-            ortho_details_data = {}
-            if is_ortho_bool: # If IsOrtho is true, try to get details
-                ortho_details_data = claim.get('ortho_details', { # Check if details are pre-packed
-                    "ortho_remain_m": claim.get('OrthoRemainM', claim.get('ortho_remain_m', 0)),
-                    "ortho_date": claim.get('OrthoDate', claim.get('ortho_date', '0001-01-01')),
-                    "ortho_total_m": claim.get('OrthoTotalM', claim.get('ortho_total_m', 0))
-                })
+            if (status in ('S', 'H') or (status == 'R' and not is_secondary)) and fn is not None and ln is not None
+        ]
+        primary_name_scores = self._score_name_batch(eligible_name_pairs, name_query, log_prefix=f"{log_prefix} [NameBatch]    ")
+
+        scan_context = _CachedClaimScanContext(
+            criteria=criteria,
+            target_date_obj=target_date_obj,
+            columns=same_day_columns,
+            primary_name_scores=primary_name_scores,
+            swapped_name_query=swapped_name_query,
+            subscriber_name_query=subscriber_name_query,
+            swap_possible=swap_possible,
+            criteria_name_fn=criteria_name_fn_to_use,
+            criteria_name_ln=criteria_name_ln_to_use,
+            payment_proc_codes_normalized=payment_proc_codes_normalized,
+            eob_procedures=criteria.payment_info.procedures,
+            eob_proc_codes=criteria.payment_info.normalized_proc_codes,
+            eob_fees_sorted=criteria.payment_info.sorted_submitted_fees,
+            check_subscriber=bool(criteria.subscriber_first_name_norm and criteria.subscriber_last_name_norm),
+            log_prefix=log_prefix,
+            log_info=logger.isEnabledFor(logging.INFO)  # Per-claim messages are only built when INFO is on
+        )
+        # Scored serially: the checks are pure Python and hold the GIL, so a thread pool measured
+        # slower (400 same-day claims: 5.9 ms serial, 10.4 ms pooled)
+        evaluations = [self._evaluate_cached_claim(i, scan_context) for i in range(len(same_day_columns.claims))]
 
-            # Determine match source based on how the match was found
-            match_source = 'database_strict'
-            if alternate_benefit_override:
-                # Check which type of override was used - this is a bit hacky but works
-                # We could store the override type in a variable, but this is simpler
-                if procedure_match_percentage <= 0.49:
-                    # If we got here with alternate_benefit_override=True and low procedure match,
-                    # it was either fee matching or count matching. We'll check count first
-                    # since it's the simpler check.
-                    if self._has_procedure_count_match(
-                        claim_date_obj=claim_date_obj,
-                        target_date_obj=target_date_obj,
-                        name_score=name_score,
-                        claim_procedures=cached_procs_list,
-                        eob_procedures=criteria.payment_info.procedures,
-                        log_prefix=f"{current_log_prefix}    [SourceCheck] "
-                    ):
-                        match_source = 'database_count_match'
-                    else:
-                        match_source = 'database_alternate_benefit'
-                else:
-                    match_source = 'database_alternate_benefit'
-
-            match_obj = ClaimMatch(
-                claim_num=int(claim.get('claim_num') or claim.get('ClaimNum')), # Ensure int
-                pat_num=int(claim.get('pat_num') or claim.get('PatNum')),       # Ensure int
-                date_of_service=claim_date_str, # Already validated
-                date_sent=claim.get('DateSent'),  # Added DateSent field
-                date_received=claim.get('DateReceived'),  # Added DateReceived field
-                claim_fee=float(claim.get('claim_fee') or claim.get('ClaimFee') or 0),
-                claim_note=claim.get('claim_note', '') or claim.get('ClaimNote', ''),
-                is_secondary=claim.get('is_secondary', False) or (claim.get('plan_type') == 'S') or (claim.get('ClaimType') == 'S'),
-                has_secondary_plan=claim.get('has_secondary_plan', False),
-                has_pending_secondary=False, # Will be set later if primary matches alongside secondary
-                match_score=final_calculated_score, # Store the calculated score
-                match_source=match_source, # Indicate source and method
-                claim_procs=claim_procs_for_match_obj,
-                isOrtho=is_ortho_bool,
-                ortho_details=ortho_details_data,
-                is_supplemental=claim.get('is_supplemental', False), # If cache can indicate this
-                carrier_name=claim.get('carrier_name', None), # Added to pass carrier name from matched claims
-                claim_status=claim.get('claim_status', claim.get('ClaimStatus')) # Added to track claim status
-            )
-            potential_matches.append(match_obj)
+        skip_counts = collections.Counter(reason for _, reason in evaluations if reason)
+        status_skips += skip_counts['status']
+        name_skips += skip_counts['name']
+        procedure_skips += skip_counts['procedure']
+        missing_data_skips += skip_counts['missing_data']
+        potential_matches.extend(match_obj for match_obj, _ in evaluations if match_obj is not None)
 
         logger.info("") # Newline
         logger.info(LOG_SUBSECTION.format("DB STRICT THRESHOLD MATCHING STATISTICS"))
@@ -1213,13 +1875,14 @@ class ClaimMatcher:
         logger.info(LOG_INFO.format(f"Cached Claims Passing All Strict Thresholds: {len(potential_matches)}"))
 
         # Sort all found potential matches by score (highest first) - score is now more of a confidence sum
-        sorted_potential_matches = sorted(potential_matches, key=lambda m: m['match_score'], reverse=True)
+        sorted_potential_matches = sorted(potential_matches, key=itemgetter('match_score'), reverse=True)
         
         final_results = []
         if sorted_potential_matches:
             # Separate into primary and secondary based on the is_secondary flag
-            db_primary_matches = [m for m in sorted_potential_matches if not m['is_secondary']]
-            db_secondary_matches = [m for m in sorted_potential_matches if m['is_secondary']]
+            db_primary_matches, db_secondary_matches = [], []
+            for m in sorted_potential_matches:
+                (db_secondary_matches if m['is_secondary'] else db_primary_matches).append(m)
 
             if db_primary_matches:
                 if db_secondary_matches:
@@ -1238,14 +1901,303 @@ class ClaimMatcher:
             logger.info(LOG_WARNING.format("DATABASE STRICT THRESHOLD MATCHING COMPLETED. No matches found passing all criteria."))
         else:
             logger.info(LOG_SUCCESS.format(f"DATABASE STRICT THRESHOLD MATCHING COMPLETED. Found {len(final_results)} match(es) after prioritization."))
-            for i, match_item in enumerate(final_results): # Renamed 'match' to 'match_item'
-                logger.info(LOG_INFO.format(f"  Match #{i+1}: Claim #{match_item['claim_num']}, Score: {match_item['match_score']}, IsSecondary: {match_item['is_secondary']}, HasPendingSec: {match_item['has_pending_secondary']}"))
+            if scan_context.log_info:
+                for i, match_item in enumerate(final_results): # Renamed 'match' to 'match_item'
+                    logger.info(LOG_INFO.format(f"  Match #{i+1}: Claim #{match_item['claim_num']}, Score: {match_item['match_score']}, IsSecondary: {match_item['is_secondary']}, HasPendingSec: {match_item['has_pending_secondary']}"))
         
         logger.info(LOG_SECTION_END.format("DB STRICT THRESHOLD MATCHING COMPLETED"))
         logger.info("") # Newline
         
         return final_results
 
+    def _evaluate_cached_claim(self, idx: int, scan_context: '_CachedClaimScanContext') -> tuple:
+        """
+        Runs the strict date/status/name/procedure checks for one cached claim of the target date.
+        Returns (ClaimMatch, None) on a match or (None, skip_reason) where skip_reason is one of
+        'status', 'missing_data', 'name' or 'procedure'. Reads only shared, per-search state.
+        """
+        ctx = scan_context
+        columns = ctx.columns
+        log_info = ctx.log_info
+        target_date_obj = ctx.target_date_obj
+        claim = columns.claims[idx]
+        # Bound once per call; these format every per-candidate log line
+        info_fmt = LOG_INFO.format
+        success_fmt = LOG_SUCCESS.format
+        claim_num_for_log = columns.claim_nums[idx]
+        current_log_prefix = f"{ctx.log_prefix} [CacheClaim#{claim_num_for_log}]"
+
+        # 1. DATE SCORING (Exact Match Required) - guaranteed by the date index
+        claim_date_str = columns.date_strs[idx]
+        claim_date_obj = target_date_obj
+        if log_info:
+            logger.info(info_fmt(f"{current_log_prefix} Date: PASS (Exact Match: {claim_date_obj})"))
+
+        # 2. STATUS SCORING (Exact Match 'S' or 'H' Required, or 'R' with matching Secondary)
+        # Note: Cached claims might not always have 'ClaimStatus' in the same way API claims do.
+        # The column resolves 'claim_status' or 'ClaimStatus'. Adjust if your cache uses different keys.
+        claim_status = columns.statuses[idx]
+        
+        if claim_status in ['S', 'H']:
+            if log_info:
+                logger.info(info_fmt(f"{current_log_prefix} Status: PASS (Status: {claim_status})"))
+        elif claim_status == 'R':
+            # For 'R' status, only allow Primary claims (not secondary)
+            is_secondary = columns.is_secondary[idx]
+            
+            if not is_secondary:  # Primary claim
+                if log_info:
+                    logger.info(info_fmt(f"{current_log_prefix} Status: PASS (Status: R, Primary claim - is_secondary={is_secondary})"))
+            else:
+                # Secondary claim with 'R' status - skip
+                if log_info:
+                    logger.info(info_fmt(f"{current_log_prefix} Status: FAIL (Status: R but is a Secondary claim)"))
+                return None, 'status'
+        else:
+            return None, 'status'
+
+        # 3. NAME SCORING (Must be >65%, i.e., score >= 20 out of 30)
+        patient_fn_norm = columns.patient_fns[idx]
+        patient_ln_norm = columns.patient_lns[idx]
+
+        if patient_fn_norm is None or patient_ln_norm is None: # Both first and last name must be present in cache
+            return None, 'missing_data'
+
+        # Initial name matching attempt (scored up front for each distinct cached name)
+        name_score = ctx.primary_name_scores[(patient_fn_norm, patient_ln_norm)]
+
+        # 4. PROCEDURE CODE MATCH (computed before the name swap fallback; the threshold is applied after it)
+        # Procedure codes themselves may be under 'proc_code', 'code', 'CodeSent'
+        cached_procs_list = columns.procs[idx]
+        # (raw code, normalized code, proc) for every coded proc, resolved once and reused below
+        coded_procs = []
+        for proc_item in cached_procs_list:
+            code = proc_item.get('proc_code') or proc_item.get('code') or proc_item.get('CodeSent')
+            if code:
+                coded_procs.append((code, _normalize_proc_code(code), proc_item))
+        db_claim_proc_codes_normalized = [code_norm for _, code_norm, _ in coded_procs]
+
+        procedure_match_percentage = 0.0
+        override_type = None  # 'fee' or 'count' when an override lets a low code match through
+        
+        if not ctx.payment_proc_codes_normalized and not db_claim_proc_codes_normalized: # Both empty
+            procedure_match_percentage = 1.0
+        elif ctx.payment_proc_codes_normalized and not db_claim_proc_codes_normalized:
+            procedure_match_percentage = 0.0
+        elif not ctx.payment_proc_codes_normalized and db_claim_proc_codes_normalized:
+            procedure_match_percentage = 0.0 # EOB has no procs, but cache claim does
+        else: # Both have procedures
+            procedure_match_percentage = _proc_code_match_pct(
+                ctx.eob_proc_codes, db_claim_proc_codes_normalized
+            )
+
+        # A low code match can only pass through an override; when neither override is possible
+        # the claim is rejected here, before any name swap scoring
+        if procedure_match_percentage <= 0.49 and not _procedure_override_possible(
+            cached_procs_list, ctx.eob_procedures, ctx.eob_fees_sorted
+        ):
+            if log_info:
+                logger.info(info_fmt(f"{current_log_prefix} Procedures: FAIL (Match %: {procedure_match_percentage*100:.2f}%, no fee/count override possible)"))
+            # The skip statistics count the name check first, so a claim failing both is a name skip
+            if name_score < 20 and not (ctx.swap_possible and patient_fn_norm and self._score_name_fast(
+                patient_fn_norm, patient_ln_norm, ctx.swapped_name_query, log_prefix=f"{current_log_prefix}    [NameSwap] "
+            ) >= 20):
+                return None, 'name'
+            return None, 'procedure'
+
+        # FALLBACK: If initial name matching fails, try swapping first and last name
+        if name_score < 20 and not (ctx.swap_possible and patient_fn_norm):
+            if log_info:
+                logger.info(info_fmt(f"{current_log_prefix} Name: FAIL (Score: {name_score}/30). Name swap cannot match."))
+            return None, 'name'
+        if name_score < 20:
+            if log_info:
+                logger.info(info_fmt(f"{current_log_prefix} Name: FAIL (Score: {name_score}/30). Attempting name swap fallback..."))
+            
+            # Try swapping the criteria names (patient's first and last name)
+            swapped_criteria_fn = ctx.criteria_name_ln
+            swapped_criteria_ln = ctx.criteria_name_fn
+            
+            swapped_name_score = self._score_name_fast(
+                patient_fn_norm,
+                patient_ln_norm,
+                ctx.swapped_name_query,  # Swapped: last name as first, first name as last
+                log_prefix=f"{current_log_prefix}    [NameSwap] " # Indent for sub-logging with swap indicator
+            )
+            
+            if swapped_name_score >= 20:
+                name_score = swapped_name_score
+                if log_info:
+                    logger.info(success_fmt(f"{current_log_prefix} Name: PASS via SWAP (Score: {name_score}/30). Original: '{ctx.criteria_name_fn} {ctx.criteria_name_ln}' -> Swapped: '{swapped_criteria_fn} {swapped_criteria_ln}'"))
+            else:
+                if log_info:
+                    logger.info(info_fmt(f"{current_log_prefix} Name: FAIL via SWAP (Score: {swapped_name_score}/30). Both original and swapped attempts failed."))
+                return None, 'name'
+        else:
+            if log_info:
+                logger.info(info_fmt(f"{current_log_prefix} Name: PASS (Score: {name_score}/30)"))
+
+
+        # 5. PROCEDURE THRESHOLD (Must be >49%, or pass a fee/count override)
+        # Check for alternate benefit override if procedure codes don't match
+        if procedure_match_percentage <= 0.49:
+            # Check if this could be an alternate benefit scenario using enhanced fee-based matching
+            if self._has_strong_non_procedure_match_with_fees(
+                claim_date_obj=claim_date_obj,
+                target_date_obj=target_date_obj,
+                name_score=name_score,
+                claim_procedures=cached_procs_list,  # Database procedures with fee_billed
+                eob_procedures=ctx.eob_procedures,  # EOB procedures with submitted_amt
+                eob_fees_sorted=ctx.eob_fees_sorted,
+                log_prefix=f"{current_log_prefix}    [AlternateBenefit] "
+            ):
+                override_type = 'fee'
+                if log_info:
+                    logger.info(info_fmt(f"{current_log_prefix} Procedures: ALTERNATE BENEFIT OVERRIDE (Enhanced fee matching overrides {procedure_match_percentage*100:.2f}% proc match)"))
+            elif self._has_procedure_count_match(
+                claim_date_obj=claim_date_obj,
+                target_date_obj=target_date_obj,
+                name_score=name_score,
+                claim_procedures=cached_procs_list,  # Database procedures
+                eob_procedures=ctx.eob_procedures,  # EOB procedures
+                log_prefix=f"{current_log_prefix}    [CountMatch] "
+            ):
+                override_type = 'count'
+                if log_info:
+                    logger.info(info_fmt(f"{current_log_prefix} Procedures: COUNT MATCH OVERRIDE (Procedure count matching overrides {procedure_match_percentage*100:.2f}% proc match)"))
+            else:
+                return None, 'procedure'
+        else:
+            if log_info:
+                logger.info(info_fmt(f"{current_log_prefix} Procedures: PASS (Match %: {procedure_match_percentage*100:.2f}% > 49%)"))
+
+        # ALL CHECKS PASSED - This is a confident match (based on primary name match)
+        if log_info:
+            logger.info(success_fmt(f"{current_log_prefix} ALL PRIMARY CHECKS PASSED. Calculating score and checking subscriber if applicable."))
+        
+        subscriber_bonus_points = 0
+        if ctx.check_subscriber:  # Criteria subscriber F+L present
+            
+            cached_claim_sub_fn = columns.subscriber_fns[idx]
+            cached_claim_sub_ln = columns.subscriber_lns[idx]
+
+            if cached_claim_sub_fn and cached_claim_sub_ln:
+                
+                # Memoized per search on (claim sub fn, claim sub ln, criteria sub fn, criteria sub ln)
+                sub_name_score_value = self._score_name_fast(
+                    cached_claim_sub_fn, # from cached claim's subscriber fields
+                    cached_claim_sub_ln, # from cached claim's subscriber fields
+                    ctx.subscriber_name_query,           # from criteria's subscriber fields
+                    log_prefix=f"{current_log_prefix}    [SubMatch] "
+                )
+                
+                if sub_name_score_value == 30: # Perfect subscriber F+L match
+                    subscriber_bonus_points = 15
+                    if log_info:
+                        logger.info(info_fmt(f"{current_log_prefix}    Subscriber Name: FULL MATCH. Bonus: +{subscriber_bonus_points}"))
+                elif sub_name_score_value >= 15: # Partial subscriber F or L match (score includes at least one full name part)
+                    subscriber_bonus_points = 8 
+                    if log_info:
+                        logger.info(info_fmt(f"{current_log_prefix}    Subscriber Name: PARTIAL MATCH (Score {sub_name_score_value}). Bonus: +{subscriber_bonus_points}"))
+                else:
+                    if log_info:
+                        logger.info(info_fmt(f"{current_log_prefix}    Subscriber Name: NO MATCH (Score {sub_name_score_value}). No bonus."))
+            else:
+                if log_info:
+                    logger.info(info_fmt(f"{current_log_prefix}    Subscriber Name: Cached claim missing subscriber name details. No bonus check."))
+        else:
+            if log_info:
+                logger.info(info_fmt(f"{current_log_prefix}    Subscriber Name: Criteria missing subscriber name details. No bonus check."))
+
+        # name_score here is the primary_name_score (patient name vs chosen criteria name)
+        final_calculated_score = 30 + 10 + name_score + 30 + subscriber_bonus_points 
+
+        # Ortho details from cached claim
+        is_ortho_bool = _is_ortho_flag(claim.get('IsOrtho', claim.get('isOrtho')))
+        
+        ortho_details_data = {}
+        if is_ortho_bool: # If IsOrtho is true, try to get details
+            ortho_details_data = claim.get('ortho_details', { # Check if details are pre-packed
+                "ortho_remain_m": claim.get('OrthoRemainM', claim.get('ortho_remain_m', 0)),
+                "ortho_date": claim.get('OrthoDate', claim.get('ortho_date', '0001-01-01')),
+                "ortho_total_m": claim.get('OrthoTotalM', claim.get('ortho_total_m', 0))
+            })
+
+        # Determine match source based on which override (if any) let the claim through
+        match_source = _CACHE_MATCH_SOURCE_BY_OVERRIDE.get(override_type, 'database_strict')
+
+        match_obj = ClaimMatch(
+            claim_num=int(_pick(claim, _CACHED_CLAIM_KEY_ALIASES['claim_num'])), # Ensure int
+            pat_num=int(columns.pat_nums[idx]),       # Ensure int
+            date_of_service=claim_date_str, # Already validated
+            date_sent=claim.get('DateSent'),  # Added DateSent field
+            date_received=claim.get('DateReceived'),  # Added DateReceived field
+            claim_fee=float(_pick(claim, _CACHED_CLAIM_KEY_ALIASES['claim_fee'], 0)),
+            claim_note=_pick(claim, _CACHED_CLAIM_KEY_ALIASES['claim_note'], ''),
+            is_secondary=claim.get('is_secondary', False) or (claim.get('plan_type') == 'S') or (claim.get('ClaimType') == 'S'),
+            has_secondary_plan=claim.get('has_secondary_plan', False),
+            has_pending_secondary=False, # Will be set later if primary matches alongside secondary
+            match_score=final_calculated_score, # Store the calculated score
+            match_source=match_source, # Indicate source and method
+            # Built only here, once the claim is a match; reuses the codes normalized in step 4.
+            # Procs without codes were already skipped.
+            claim_procs=[_cached_proc_for_match(code_norm, proc_data) for _, code_norm, proc_data in coded_procs],
+            isOrtho=is_ortho_bool,
+            ortho_details=ortho_details_data,
+            is_supplemental=claim.get('is_supplemental', False), # If cache can indicate this
+            carrier_name=claim.get('carrier_name', None), # Added to pass carrier name from matched claims
+            claim_status=claim.get('claim_status', claim.get('ClaimStatus')) # Added to track claim status
+        )
+        return match_obj, None
+
+    def _score_api_candidates(
+        self,
+        pending_candidates: List[tuple],
+        criteria: SearchCriteria,
+        log_prefix: str,
+        source_label: str
+    ) -> List[Dict[str, Any]]:
+        """
+        Fetches claimprocs for and scores (api_claim, owner_patient_details) pairs.
+        The claimprocs requests run on a thread pool since each one waits on an API call (their
+        starts stay spaced by the request throttle);
+        candidates are then scored in input order, so each one's log lines stay together.
+        Only candidates with score > 0 are returned.
+        """
+        if not pending_candidates:
+            return []
+
+        with ThreadPoolExecutor(max_workers=min(_API_FETCH_MAX_WORKERS, len(pending_candidates))) as executor:
+            claim_procs_by_candidate = list(executor.map(
+                lambda candidate: self._get(f"claimprocs?ClaimNum={candidate[0].get('ClaimNum')}"), pending_candidates
+            ))
+
+        scored_candidates = []
+        for (api_claim, owner_details), claim_procs_api in zip(pending_candidates, claim_procs_by_candidate):
+            claim_num = api_claim.get('ClaimNum')
+            if not isinstance(claim_procs_api, list):
+                logger.warning(LOG_WARNING.format(f"{log_prefix}     Warning: Could not fetch procedures for ClaimNum {claim_num} ({source_label} Source), or bad response. Skipping."))
+                claim_procs_api = []
+
+            score, used_alternate_benefit, override_type = self._score_api_claim_candidate(
+                api_claim_data=api_claim,
+                claim_procedures_from_api=claim_procs_api,
+                criteria=criteria,
+                claim_owner_patient_details=owner_details,
+                log_prefix=f"{log_prefix}     [ScoreCalc Claim#{claim_num}] "
+            )
+            if score > 0: # _score_api_claim_candidate returns 0 if any check fails
+                logger.info(LOG_INFO.format(f"{log_prefix}     ClaimNum {claim_num} ({source_label} Source) scored {score}. Adding as candidate."))
+                scored_candidates.append({
+                    'score': score,
+                    'api_claim_raw': api_claim,
+                    'claim_procs_raw': claim_procs_api,
+                    'source_patient_details': owner_details,
+                    'used_alternate_benefit': used_alternate_benefit,
+                    'override_type': override_type
+                })
+        return scored_candidates
+
     def find_matching_claims(self, criteria: SearchCriteria, skip_api_fallback: bool = False) -> list[ClaimMatch]:
         """
         Finds claims matching search criteria by scoring candidates from API.
@@ -1255,6 +2207,8 @@ class ClaimMatcher:
         4. Returns best match(es) after primary/secondary prioritization.
         """
         log_prefix = f"[API Matcher: {criteria.patient_first_name} {criteria.patient_last_name}]"
+        self._name_score_cache.clear()
+        self._name_query_cache.clear()
         logger.info(LOG_SECTION_START.format(f"{log_prefix} API CLAIM MATCHING PROCESS STARTED (STRICT THRESHOLDS)"))
         
         logger.info(LOG_INFO.format(f"\n{log_prefix} SEARCH CRITERIA:"))
@@ -1275,12 +2229,14 @@ class ClaimMatcher:
         logger.info(LOG_INFO.format(f"  Procedure Codes:  {[p.proc_code for p in criteria.payment_info.procedures]}"))
         
         try:
-            target_date = datetime.strptime(criteria.date_of_service, '%Y-%m-%d').date()
+            target_date = _parse_iso_date(criteria.date_of_service)
         except ValueError:
             logger.error(LOG_ERROR.format(f"{log_prefix} ERROR: Invalid Date of Service format in criteria: {criteria.date_of_service}. Aborting API matching."))
             logger.info(LOG_SECTION_END.format(f"{log_prefix} API CLAIM MATCHING PROCESS COMPLETED (STRICT THRESHOLDS)"))
             return []
 
+        target_date_key = target_date.isoformat()  # Canonical form for string compares in the pre-filters
+
         # MIN_ACCEPTABLE_SCORE: _score_api_claim_candidate now returns 0 if any check fails.
         # A successful match will have a score of at least 30(date)+10(status)+20(name_min)+30(proc) = 90.
         # Setting this to 89 to catch anything that passed all internal checks in _score_api_claim_candidate.
@@ -1309,14 +2265,16 @@ class ClaimMatcher:
 
             patient_details_for_scoring = patient_data['patient']
 
+            pending_candidates = []
+            queued_claim_nums = set()
             for api_claim in patient_data['claims']:
                 claim_num = api_claim.get('ClaimNum')
-                if not claim_num or claim_num in processed_claim_nums:
+                if not claim_num or claim_num in processed_claim_nums or claim_num in queued_claim_nums:
                     continue
                 
                 # Quick pre-filter (already in _score_api_claim_candidate, but good for early exit)
                 try:
-                    if datetime.strptime(api_claim.get('DateService', ''), '%Y-%m-%d').date() != target_date:
+                    if not _is_target_service_date(api_claim.get('DateService', ''), target_date_key, target_date):
                         continue
                     if api_claim.get('ClaimStatus') not in ['S', 'H']:
                         continue
@@ -1324,31 +2282,12 @@ class ClaimMatcher:
                     continue
 
                 logger.info(LOG_INFO.format(f"{log_prefix}     Evaluating patient claim ClaimNum: {claim_num}"))
-                claim_procs_api = self.make_request(f"claimprocs?ClaimNum={claim_num}")
-                if not isinstance(claim_procs_api, list): 
-                    logger.warning(LOG_WARNING.format(f"{log_prefix}     Warning: Could not fetch procedures for ClaimNum {claim_num}, or bad response. Skipping."))
-                    claim_procs_api = [] 
-
-                score, used_alternate_benefit, override_type = self._score_api_claim_candidate(
-                    api_claim_data=api_claim,
-                    claim_procedures_from_api=claim_procs_api,
-                    criteria=criteria,
-                    claim_owner_patient_details=patient_details_for_scoring, 
-                    log_prefix=f"{log_prefix}     [ScoreCalc Claim#{claim_num}] "
-                )
+                pending_candidates.append((api_claim, patient_details_for_scoring))
+                queued_claim_nums.add(claim_num)
 
-                if score > 0: # _score_api_claim_candidate returns 0 if any check fails
-                    logger.info(LOG_INFO.format(f"{log_prefix}     ClaimNum {claim_num} (Patient Source) scored {score}. Adding as candidate."))
-                    all_scored_candidates.append({
-                        'score': score,
-                        'api_claim_raw': api_claim, 
-                        'claim_procs_raw': claim_procs_api, 
-                        'source_patient_details': patient_details_for_scoring, 
-                        'used_alternate_benefit': used_alternate_benefit,
-                        'override_type': override_type
-                    })
-                    processed_claim_nums.add(claim_num)
-                # No explicit else for score == 0, as _score_api_claim_candidate now logs the failure reason.
+            for candidate in self._score_api_candidates(pending_candidates, criteria, log_prefix, "Patient"):
+                all_scored_candidates.append(candidate)
+                processed_claim_nums.add(candidate['api_claim_raw'].get('ClaimNum'))
         else:
             logger.info(LOG_INFO.format(f"{log_prefix}   ✗ No patient found or no claims for patient with Name='{crit_patient_first_name_full} {crit_patient_last_name_full}'."))
             
@@ -1372,17 +2311,19 @@ class ClaimMatcher:
             inssub_num = inssub.get('InsSubNum')
             logger.info(LOG_INFO.format(f"{log_prefix}   Insurance SubNum: {inssub_num}. Fetching claims by this InsSubNum."))
 
-            claims_for_sub = self.make_request(f"claims?InsSubNum={inssub_num}")
+            claims_for_sub = self._get(f"claims?InsSubNum={inssub_num}")
 
             if isinstance(claims_for_sub, list) and claims_for_sub:
                 logger.info(LOG_INFO.format(f"{log_prefix}   Found {len(claims_for_sub)} claims for InsSubNum {inssub_num}. Evaluating..."))
+                pending_candidates = []
+                queued_claim_nums = set()
                 for api_claim in claims_for_sub:
                     claim_num = api_claim.get('ClaimNum')
-                    if not claim_num or claim_num in processed_claim_nums:
+                    if not claim_num or claim_num in processed_claim_nums or claim_num in queued_claim_nums:
                         continue 
 
                     try:
-                        if datetime.strptime(api_claim.get('DateService', ''), '%Y-%m-%d').date() != target_date:
+                        if not _is_target_service_date(api_claim.get('DateService', ''), target_date_key, target_date):
                             continue
                         if api_claim.get('ClaimStatus') not in ['S', 'H']:
                             continue
@@ -1397,38 +2338,18 @@ class ClaimMatcher:
                         continue
                     
                     logger.info(LOG_INFO.format(f"{log_prefix}       Fetching patient details for PatNum {claim_pat_num} (associated with subscriber claim {claim_num})"))
-                    owner_patient_api_response = self.make_request(f"patients/{claim_pat_num}")
+                    owner_patient_api_response = self._get(f"patients/{claim_pat_num}")
 
                     if not owner_patient_api_response or not isinstance(owner_patient_api_response, dict) or not owner_patient_api_response.get("PatNum"):
                         logger.warning(LOG_WARNING.format(f"{log_prefix}       Warning: Could not fetch patient details for PatNum {claim_pat_num} of ClaimNum {claim_num}. Skipping."))
                         continue
                     
-                    claim_owner_patient_details_for_scoring = owner_patient_api_response 
-
-                    claim_procs_api = self.make_request(f"claimprocs?ClaimNum={claim_num}")
-                    if not isinstance(claim_procs_api, list):
-                        logger.warning(LOG_WARNING.format(f"{log_prefix}     Warning: Could not fetch procedures for ClaimNum {claim_num} (Subscriber Source), or bad response. Skipping."))
-                        claim_procs_api = []
-
-                    score, used_alternate_benefit, override_type = self._score_api_claim_candidate(
-                        api_claim_data=api_claim,
-                        claim_procedures_from_api=claim_procs_api,
-                        criteria=criteria,
-                        claim_owner_patient_details=claim_owner_patient_details_for_scoring,
-                        log_prefix=f"{log_prefix}     [ScoreCalc Claim#{claim_num}] "
-                    )
+                    pending_candidates.append((api_claim, owner_patient_api_response))
+                    queued_claim_nums.add(claim_num)
 
-                    if score > 0: # _score_api_claim_candidate returns 0 if any check fails
-                        logger.info(LOG_INFO.format(f"{log_prefix}     ClaimNum {claim_num} (Subscriber Source) scored {score}. Adding as candidate."))
-                        all_scored_candidates.append({
-                            'score': score,
-                            'api_claim_raw': api_claim,
-                            'claim_procs_raw': claim_procs_api,
-                            'source_patient_details': claim_owner_patient_details_for_scoring, 
-                            'used_alternate_benefit': used_alternate_benefit,
-                            'override_type': override_type
-                        })
-                        processed_claim_nums.add(claim_num)
+                for candidate in self._score_api_candidates(pending_candidates, criteria, log_prefix, "Subscriber"):
+                    all_scored_candidates.append(candidate)
+                    processed_claim_nums.add(candidate['api_claim_raw'].get('ClaimNum'))
             else:
                 logger.info(LOG_INFO.format(f"{log_prefix}   No claims found for InsSubNum {inssub_num}."))
         else:
@@ -1450,13 +2371,25 @@ class ClaimMatcher:
             return []
 
         # Sort by score descending
-        sorted_candidates = sorted(high_confidence_candidates, key=lambda x: x['score'], reverse=True)
+        sorted_candidates = sorted(high_confidence_candidates, key=itemgetter('score'), reverse=True)
         
         final_match_objects_primary: List[ClaimMatch] = []
         final_match_objects_secondary: List[ClaimMatch] = []
 
+        # /patplans lookups for all candidates run concurrently rather than one round trip at a time,
+        # with starts spaced by the shared request throttle in _get; the checks themselves (and their
+        # log lines) then run in candidate order
+        candidate_claims = [cand['api_claim_raw'] for cand in sorted_candidates]
+        with ThreadPoolExecutor(max_workers=min(_API_FETCH_MAX_WORKERS, len(sorted_candidates))) as executor:
+            pat_plans_by_candidate = list(executor.map(self._fetch_pat_plans, candidate_claims))
+        secondary_plan_flags = list(map(self._check_secondary_insurance, candidate_claims, pat_plans_by_candidate))
+
         logger.info(LOG_INFO.format(f"{log_prefix} Top {len(sorted_candidates)} high-confidence candidates by score:"))
-        for cand_dict in sorted_candidates:
+        # Loop invariants bound once; per-candidate messages are only built when INFO is on
+        log_info = logger.isEnabledFor(logging.INFO)
+        info_fmt = LOG_INFO.format
+        match_buckets = (final_match_objects_primary, final_match_objects_secondary)  # indexed by is_secondary_claim
+        for cand_dict, has_secondary_plan_flag in zip(sorted_candidates, secondary_plan_flags):
             raw_claim = cand_dict['api_claim_raw']
             raw_procs = cand_dict['claim_procs_raw']
             score = cand_dict['score']
@@ -1464,48 +2397,18 @@ class ClaimMatcher:
             used_alternate_benefit = cand_dict.get('used_alternate_benefit', False)
             override_type = cand_dict.get('override_type', '')
             
-            logger.info(LOG_INFO.format(f"{log_prefix}   - ClaimNum: {raw_claim['ClaimNum']}, Score: {score}, Date: {raw_claim['DateService']}, Status: {raw_claim['ClaimStatus']}"))
-            logger.info(LOG_INFO.format(f"{log_prefix}     Patient on Claim: {source_pat_details.get('FName')} {source_pat_details.get('LName')} (PatNum: {raw_claim['PatNum']})"))
-
-            is_secondary_claim = raw_claim.get('ClaimType') == 'S'
-            has_secondary_plan_flag = self._check_secondary_insurance(raw_claim)
-
-            is_ortho_api = raw_claim.get('IsOrtho')
-            is_ortho_bool_api = False
-            if isinstance(is_ortho_api, str):
-                is_ortho_bool_api = is_ortho_api.lower() == 'true'
-            elif isinstance(is_ortho_api, bool):
-                is_ortho_bool_api = is_ortho_api
+            raw_claim_get = raw_claim.get
             
-            ortho_details_api_data = {}
-            if is_ortho_bool_api:
-                ortho_details_api_data = {
-                    "ortho_remain_m": raw_claim.get('OrthoRemainM', 0),
-                    "ortho_date": raw_claim.get('OrthoDate', '0001-01-01'),
-                    "ortho_total_m": raw_claim.get('OrthoTotalM', 0)
-                }
+            if log_info:
+                logger.info(info_fmt(f"{log_prefix}   - ClaimNum: {raw_claim['ClaimNum']}, Score: {score}, Date: {raw_claim['DateService']}, Status: {raw_claim['ClaimStatus']}"))
+                logger.info(info_fmt(f"{log_prefix}     Patient on Claim: {source_pat_details.get('FName')} {source_pat_details.get('LName')} (PatNum: {raw_claim['PatNum']})"))
 
-            claim_procs_for_match_obj = []
-            for proc_raw in raw_procs:
-                claim_proc_num_val = proc_raw.get('ClaimProcNum')
-                try:
-                    claim_proc_num_int = int(claim_proc_num_val) if claim_proc_num_val is not None else 0
-                except (ValueError, TypeError):
-                    claim_proc_num_int = 0
-                
-                claim_procs_for_match_obj.append({
-                    "CodeSent": self.normalize_procedure_code(proc_raw.get('CodeSent')), 
-                    "FeeBilled": float(proc_raw.get('FeeBilled') or 0),
-                    "ClaimProcNum": claim_proc_num_int,
-                    "WriteOff": float(proc_raw.get('WriteOff') or 0), 
-                    "InsPayAmt": float(proc_raw.get('InsPayAmt') or 0),
-                    "DedApplied": float(proc_raw.get('DedApplied') or 0),
-                    "Status": proc_raw.get('Status'),
-                    "DateInsFinalized": proc_raw.get('DateInsFinalized', proc_raw.get('DateSuppReceived', '')),
-                    # Add new UCR fields from API calls
-                    "matchesUCR": proc_raw.get('matchesUCR', False),
-                    "ucr_amount": float(proc_raw.get('ucr_amount') or 0)
-                })
+            is_secondary_claim = raw_claim_get('ClaimType') == 'S'
+
+            claim_procs_for_match_obj = [
+                _api_proc_for_match(_normalize_proc_code(proc_raw.get('CodeSent')), proc_raw)
+                for proc_raw in raw_procs
+            ]
 
             # Determine match source based on whether alternate benefit logic was used
             match_source = 'api_strict_scored'
@@ -1517,52 +2420,32 @@ class ClaimMatcher:
                 else:
                     match_source = 'api_alternate_benefit'
 
-            match_obj = ClaimMatch(
-                claim_num=raw_claim['ClaimNum'],
+            match_obj = self._build_api_claim_match(
+                raw_claim,
+                claim_procs_for_match_obj,
                 pat_num=raw_claim['PatNum'],
-                claim_fee=float(raw_claim.get('ClaimFee') or 0),
-                date_of_service=raw_claim['DateService'],
-                date_sent=raw_claim.get('DateSent'),  # Added DateSent field
-                date_received=raw_claim.get('DateReceived'),  # Added DateReceived field
-                claim_note=raw_claim.get('ClaimNote', ''),
-                is_secondary=is_secondary_claim,
+                claim_fee=float(raw_claim_get('ClaimFee') or 0),
                 has_secondary_plan=has_secondary_plan_flag,
-                has_pending_secondary=False, 
-                match_score=score, 
+                match_score=score,
                 match_source=match_source, # Use determined source
-                claim_procs=claim_procs_for_match_obj,
-                isOrtho=is_ortho_bool_api,
-                ortho_details=ortho_details_api_data,
-                is_supplemental=False, 
-                carrier_name=raw_claim.get('carrier_name', None), # Added to pass carrier name from matched claims
-                claim_status=raw_claim.get('claim_status', raw_claim.get('ClaimStatus')) # Added to track claim status
+                is_supplemental=False,
+                carrier_name=raw_claim_get('carrier_name', None), # Added to pass carrier name from matched claims
+                claim_status=raw_claim_get('claim_status', raw_claim_get('ClaimStatus')) # Added to track claim status
             )
 
-            if is_secondary_claim :
-                final_match_objects_secondary.append(match_obj)
-            else: 
-                 final_match_objects_primary.append(match_obj)
-
-        final_results: List[ClaimMatch] = []
-        if final_match_objects_primary:
-            logger.info(LOG_INFO.format(f"{log_prefix} Found {len(final_match_objects_primary)} primary API match(es) (strict)."))
-            if final_match_objects_secondary:
-                logger.info(LOG_INFO.format(f"{log_prefix} Also found {len(final_match_objects_secondary)} secondary API match(es) (strict). Flagging primaries with 'has_pending_secondary'."))
-                for p_match in final_match_objects_primary:
-                    p_match['has_pending_secondary'] = True
-                # Return both primary and secondary claims when both are found
-                final_results = final_match_objects_primary + final_match_objects_secondary
-                logger.info(LOG_INFO.format(f"{log_prefix} Returning both primary and secondary claims ({len(final_results)} total)."))
-            else:
-                final_results = final_match_objects_primary
-        elif final_match_objects_secondary:
-            logger.info(LOG_INFO.format(f"{log_prefix} No primary API matches (strict) found. Found {len(final_match_objects_secondary)} secondary API match(es) (strict)."))
-            final_results = final_match_objects_secondary
+            match_buckets[is_secondary_claim].append(match_obj)
+
+        # Primaries first, then secondaries; when both are present the primaries are flagged
+        if final_match_objects_primary and final_match_objects_secondary:
+            for p_match in final_match_objects_primary:
+                p_match['has_pending_secondary'] = True
+        final_results: List[ClaimMatch] = final_match_objects_primary + final_match_objects_secondary
         
         if final_results:
-            logger.info(LOG_SUCCESS.format(f"{log_prefix} Returning {len(final_results)} API match(es) (Strict Scored, Primary preferred):"))
-            for i, claim_obj in enumerate(final_results):
-                 logger.info(LOG_INFO.format(f"{log_prefix}   Match #{i+1}: Claim #{claim_obj['claim_num']}, Score: {claim_obj['match_score']}, IsSecondary: {claim_obj['is_secondary']}, HasPendingSec: {claim_obj['has_pending_secondary']}"))
+            logger.info(LOG_SUCCESS.format(f"{log_prefix} Returning {len(final_results)} API match(es) ({len(final_match_objects_primary)} primary, {len(final_match_objects_secondary)} secondary; Strict Scored, Primary preferred):"))
+            if log_info:
+                for i, claim_obj in enumerate(final_results):
+                    logger.info(info_fmt(f"{log_prefix}   Match #{i+1}: Claim #{claim_obj['claim_num']}, Score: {claim_obj['match_score']}, IsSecondary: {claim_obj['is_secondary']}, HasPendingSec: {claim_obj['has_pending_secondary']}"))
         else:
             logger.warning(LOG_WARNING.format(f"{log_prefix} No API candidates met all strict criteria after scoring and prioritization."))
                 
@@ -1600,6 +2483,13 @@ class ClaimMatcher:
                 logger.warning(LOG_WARNING.format(f"{log_prefix} Insufficient patient name information (FName: '{api_fallback_patient_first_name}', LName: '{api_fallback_patient_last_name}') for API fallback. Aborting."))
                 return []
 
+            # Supplemental matches need an overlapping procedure code; without EOB codes none can
+            # match, so skip the patient and claimprocs lookups entirely
+            eob_proc_codes_normalized = criteria.payment_info.normalized_proc_codes  # frozenset, built once per payment
+            if not eob_proc_codes_normalized:
+                logger.info(LOG_INFO.format(f"{log_prefix} EOB has no procedure codes to overlap with. No supplemental matches possible."))
+                return []
+
             logger.info(LOG_INFO.format(f"{log_prefix} Calling _get_entity_data with FName='{api_fallback_patient_first_name}', LName='{api_fallback_patient_last_name}'"))
             patient_api_data = self._get_entity_data(
                 api_fallback_patient_last_name, # Full last name from criteria
@@ -1625,14 +2515,12 @@ class ClaimMatcher:
             
             logger.info(LOG_INFO.format(f"{log_prefix} Found {len(received_or_sent_api_claims)} 'Received' or 'Sent' claims. Checking for date and procedure matches..."))
 
-            target_date_obj = datetime.strptime(criteria.date_of_service, '%Y-%m-%d').date()
-            eob_proc_codes_normalized = {
-                self.normalize_procedure_code(p.proc_code) for p in criteria.payment_info.procedures if p.proc_code
-            }
+            target_date_obj = _parse_iso_date(criteria.date_of_service)
 
+            same_date_api_claims = []
             for api_claim in received_or_sent_api_claims:
                 try:
-                    api_claim_date_obj = datetime.strptime(api_claim.get('DateService', ''), '%Y-%m-%d').date()
+                    api_claim_date_obj = _parse_iso_date(api_claim.get('DateService', ''))
                     if api_claim_date_obj != target_date_obj:
                         continue # Date mismatch
                 except ValueError:
@@ -1641,54 +2529,34 @@ class ClaimMatcher:
 
                 claim_status_label = 'Received' if api_claim.get('ClaimStatus') == 'R' else 'Sent'
                 logger.info(LOG_INFO.format(f"{log_prefix} '{claim_status_label}' API Claim {api_claim.get('ClaimNum')} matches EOB date ({target_date_obj}). Fetching its procedures."))
-                
-                api_claim_procs_full = self.make_request(f"claimprocs?ClaimNum={api_claim['ClaimNum']}")
+                same_date_api_claims.append(api_claim)
+
+            claim_procs_by_claim = []
+            if same_date_api_claims:
+                # claimprocs for all same-date claims are fetched concurrently rather than one round trip
+                # at a time; _get keeps their starts spaced by the shared request throttle
+                with ThreadPoolExecutor(max_workers=min(_API_FETCH_MAX_WORKERS, len(same_date_api_claims))) as executor:
+                    claim_procs_by_claim = list(executor.map(
+                        lambda c: self._get(f"claimprocs?ClaimNum={c['ClaimNum']}"), same_date_api_claims
+                    ))
+
+            carrier_names_by_plan: Dict[tuple, str] = {}  # Found names only; a failed lookup is retried
+            for api_claim, api_claim_procs_full in zip(same_date_api_claims, claim_procs_by_claim):
                 if not api_claim_procs_full:
                     logger.info(LOG_INFO.format(f"{log_prefix} No procedures found for API claim {api_claim.get('ClaimNum')}. Skipping."))
                     continue
 
                 matched_api_procedures_for_claimmatch = []
                 for api_proc in api_claim_procs_full:
-                    normalized_api_proc_code = self.normalize_procedure_code(api_proc.get('CodeSent'))
+                    code_sent = api_proc.get('CodeSent')
+                    normalized_api_proc_code = _normalize_proc_code(code_sent)
                     if normalized_api_proc_code and normalized_api_proc_code in eob_proc_codes_normalized:
-                        claim_proc_num_val = api_proc.get('ClaimProcNum')
-                        try:
-                            claim_proc_num_int = int(claim_proc_num_val) if claim_proc_num_val is not None else 0
-                        except (ValueError, TypeError):
-                            claim_proc_num_int = 0
-                        
-                        matched_api_procedures_for_claimmatch.append({
-                            "CodeSent": api_proc.get('CodeSent'), 
-                            "FeeBilled": float(api_proc.get('FeeBilled') or 0),
-                            "ClaimProcNum": claim_proc_num_int,
-                            "WriteOff": float(api_proc.get('WriteOff') or 0), 
-                            "InsPayAmt": float(api_proc.get('InsPayAmt') or 0),
-                            "DedApplied": float(api_proc.get('DedApplied') or 0),
-                            "Status": api_proc.get('Status'),
-                            "DateInsFinalized": api_proc.get('DateInsFinalized', api_proc.get('DateSuppReceived', '')),
-                            # Add new UCR fields from API calls
-                            "matchesUCR": api_proc.get('matchesUCR', False),
-                            "ucr_amount": float(api_proc.get('ucr_amount') or 0)
-                        })
+                        # Supplemental matches keep CodeSent as Open Dental returned it
+                        matched_api_procedures_for_claimmatch.append(_api_proc_for_match(code_sent, api_proc))
                 
                 if matched_api_procedures_for_claimmatch:
                     logger.info(LOG_SUCCESS.format(f"{log_prefix} Found {len(matched_api_procedures_for_claimmatch)} overlapping procedures for API Claim {api_claim.get('ClaimNum')}. Creating supplemental match."))
                     
-                    is_ortho_api = api_claim.get('IsOrtho')
-                    is_ortho_bool_api = False
-                    if isinstance(is_ortho_api, str):
-                        is_ortho_bool_api = is_ortho_api.lower() == 'true'
-                    elif isinstance(is_ortho_api, bool):
-                        is_ortho_bool_api = is_ortho_api
-                        
-                    ortho_details_api_data = {}
-                    if is_ortho_bool_api:
-                        ortho_details_api_data = {
-                            "ortho_remain_m": api_claim.get('OrthoRemainM', 0),
-                            "ortho_date": api_claim.get('OrthoDate', '0001-01-01'),
-                            "ortho_total_m": api_claim.get('OrthoTotalM', 0)
-                        }
-
                     # Get carrier name for this claim
                     carrier_name = None
                     if hasattr(self, 'make_request') and callable(self.make_request):
@@ -1698,29 +2566,28 @@ class ClaimMatcher:
                             
                             # We need to get the OpenDentalAPI instance that owns this ClaimMatcher
                             if hasattr(self.make_request, '__self__'):
-                                api_instance = self.make_request.__self__
-                                carrier_name = api_instance.get_carrier_name_from_claim(api_claim)
+                                # The carrier follows from the plan the claim was billed to (PlanNum2 for
+                                # secondary claims), so claims on the same plan share one lookup
+                                carrier_key = (api_claim.get('ClaimType') == 'S', api_claim.get('PlanNum'), api_claim.get('PlanNum2'))
+                                carrier_name = carrier_names_by_plan.get(carrier_key)
+                                if not carrier_name:
+                                    api_instance = self.make_request.__self__
+                                    carrier_name = api_instance.get_carrier_name_from_claim(api_claim)
+                                    if carrier_name:
+                                        carrier_names_by_plan[carrier_key] = carrier_name
                                 if carrier_name:
                                     logger.info(LOG_INFO.format(f"{log_prefix} Got carrier name for supplemental claim {api_claim['ClaimNum']}: {carrier_name}"))
                         except Exception as e:
                             logger.warning(LOG_WARNING.format(f"{log_prefix} Could not get carrier name for supplemental claim {api_claim['ClaimNum']}: {e}"))
 
-                    match_obj = ClaimMatch(
-                        claim_num=api_claim['ClaimNum'],
+                    match_obj = self._build_api_claim_match(
+                        api_claim,
+                        matched_api_procedures_for_claimmatch,
                         pat_num=pat_num,
                         claim_fee=api_claim.get('ClaimFee', 0),
-                        date_of_service=api_claim['DateService'],
-                        date_sent=api_claim.get('DateSent'),  # Added DateSent field
-                        date_received=api_claim.get('DateReceived'),  # Added DateReceived field
-                        claim_note=api_claim.get('ClaimNote', ''),
-                        is_secondary=(api_claim.get('ClaimType') == 'S'), 
-                        has_secondary_plan=(int(api_claim.get('InsSubNum2', 0)) > 0 or int(api_claim.get('PlanNum2', 0)) > 0), 
-                        has_pending_secondary=False, 
-                        match_score=None, 
+                        has_secondary_plan=(int(api_claim.get('InsSubNum2', 0)) > 0 or int(api_claim.get('PlanNum2', 0)) > 0),
+                        match_score=None,
                         match_source='api_supplemental',
-                        claim_procs=matched_api_procedures_for_claimmatch,
-                        isOrtho=is_ortho_bool_api,
-                        ortho_details=ortho_details_api_data,
                         is_supplemental=True,
                         carrier_name=carrier_name,  # Use the fetched carrier name
                         claim_status=api_claim.get('ClaimStatus')  # Added to track claim status
@@ -1736,18 +2603,18 @@ class ClaimMatcher:
 
         except Exception as e:
             logger.error(LOG_ERROR.format(f"{log_prefix} ERROR during API fallback supplemental search: {str(e)}"))
-            import traceback
             logger.error(traceback.format_exc()) # For detailed debugging
             return [] # Return empty list on error
 
+    @staticmethod
     def _has_strong_non_procedure_match_with_fees(
-        self, 
         claim_date_obj: date, 
         target_date_obj: date, 
         name_score: int, 
         claim_procedures: List[Dict],  # PMS procedures with fee_billed
         eob_procedures: List[ProcedurePayment],  # EOB procedures with submitted_amt
-        log_prefix: str = ""
+        log_prefix: str = "",
+        eob_fees_sorted: Optional[tuple] = None  # Precomputed PaymentInfo.sorted_submitted_fees
     ) -> bool:
         """
         Enhanced alternate benefit matching that compares individual procedure fees.
@@ -1762,77 +2629,80 @@ class ClaimMatcher:
         - High name confidence (score >= 25/30)
         - Individual procedure fees match between PMS and EOB (80%+ of fees)
         """
+        log_info = logger.isEnabledFor(logging.INFO)  # Skip building per-candidate messages when INFO is off
         
         # Basic criteria (unchanged)
         if claim_date_obj != target_date_obj:
-            logger.info(LOG_INFO.format(f"{log_prefix} Date mismatch: {claim_date_obj} vs {target_date_obj}"))
+            if log_info:
+                logger.info(LOG_INFO.format(f"{log_prefix} Date mismatch: {claim_date_obj} vs {target_date_obj}"))
             return False
             
         if name_score < 25:  # Require very high name confidence
-            logger.info(LOG_INFO.format(f"{log_prefix} Name score too low: {name_score}/30 < 25"))
+            if log_info:
+                logger.info(LOG_INFO.format(f"{log_prefix} Name score too low: {name_score}/30 < 25"))
             return False
         
         # Enhanced: Individual procedure fee matching
         if not claim_procedures or not eob_procedures:
-            logger.info(LOG_INFO.format(f"{log_prefix} Missing procedure data for fee comparison"))
+            if log_info:
+                logger.info(LOG_INFO.format(f"{log_prefix} Missing procedure data for fee comparison"))
             return False
         
         # Extract fee amounts from both sources
         pms_fees = []
         for proc in claim_procedures:
             fee_billed = proc.get('fee_billed') or proc.get('FeeBilled') or 0
-            if fee_billed and float(fee_billed) > 0:
-                pms_fees.append(float(fee_billed))
-        
-        eob_fees = []
-        for proc in eob_procedures:
-            if hasattr(proc, 'submitted_amt') and proc.submitted_amt > 0:
-                eob_fees.append(float(proc.submitted_amt))
+            if fee_billed:
+                fee_billed = float(fee_billed)
+                if fee_billed > 0:
+                    pms_fees.append(fee_billed)
+        
+        # EOB side is the same for every candidate, so callers pass it in pre-sorted
+        if eob_fees_sorted is None:
+            eob_fees_sorted = sorted(
+                float(proc.submitted_amt) for proc in eob_procedures
+                if hasattr(proc, 'submitted_amt') and proc.submitted_amt > 0
+            )
         
-        if not pms_fees or not eob_fees:
-            logger.info(LOG_INFO.format(f"{log_prefix} No valid fees found for comparison (PMS: {len(pms_fees)}, EOB: {len(eob_fees)})"))
+        if not pms_fees or not eob_fees_sorted:
+            if log_info:
+                logger.info(LOG_INFO.format(f"{log_prefix} No valid fees found for comparison (PMS: {len(pms_fees)}, EOB: {len(eob_fees_sorted)})"))
             return False
         
-        # Sort both lists for comparison
-        pms_fees_sorted = sorted(pms_fees)
-        eob_fees_sorted = sorted(eob_fees)
-        
-        logger.info(LOG_INFO.format(f"{log_prefix} PMS fees (sorted): {pms_fees_sorted}"))
-        logger.info(LOG_INFO.format(f"{log_prefix} EOB fees (sorted): {eob_fees_sorted}"))
-        
-        # Check if fee arrays match exactly or very closely
-        if len(pms_fees_sorted) != len(eob_fees_sorted):
-            logger.info(LOG_INFO.format(f"{log_prefix} Different number of procedures: PMS={len(pms_fees_sorted)}, EOB={len(eob_fees_sorted)}"))
+        # Check if fee arrays match exactly or very closely; a count mismatch needs no sort
+        if len(pms_fees) != len(eob_fees_sorted):
+            if log_info:
+                logger.info(LOG_INFO.format(f"{log_prefix} Different number of procedures: PMS={len(pms_fees)}, EOB={len(eob_fees_sorted)}"))
             return False
-        
-        # Compare each fee pair
-        fee_matches = 0
+
+        # Sort the PMS fees for a pairwise comparison against the sorted EOB fees
+        pms_fees_sorted = sorted(pms_fees)
+        # Allow small variance for rounding differences: exact match or within $1 / 2%
+        fee_pair_matches = list(map(_fees_match, pms_fees_sorted, eob_fees_sorted))
+        fee_matches = sum(fee_pair_matches)
         total_fees = len(pms_fees_sorted)
-        
-        for i, (pms_fee, eob_fee) in enumerate(zip(pms_fees_sorted, eob_fees_sorted)):
-            # Allow small variance for rounding differences
-            fee_diff = abs(pms_fee - eob_fee)
-            fee_ratio = fee_diff / max(pms_fee, eob_fee) if max(pms_fee, eob_fee) > 0 else 0
-            
-            if fee_diff <= 1.0 or fee_ratio <= 0.02:  # Exact match or within $1 / 2%
-                fee_matches += 1
-                logger.info(LOG_INFO.format(f"{log_prefix}   Fee {i+1}: MATCH ${pms_fee} ≈ ${eob_fee}"))
-            else:
-                logger.info(LOG_INFO.format(f"{log_prefix}   Fee {i+1}: MISMATCH ${pms_fee} vs ${eob_fee} (diff: ${fee_diff:.2f})"))
-        
+
         # Require at least 80% of fees to match for alternate benefit scenario
         fee_match_percentage = fee_matches / total_fees
-        
-        if fee_match_percentage >= 0.8:
-            logger.info(LOG_SUCCESS.format(f"{log_prefix} STRONG ALTERNATE BENEFIT MATCH: {fee_matches}/{total_fees} fees match ({fee_match_percentage*100:.1f}%)"))
-            logger.info(LOG_INFO.format(f"{log_prefix}   → Same procedures, same fees, different codes = Alternate Benefit"))
-            return True
-        else:
-            logger.info(LOG_INFO.format(f"{log_prefix} Insufficient fee match: {fee_matches}/{total_fees} ({fee_match_percentage*100:.1f}%) < 80%"))
-            return False
+        is_match = fee_match_percentage >= 0.8
+
+        if log_info:
+            logger.info(LOG_INFO.format(f"{log_prefix} PMS fees (sorted): {pms_fees_sorted}"))
+            logger.info(LOG_INFO.format(f"{log_prefix} EOB fees (sorted): {list(eob_fees_sorted)}"))
+            for i, (pms_fee, eob_fee, matched) in enumerate(zip(pms_fees_sorted, eob_fees_sorted, fee_pair_matches)):
+                if matched:
+                    logger.info(LOG_INFO.format(f"{log_prefix}   Fee {i+1}: MATCH ${pms_fee} ≈ ${eob_fee}"))
+                else:
+                    logger.info(LOG_INFO.format(f"{log_prefix}   Fee {i+1}: MISMATCH ${pms_fee} vs ${eob_fee} (diff: ${abs(pms_fee - eob_fee):.2f})"))
+            if is_match:
+                logger.info(LOG_SUCCESS.format(f"{log_prefix} STRONG ALTERNATE BENEFIT MATCH: {fee_matches}/{total_fees} fees match ({fee_match_percentage*100:.1f}%)"))
+                logger.info(LOG_INFO.format(f"{log_prefix}   → Same procedures, same fees, different codes = Alternate Benefit"))
+            else:
+                logger.info(LOG_INFO.format(f"{log_prefix} Insufficient fee match: {fee_matches}/{total_fees} ({fee_match_percentage*100:.1f}%) < 80%"))
+        return is_match
 
+    @staticmethod
     def _has_procedure_count_match(
-        self,
         claim_date_obj: date,
         target_date_obj: date,
         name_score: int,
@@ -1853,14 +2723,17 @@ class ClaimMatcher:
         - High name confidence (score >= 20/30)
         - Same number of procedures
         """
+        log_info = logger.isEnabledFor(logging.INFO)  # Skip building per-candidate messages when INFO is off
         
         # Basic criteria
         if claim_date_obj != target_date_obj:
-            logger.info(LOG_INFO.format(f"{log_prefix} Date mismatch: {claim_date_obj} vs {target_date_obj}"))
+            if log_info:
+                logger.info(LOG_INFO.format(f"{log_prefix} Date mismatch: {claim_date_obj} vs {target_date_obj}"))
             return False
             
         if name_score < 20:  # Require good name confidence (same as main procedure threshold)
-            logger.info(LOG_INFO.format(f"{log_prefix} Name score too low for count match: {name_score}/30 < 20"))
+            if log_info:
+                logger.info(LOG_INFO.format(f"{log_prefix} Name score too low for count match: {name_score}/30 < 20"))
             return False
         
         # Count procedures
@@ -1868,19 +2741,22 @@ class ClaimMatcher:
         eob_proc_count = len(eob_procedures) if eob_procedures else 0
         
         if claim_proc_count == 0 and eob_proc_count == 0:
-            logger.info(LOG_INFO.format(f"{log_prefix} Both have 0 procedures - count match"))
+            if log_info:
+                logger.info(LOG_INFO.format(f"{log_prefix} Both have 0 procedures - count match"))
             return True
         
         if claim_proc_count == eob_proc_count and claim_proc_count > 0:
-            logger.info(LOG_SUCCESS.format(f"{log_prefix} PROCEDURE COUNT MATCH: Both have {claim_proc_count} procedures"))
-            logger.info(LOG_INFO.format(f"{log_prefix}   → Same count, strong date/name match = Likely same visit"))
+            if log_info:
+                logger.info(LOG_SUCCESS.format(f"{log_prefix} PROCEDURE COUNT MATCH: Both have {claim_proc_count} procedures"))
+                logger.info(LOG_INFO.format(f"{log_prefix}   → Same count, strong date/name match = Likely same visit"))
             return True
         else:
-            logger.info(LOG_INFO.format(f"{log_prefix} Procedure count mismatch: PMS={claim_proc_count}, EOB={eob_proc_count}"))
+            if log_info:
+                logger.info(LOG_INFO.format(f"{log_prefix} Procedure count mismatch: PMS={claim_proc_count}, EOB={eob_proc_count}"))
             return False
 
+    @staticmethod
     def _has_strong_non_procedure_match(
-        self, 
         claim_date_obj: date, 
         target_date_obj: date, 
         name_score: int, 
@@ -1921,62 +2797,7 @@ class ClaimMatcher:
         Comprehensive name normalization to handle common OCR errors, 
         data entry variations, and system artifacts.
         """
-        if not name or not name.strip():
-            return ""
-        
-        # Start with basic cleanup
-        normalized = name.strip().lower()
-        
-        # Remove common prefixes/suffixes that might interfere
-        prefixes_to_remove = ['dr.', 'dr', 'mr.', 'mr', 'mrs.', 'mrs', 'ms.', 'ms', 'miss']
-        suffixes_to_remove = ['jr.', 'jr', 'sr.', 'sr', 'ii', 'iii', 'iv']
-        
-        # Split into parts for processing
-        parts = re.split(r'[\s\-\'\.]+', normalized)
-        parts = [part for part in parts if part]  # Remove empty
-        
-        if not parts:
-            return ""
-        
-        # Remove prefix/suffix parts
-        cleaned_parts = []
-        for part in parts:
-            if part not in prefixes_to_remove and part not in suffixes_to_remove:
-                cleaned_parts.append(part)
-        
-        if not cleaned_parts:
-            cleaned_parts = parts  # Fallback to original if all parts removed
-        
-        # Apply OCR/character substitution fixes
-        result_parts = []
-        for part in cleaned_parts:
-            # Common OCR substitutions
-            ocr_fixes = {
-                # Number/letter confusion
-                '0': 'o', '1': 'l', '5': 's', '8': 'b',
-                # Character shape confusion  
-                'rn': 'm', 'cl': 'd', 'vv': 'w', 'ii': 'n',
-                # Common OCR errors
-                'ﬁ': 'fi', 'ﬂ': 'fl', 'oe': 'ce', 'ae': 'a',
-                # Scanner artifacts
-                '.': '', '_': '', '|': 'l', '\\': '', '/': ''
-            }
-            
-            fixed_part = part
-            for bad_char, good_char in ocr_fixes.items():
-                fixed_part = fixed_part.replace(bad_char, good_char)
-            
-            # Handle double letters that might be OCR artifacts
-            # But be careful not to break legitimate double letters
-            if len(fixed_part) > 2:
-                # Only fix if it creates a more reasonable length
-                dedupe_part = re.sub(r'(.)\1+', r'\1', fixed_part)
-                if len(dedupe_part) >= 2:  # Don't reduce to single character
-                    fixed_part = dedupe_part
-            
-            result_parts.append(fixed_part)
-        
-        return ' '.join(result_parts)
+        return _normalize_name_for_matching(name)
 
     @staticmethod
     def calculate_enhanced_similarity(name1: str, name2: str) -> dict:
@@ -1999,53 +2820,47 @@ class ClaimMatcher:
             return {'similarity': 1.0, 'match_type': 'exact_normalized', 'score': 15}
         
         # Substring/truncation analysis
-        shorter = norm1 if len(norm1) < len(norm2) else norm2
-        longer = norm2 if len(norm1) < len(norm2) else norm1
+        len1, len2 = len(norm1), len(norm2)
+        if len1 < len2:
+            shorter, longer, len_shorter, len_longer = norm1, norm2, len1, len2
+        else:
+            shorter, longer, len_shorter, len_longer = norm2, norm1, len2, len1
         
-        # High-confidence truncation matches
-        if len(shorter) >= 2 and shorter in longer:
-            if longer.startswith(shorter):
+        # High-confidence truncation matches, from one scan for the first occurrence
+        if len_shorter >= 2:
+            index = longer.find(shorter)
+            if index == 0:
                 return {'similarity': 0.95, 'match_type': 'prefix_truncation', 'score': 12}
-            elif longer.endswith(shorter):
-                return {'similarity': 0.95, 'match_type': 'suffix_truncation', 'score': 12}
-            elif shorter in longer:
+            elif index > 0:
+                # A later occurrence may still sit at the end
+                if longer.endswith(shorter):
+                    return {'similarity': 0.95, 'match_type': 'suffix_truncation', 'score': 12}
                 return {'similarity': 0.85, 'match_type': 'substring_truncation', 'score': 10}
         
-        # Levenshtein distance calculation
-        distance = ClaimMatcher.levenshtein_distance(norm1, norm2)
-        max_len = max(len(norm1), len(norm2))
-        levenshtein_similarity = 1.0 - (distance / max_len) if max_len > 0 else 0.0
-        
-        # Character overlap analysis (for very different but related names)
-        chars1 = set(norm1)
-        chars2 = set(norm2)
-        char_overlap = len(chars1 & chars2) / len(chars1 | chars2) if chars1 or chars2 else 0.0
+        # Levenshtein distance calculation, counting a transposed letter pair ('jhon'/'john')
+        # as one edit (optimal string alignment). The distance is at least the length gap, so
+        # 1 - gap / max_len bounds the similarity; below 0.6 no similarity tier can pass
+        # and the distance is only needed for the poor_match result. Within the gate the
+        # distance is capped at the weakest tier, so clearly different names stop early
+        # (scored 0.0 here; poor_match computes the exact value).
+        if len_shorter / len_longer >= 0.6:
+            levenshtein_similarity = _osa_similarity(norm1, norm2, 0.6)
+            tier = _SIMILARITY_TIERS[bisect_right(_SIMILARITY_TIER_CUTOFFS, levenshtein_similarity)]
+            if tier is not None:
+                return {'similarity': levenshtein_similarity, 'match_type': tier[0], 'score': tier[1]}
+        
+        # Character overlap analysis (for very different but related names): Jaccard index of
+        # the two character sets, held as bitmasks
+        mask1 = _char_mask(norm1)
+        mask2 = _char_mask(norm2)
+        union_count = (mask1 | mask2).bit_count()
+        char_overlap = (mask1 & mask2).bit_count() / union_count if union_count else 0.0
         
         # Phonetic similarity (basic soundex-like approach)
-        def simple_soundex(name):
-            if not name:
-                return ""
-            # Keep first letter, remove vowels, dedupe consonants
-            result = name[0]
-            for char in name[1:]:
-                if char not in 'aeiou' and (not result or char != result[-1]):
-                    result += char
-            return result[:4].ljust(4, '0')
-        
-        phonetic_match = simple_soundex(norm1) == simple_soundex(norm2)
-        
-        # Determine best match type and score
-        if levenshtein_similarity >= 0.9:
-            return {'similarity': levenshtein_similarity, 'match_type': 'high_similarity', 'score': 12}
-        elif levenshtein_similarity >= 0.8:
-            return {'similarity': levenshtein_similarity, 'match_type': 'good_similarity', 'score': 10}
-        elif levenshtein_similarity >= 0.7:
-            return {'similarity': levenshtein_similarity, 'match_type': 'fair_similarity', 'score': 8}
-        elif levenshtein_similarity >= 0.6:
-            return {'similarity': levenshtein_similarity, 'match_type': 'weak_similarity', 'score': 5}
-        elif phonetic_match and char_overlap > 0.5:
+        if char_overlap > 0.5 and _simple_soundex(norm1) == _simple_soundex(norm2):
             return {'similarity': 0.6, 'match_type': 'phonetic_match', 'score': 6}
         elif char_overlap > 0.7:
             return {'similarity': char_overlap, 'match_type': 'character_overlap', 'score': 4}
         else:
+            levenshtein_similarity = _osa_similarity(norm1, norm2)
             return {'similarity': levenshtein_similarity, 'match_type': 'poor_match', 'score': 0}
\ No newline at end of file
@@ -0,0 +1,83 @@
+"""Tests for ClaimMatcher helpers: the optimal string alignment distance behind the name tiers, and _pick."""
+import random
+
+import pytest
+
+pytest.importorskip("backend.logging_config")
+
+from claimsMatchingOpenDental import ClaimMatcher, _myers_osa_distance, _pick
+
+
+def _reference_osa_distance(s1: str, s2: str) -> int:
+    """Textbook optimal string alignment DP (Levenshtein plus adjacent transpositions)."""
+    d = [[0] * (len(s2) + 1) for _ in range(len(s1) + 1)]
+    for i in range(len(s1) + 1):
+        d[i][0] = i
+    for j in range(len(s2) + 1):
+        d[0][j] = j
+    for i in range(1, len(s1) + 1):
+        for j in range(1, len(s2) + 1):
+            cost = 0 if s1[i - 1] == s2[j - 1] else 1
+            d[i][j] = min(d[i - 1][j] + 1, d[i][j - 1] + 1, d[i - 1][j - 1] + cost)
+            if i > 1 and j > 1 and s1[i - 1] == s2[j - 2] and s1[i - 2] == s2[j - 1]:
+                d[i][j] = min(d[i][j], d[i - 2][j - 2] + 1)
+    return d[len(s1)][len(s2)]
+
+
+def _random_string_pairs(count: int, seed: int):
+    rng = random.Random(seed)
+    for _ in range(count):
+        # A small alphabet makes matches and transpositions common
+        yield (''.join(rng.choice('abcd') for _ in range(rng.randint(0, 12))),
+               ''.join(rng.choice('abcd') for _ in range(rng.randint(0, 12))))
+
+
+def test_myers_osa_distance_matches_reference_dp():
+    for s1, s2 in _random_string_pairs(3000, seed=1):
+        assert _myers_osa_distance(s1, s2) == _reference_osa_distance(s1, s2), (s1, s2)
+
+
+def test_myers_osa_distance_with_max_distance_caps_at_max_plus_one():
+    for max_distance in (0, 1, 2, 4):
+        for s1, s2 in _random_string_pairs(1000, seed=max_distance + 2):
+            expected = min(_reference_osa_distance(s1, s2), max_distance + 1)
+            assert _myers_osa_distance(s1, s2, max_distance) == expected, (s1, s2, max_distance)
+
+
+@pytest.mark.parametrize("name1, name2, match_type, score", [
+    ('jhonson', 'johnson', 'good_similarity', 10),  # one transposition in seven letters
+    ('jhon', 'john', 'fair_similarity', 8),         # one transposition in four letters
+])
+def test_calculate_enhanced_similarity_counts_transposition_as_one_edit(name1, name2, match_type, score):
+    result = ClaimMatcher.calculate_enhanced_similarity(name1, name2)
+
+    assert (result['match_type'], result['score']) == (match_type, score)
+
+
+@pytest.mark.parametrize("record, default, expected", [
+    ({'pat_num': 12, 'PatNum': 34}, None, 12),
+    ({'pat_num': None, 'PatNum': 34}, None, 34),
+    ({'PatNum': 0}, None, 0),        # falls through to the last key's value, like `or`
+    ({}, None, None),
+    ({'PatNum': 0}, 'fallback', 'fallback'),
+])
+def test_pick_matches_or_chain(record, default, expected):
+    assert _pick(record, ('pat_num', 'PatNum'), default) == expected
+
+
+def test_claims_date_index_is_kept_off_claims_data_and_rebuilt_on_in_place_replacement():
+    matcher = ClaimMatcher(make_request_callable=None)
+    claims = [{'date_of_service': '2024-01-05'}, {'DateService': '2024-1-5'}, {'claim_date': '2024-13-45'}]
+    claims_data = {'claims': claims}
+
+    index = matcher._ensure_claims_date_index(claims_data['claims'])
+
+    assert list(claims_data) == ['claims']
+    assert [len(index.by_date['2024-01-05']), index.undated_count] == [2, 1]
+    assert matcher._ensure_claims_date_index(list(claims)) is index  # same claim dicts, new list
+
+    claims[2] = {'date_of_service': '2024-02-01'}  # same length, different claim
+    rebuilt = matcher._ensure_claims_date_index(claims)
+
+    assert rebuilt is not index
+    assert (len(rebuilt.by_date['2024-02-01']), rebuilt.undated_count) == (1, 0)
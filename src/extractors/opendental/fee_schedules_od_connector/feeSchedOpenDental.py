@@ -1,11 +1,18 @@
-from typing import Dict, List, Any, Optional, TypedDict, Union, TYPE_CHECKING
+from typing import Dict, List, Any, Optional, Tuple, TypedDict, Union, TYPE_CHECKING
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from functools import lru_cache
+import json
 import re
 import requests
 import logging
 import aiohttp
 import asyncio
 import time
+try:
+    import orjson  # Optional native JSON codec
+except ImportError:
+    orjson = None
 from backend.logging_config import get_logger, LOG_INFO, LOG_ERROR, LOG_WARNING, LOG_SUCCESS
 
 # Conditional import for type hinting to avoid circular dependency
@@ -16,6 +23,78 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
 
+# Fee writes are started at most once per interval (the OpenDental API throttle), but each
+# request no longer waits for the previous one's round trip before its slot comes up
+_FEE_REQUEST_INTERVAL_SECONDS = 0.5
+_FEE_REQUEST_MAX_IN_FLIGHT = 16
+# GET /fees pages hold up to 100 rows; this many pages of a schedule are requested at once.
+# Page GETs are only capped by this count; as in the sequential listing, they are not spaced
+# by the write throttle
+_FEE_PAGE_SIZE = 100
+_FEE_PAGE_PREFETCH = 4
+
+# Fee schedule names are compared as their lowercase alphanumeric words, minus words
+# that don't affect matching
+_FEE_SCHEDULE_NAME_WORD_RE = re.compile(r'[a-z0-9]+')
+_FEE_SCHEDULE_NAME_COMMON_WORDS = frozenset({
+    'fee', 'schedule', 'fees', 'insurance', 'ins', 
+    'company', 'co', 'corp', 'corporation',
+    'incorporated', 'inc',
+    'dental', 'health', 'life',
+    'of', 'the', 'and',
+    'group', 'services',
+    'limited', 'ltd'
+})
+
+def _json_loads(content: Union[bytes, str]) -> Any:
+    """Parses a JSON response body with orjson when installed, else the stdlib; raises ValueError if invalid."""
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+def _json_body(data: Optional[dict]) -> Optional[bytes]:
+    """Encodes a request payload as JSON bytes (orjson when installed); None sends no body."""
+    if data is None:
+        return None
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data).encode('utf-8')
+
+@lru_cache(maxsize=256)
+def _join_url(base_url: str, endpoint: str) -> str:
+    """Full request URL for an endpoint; '/fees', '/feescheds' and the like repeat across a whole run."""
+    return f"{base_url}/{endpoint.lstrip('/')}"
+
+@lru_cache(maxsize=4096)
+def _format_amount_cached(amount_str: str) -> str:
+    """Cleaned amount string to the API's 2-decimal format; schedules repeat a handful of amounts."""
+    return f"{float(amount_str):.2f}"
+
+def _run_coroutine(coro) -> Any:
+    """
+    Runs a coroutine to completion from synchronous code. asyncio.run refuses to start inside a
+    running event loop (e.g. when called from an async handler), so there it runs on a worker thread.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(asyncio.run, coro).result()
+
+class _RequestThrottle:
+    """Spaces request starts at least `interval` seconds apart across coroutines on one event loop."""
+    def __init__(self, interval: float):
+        self.interval = interval
+        self._next_start = 0.0
+
+    async def wait(self):
+        now = asyncio.get_running_loop().time()
+        start = max(now, self._next_start)
+        self._next_start = start + self.interval
+        if start > now:
+            await asyncio.sleep(start - now)
+
 @dataclass
 class FeeData:
     """Data class for fee information with explicit types"""
@@ -86,6 +165,7 @@ class FeeScheduleManager:
         
         # Initialize collections
         self.fee_schedules = {}
+        self._normalized_schedule_index = {}  # normalized name -> self.fee_schedules entry
         self.procedure_codes = {}
         self.api_responses = [] # Initialize list to store API call details
         
@@ -96,16 +176,16 @@ class FeeScheduleManager:
 
     def make_request(self, endpoint: str, method: str = 'GET', data: Optional[dict] = None) -> Any:
         """Makes a request to the OpenDental API with error handling."""
-        full_url = f"{self.base_url}/{endpoint.lstrip('/')}"
+        full_url = _join_url(self.base_url, endpoint)
         
         try:
             response = None
             if method == 'GET':
                 response = requests.get(full_url, headers=self.headers, timeout=30)
             elif method == 'POST':
-                response = requests.post(full_url, headers=self.headers, json=data, timeout=30)
+                response = requests.post(full_url, headers=self.headers, data=_json_body(data), timeout=30)
             elif method == 'PUT':
-                response = requests.put(full_url, headers=self.headers, json=data, timeout=30)
+                response = requests.put(full_url, headers=self.headers, data=_json_body(data), timeout=30)
             else:
                 raise ValueError(f"Unsupported HTTP method: {method}")
 
@@ -115,27 +195,31 @@ class FeeScheduleManager:
                 'url': full_url,
                 'request_payload': data, 
                 'status_code': response.status_code,
-                'response_body': response.text  # Store raw text initially
+                'response_body': None  # Parsed JSON, error text, a preview or the empty PUT body; filled in below
             }
             
             if not response.ok:
                 error_text = response.text
                 logger.error(f"API error: {response.status_code} - {error_text} for {method} {full_url}")
+                log_entry['response_body'] = error_text
                 self.api_responses.append(log_entry)
                 raise Exception(f"OpenDental API error: {response.status_code} - {error_text}")
 
             response_content = None
-            if method == 'PUT' and (not response.content or response.text.strip() == ""):
+            if method == 'PUT' and not response.content.strip():
                 logger.info(f"PUT to {full_url} successful with empty/whitespace body. Amount: {data.get('Amount') if data else 'N/A'}.")
+                log_entry['response_body'] = response.text
                 response_content = {"_synthetic_put_ok": True, "Amount": data.get("Amount") if data else None}
             else:
                 try:
-                    response_content = response.json()
-                    log_entry['response_body'] = response_content  # Update log with parsed JSON
-                except requests.exceptions.JSONDecodeError as e_json:
-                    logger.error(f"{method} to {full_url} successful (status {response.status_code}) but response body is not valid JSON. Content: '{response.text[:200]}...'. Error: {e_json}")
+                    response_content = _json_loads(response.content)
+                    log_entry['response_body'] = response_content
+                except ValueError as e_json:
+                    preview = response.text[:200]
+                    logger.error(f"{method} to {full_url} successful (status {response.status_code}) but response body is not valid JSON. Content: '{preview}...'. Error: {e_json}")
+                    log_entry['response_body'] = preview
                     self.api_responses.append(log_entry)
-                    raise Exception(f"OpenDental API success status {response.status_code} but sent non-JSON content for {method} {full_url}: {response.text[:200]}")
+                    raise Exception(f"OpenDental API success status {response.status_code} but sent non-JSON content for {method} {full_url}: {preview}")
             
             self.api_responses.append(log_entry)
             return response_content
@@ -164,57 +248,240 @@ class FeeScheduleManager:
             raise
 
     async def async_make_request(self, session: aiohttp.ClientSession, endpoint: str, method: str = 'GET', data: Optional[dict] = None) -> Any:
-        """Makes an asynchronous request to the OpenDental API with error handling"""
-        full_url = f"{self.base_url}/{endpoint.lstrip('/')}"
+        """
+        Makes an asynchronous request to the OpenDental API with error handling.
+        Returns, raises and records api_responses entries the same way as make_request.
+        """
+        full_url = _join_url(self.base_url, endpoint)
+        
         try:
+            if method not in ('GET', 'POST', 'PUT'):
+                raise ValueError(f"Unsupported HTTP method: {method}")
             logger.debug(f"Making async {method} request to {full_url}" + (f" with data: {data}" if data else ""))
+
+            timeout = aiohttp.ClientTimeout(total=30 if method == 'GET' else 60)
+            async with session.request(method, full_url, headers=self.headers, data=_json_body(data), timeout=timeout) as response:
+                status_code = response.status
+                response_bytes = await response.read()
+
+            log_entry = {
+                'timestamp': time.time(), 
+                'method': method, 
+                'url': full_url,
+                'request_payload': data, 
+                'status_code': status_code,
+                'response_body': None  # Parsed JSON, error text, a preview or the empty PUT body; filled in below
+            }
             
-            if method == 'GET':
-                async with session.get(full_url, headers=self.headers, timeout=30) as response:
-                    response.raise_for_status() 
-                    return await response.json()
-            elif method == 'POST':
-                async with session.post(full_url, headers=self.headers, json=data, timeout=60) as response:
-                    response.raise_for_status()
-                    return await response.json()
-            elif method == 'PUT':
-                async with session.put(full_url, headers=self.headers, json=data, timeout=60) as response:
-                    response.raise_for_status()
-                    return await response.json()
+            if status_code >= 400:
+                error_text = response_bytes.decode('utf-8', errors='replace')
+                logger.error(f"API error: {status_code} - {error_text} for async {method} {full_url}")
+                log_entry['response_body'] = error_text
+                self.api_responses.append(log_entry)
+                raise Exception(f"OpenDental API error: {status_code} - {error_text}")
+
+            response_content = None
+            if method == 'PUT' and not response_bytes.strip():
+                logger.info(f"PUT to {full_url} successful with empty/whitespace body. Amount: {data.get('Amount') if data else 'N/A'}.")
+                log_entry['response_body'] = response_bytes.decode('utf-8', errors='replace')
+                response_content = {"_synthetic_put_ok": True, "Amount": data.get("Amount") if data else None}
             else:
-                raise ValueError(f"Unsupported HTTP method: {method}")
-        except aiohttp.ClientResponseError as error:
-            error_text = await error.response.text() if error.response else "No response text"
-            logger.error(f"API error: {error.status} - {error_text} for async {method} {full_url}")
-            raise Exception(f"OpenDental API error: {error.status} - {error_text}")
-        except aiohttp.ClientError as error: 
-            logger.error(f"Client error in async {method} request to {endpoint}: {str(error)}")
-            raise
-        except Exception as error:
-            logger.error(f"Unexpected error in async {method} request to {endpoint}. Error type: {type(error)}, repr: {repr(error)}, str: {str(error)}")
-            # Attempt to log response details if available
-            if hasattr(error, 'response') and error.response is not None:
                 try:
-                    status_code = error.response.status
-                    # response_text = await error.response.text() # This might fail if response is already read or not text
-                    logger.error(f"Associated response status (if any): {status_code}") #, text: {response_text[:500]}")
-                except Exception as e_resp:
-                    logger.error(f"Could not get details from error.response: {e_resp}")
-            
-            import traceback
-            logger.error(f"Traceback: {traceback.format_exc()}")
+                    response_content = _json_loads(response_bytes)
+                    log_entry['response_body'] = response_content
+                except ValueError as e_json:
+                    preview = response_bytes[:200].decode('utf-8', errors='replace')
+                    logger.error(f"{method} to {full_url} successful (status {status_code}) but response body is not valid JSON. Content: '{preview}...'. Error: {e_json}")
+                    log_entry['response_body'] = preview
+                    self.api_responses.append(log_entry)
+                    raise Exception(f"OpenDental API success status {status_code} but sent non-JSON content for {method} {full_url}: {preview}")
+            
+            self.api_responses.append(log_entry)
+            return response_content
+
+        except (aiohttp.ClientError, asyncio.TimeoutError) as req_error:
+            logger.error(f"Error in async {method} request to {endpoint}: {repr(req_error)}")
+            self.api_responses.append({
+                'timestamp': time.time(), 
+                'method': method, 
+                'url': full_url,
+                'request_payload': data, 
+                'status_code': 'REQUEST_EXCEPTION',
+                'response_body': repr(req_error)
+            })
+            raise 
+        except Exception as generic_error: 
+            logger.error(f"Unexpected error in async {method} request to {endpoint}: {str(generic_error)}")
+            self.api_responses.append({
+                'timestamp': time.time(), 
+                'method': method, 
+                'url': full_url,
+                'request_payload': data, 
+                'status_code': 'UNEXPECTED_ERROR',
+                'response_body': str(generic_error)
+            })
             raise
 
+    def _open_async_session(self) -> aiohttp.ClientSession:
+        """Session for a batch of async requests, with one kept-alive connection per request in flight."""
+        return aiohttp.ClientSession(connector=aiohttp.TCPConnector(limit=_FEE_REQUEST_MAX_IN_FLIGHT))
+
+    async def _send_concurrent_requests(self, session: aiohttp.ClientSession, requests_to_send: List[Tuple[str, str, Optional[dict]]],
+                                        throttle: Optional[_RequestThrottle]) -> List[Any]:
+        """
+        Sends each (endpoint, method, data) request through async_make_request, at most
+        _FEE_REQUEST_MAX_IN_FLIGHT at a time. With a throttle, request starts are also spaced by
+        its interval while earlier ones are still in flight; None sends them back to back.
+        Returns the response or raised exception for each request, in input order.
+        """
+        in_flight = asyncio.Semaphore(_FEE_REQUEST_MAX_IN_FLIGHT)
+
+        async def send(endpoint: str, method: str, data: Optional[dict]) -> Any:
+            async with in_flight:
+                if throttle is not None:
+                    await throttle.wait()
+                return await self.async_make_request(session, endpoint, method, data=data)
+
+        return await asyncio.gather(
+            *(send(endpoint, method, data) for endpoint, method, data in requests_to_send),
+            return_exceptions=True
+        )
+
+    async def _setup_fees_async(self, create_payloads: List[dict]) -> List[Any]:
+        """POSTs the new fees of a fee schedule; one response or exception per payload, in order."""
+        async with self._open_async_session() as session:
+            return await self._send_concurrent_requests(
+                session, [('/fees', 'POST', payload) for payload in create_payloads],
+                _RequestThrottle(_FEE_REQUEST_INTERVAL_SECONDS)
+            )
+
+    async def _fetch_all_existing_fees(self, session: aiohttp.ClientSession, fee_sched_num_int: int) -> List[Any]:
+        """
+        All fees of a fee schedule, paged by Offset. Pages are requested _FEE_PAGE_PREFETCH at a
+        time without start spacing; the first short, failed or malformed page ends the listing, and
+        any pages requested past it are discarded.
+        """
+        all_fetched_fees_list = []
+        offset = 0
+        while True:
+            offsets = [offset + page * _FEE_PAGE_SIZE for page in range(_FEE_PAGE_PREFETCH)]
+            logger.debug(f"Fetching fees for schedule {fee_sched_num_int} with offsets {offsets[0]}-{offsets[-1]}")
+            batches = await self._send_concurrent_requests(
+                session, [(f"/fees?FeeSched={fee_sched_num_int}&Offset={page_offset}", 'GET', None) for page_offset in offsets],
+                None
+            )
+            for page_offset, current_batch_fees_data in zip(offsets, batches):
+                if isinstance(current_batch_fees_data, BaseException):
+                    logger.error(f"Error fetching fees batch for schedule {fee_sched_num_int} at offset {page_offset}: {str(current_batch_fees_data)}")
+                    return all_fetched_fees_list
+                if not isinstance(current_batch_fees_data, list):
+                    logger.error(f"Unexpected response type when fetching fees for schedule {fee_sched_num_int} at offset {page_offset}. Response: {current_batch_fees_data}")
+                    return all_fetched_fees_list
+                all_fetched_fees_list.extend(current_batch_fees_data)
+                logger.debug(f"Fetched {len(current_batch_fees_data)} fees in this batch for schedule {fee_sched_num_int}.")
+                if len(current_batch_fees_data) < _FEE_PAGE_SIZE:
+                    return all_fetched_fees_list
+            offset += _FEE_PAGE_PREFETCH * _FEE_PAGE_SIZE
+
+    async def _update_fees_async(self, fee_sched_num_int: int, fees: List[Dict]) -> Tuple[int, int]:
+        """
+        Brings a fee schedule's fees in line with `fees`: existing fees with a different amount are
+        PUT, missing ones are POSTed, and matching ones are left alone. The existing-fee listing and
+        the writes share one session. Returns (successful, failed) fee counts.
+        """
+        successful_fees_processed = 0
+        failed_fees_processed = 0
+
+        async with self._open_async_session() as session:
+            logger.info(f"Fetching existing fees for schedule {fee_sched_num_int} before update using pagination.")
+            all_fetched_fees_list = await self._fetch_all_existing_fees(session, fee_sched_num_int)
+            existing_fees_map = {
+                fee_item['CodeNum']: fee_item for fee_item in all_fetched_fees_list
+                if isinstance(fee_item, dict) and 'CodeNum' in fee_item and 'FeeNum' in fee_item and 'Amount' in fee_item
+            }
+            
+            logger.info(f"Found a total of {len(existing_fees_map)} existing fees for schedule {fee_sched_num_int} after pagination.")
+            
+            total_fees_to_process = len(fees)
+            logger.info(f"Processing {total_fees_to_process} fee updates for schedule {fee_sched_num_int}, starting requests {_FEE_REQUEST_INTERVAL_SECONDS}s apart.")
+            
+            # Decide every fee's action up front; the PUTs/POSTs are then sent concurrently
+            pending_writes = []  # (processed_count, code, code_num, amount_str, endpoint, method, payload)
+            for processed_count, fee_input in enumerate(fees, start=1):
+                code = str(fee_input.get('code', '')).strip()
+                amount_input = fee_input.get('amount')
+
+                try:
+                    if not code or amount_input is None:
+                        logger.warning(f"Skipping fee update {processed_count}/{total_fees_to_process} for schedule {fee_sched_num_int} due to missing code or amount: {fee_input}")
+                        failed_fees_processed += 1
+                        continue
+                    
+                    current_code_num = self._get_code_num(code)
+                    if not current_code_num:
+                        logger.warning(f"Could not find CodeNum for procedure code '{code}' for schedule {fee_sched_num_int}. Skipping fee update {processed_count}/{total_fees_to_process}.")
+                        failed_fees_processed += 1
+                        continue
+
+                    amount_str_new = self._format_amount_for_api(amount_input)
+                    
+                    if current_code_num in existing_fees_map:
+                        existing_fee_details = existing_fees_map[current_code_num]
+                        existing_amount_formatted = f"{float(existing_fee_details['Amount']):.2f}" # Format existing amount for comparison
+
+                        if amount_str_new == existing_amount_formatted:
+                            logger.info(f"Fee {processed_count}/{total_fees_to_process} for schedule {fee_sched_num_int} (Code: {code}, CodeNum: {current_code_num}): Amount ${amount_str_new} matches existing amount. Skipping update.")
+                            successful_fees_processed +=1 # Count as success as it's already correct
+                            continue # Skip API call
+
+                        fee_num = existing_fee_details['FeeNum']
+                        pending_writes.append((processed_count, code, current_code_num, amount_str_new,
+                                               f'/fees/{fee_num}', 'PUT', {"Amount": amount_str_new}))
+                    else:
+                        create_payload = {
+                            "Amount": amount_str_new,
+                            "FeeSched": fee_sched_num_int,
+                            "CodeNum": current_code_num
+                        }
+                        pending_writes.append((processed_count, code, current_code_num, amount_str_new,
+                                               '/fees', 'POST', create_payload))
+                        
+                except ValueError as ve: 
+                    logger.error(f"Failed to process fee {processed_count}/{total_fees_to_process} for schedule {fee_sched_num_int} (Code: {code}). Error: Invalid value - {str(ve)}")
+                    failed_fees_processed += 1
+
+            responses = await self._send_concurrent_requests(
+                session, [(endpoint, method, payload) for *_, endpoint, method, payload in pending_writes],
+                _RequestThrottle(_FEE_REQUEST_INTERVAL_SECONDS)
+            )
+
+        for (processed_count, code, current_code_num, amount_str_new, _, method, _), response in zip(pending_writes, responses):
+            if isinstance(response, BaseException):
+                logger.error(f"Failed to process fee {processed_count}/{total_fees_to_process} for schedule {fee_sched_num_int} (Code: {code}, CodeNum: {current_code_num}). API Error: {str(response)}")
+                failed_fees_processed += 1
+            elif method == 'PUT' and response and (response.get('FeeNum') or response.get('_synthetic_put_ok')):
+                successful_fees_processed += 1
+                logger.info(f"Fee {processed_count}/{total_fees_to_process} for schedule {fee_sched_num_int} (Code: {code}, CodeNum: {current_code_num}): Updated with Amount: {amount_str_new}")
+            elif method == 'POST' and response and 'FeeNum' in response:
+                successful_fees_processed += 1
+                logger.info(f"Fee {processed_count}/{total_fees_to_process} for schedule {fee_sched_num_int} (Code: {code}, CodeNum: {current_code_num}): Created with Amount: {amount_str_new}")
+            else:
+                action = 'update' if method == 'PUT' else 'create new'
+                logger.error(f"Failed to {action} fee for CodeNum {current_code_num} on schedule {fee_sched_num_int} - invalid API response: {response}")
+                failed_fees_processed += 1
+
+        return successful_fees_processed, failed_fees_processed
+
     def _format_amount_for_api(self, amount_input: Any) -> str:
         """Converts amount to string with 2 decimal places for API."""
         if amount_input is None:
             raise ValueError("Amount input cannot be None")
         try:
-            # Remove currency symbols and commas, then convert to float
-            amount_str_cleaned = str(amount_input).replace('$', '').replace(',', '')
-            amount_float = float(amount_str_cleaned)
-            # Format as string with 2 decimal places
-            return f"{amount_float:.2f}"
+            # Floats need no cleaning or parsing (ints still go through str: a huge int parses to inf)
+            if type(amount_input) is float:
+                return f"{amount_input:.2f}"
+            # Remove currency symbols and commas, then convert and format with 2 decimal places
+            return _format_amount_cached(str(amount_input).replace('$', '').replace(',', ''))
         except (ValueError, TypeError) as e:
             raise ValueError(f"Invalid amount format: {amount_input}. Error: {str(e)}") from e
 
@@ -256,45 +523,38 @@ class FeeScheduleManager:
             logger.info(f"Loaded {len(self.fee_schedules)} fee schedules from OpenDental")
         except Exception as e:
             logger.error(f"Error loading fee schedules: {str(e)}")
+        self._rebuild_normalized_schedule_index()
+
+    def _rebuild_normalized_schedule_index(self):
+        """Index self.fee_schedules by normalized name; the first schedule in order wins a shared name."""
+        self._normalized_schedule_index = {}
+        for sched_name_key, sched_data_val in self.fee_schedules.items():
+            self._normalized_schedule_index.setdefault(self._normalize_fee_schedule_name(sched_name_key), sched_data_val)
 
     def _normalize_fee_schedule_name(self, name: str) -> str:
         """Normalize fee schedule name for consistent matching"""
         if not name:
             return ""
             
-        # Convert to lowercase and remove special characters
-        normalized = re.sub(r'[^a-z0-9]', ' ', name.lower())
-        
-        # Remove common words that don't affect matching
-        common_words = [
-            'fee', 'schedule', 'fees', 'insurance', 'ins', 
-            'company', 'co', 'corp', 'corporation',
-            'incorporated', 'inc',
-            'dental', 'health', 'life',
-            'of', 'the', 'and',
-            'group', 'services',
-            'limited', 'ltd'
-        ]
-        
-        pattern = r'\b(' + '|'.join(common_words) + r')\b'
-        normalized = re.sub(pattern, '', normalized)
-        
-        # Clean up extra spaces
-        return ' '.join(normalized.split())
+        # Lowercase, split on special characters and drop common words in one pass
+        return ' '.join(
+            word for word in _FEE_SCHEDULE_NAME_WORD_RE.findall(name.lower())
+            if word not in _FEE_SCHEDULE_NAME_COMMON_WORDS
+        )
     
     def _get_or_create_fee_schedule(self, name: str, fee_schedule_type: str) -> Dict:
         """Get existing fee schedule or create new one"""
         try:
             normalized_name = self._normalize_fee_schedule_name(name)
             
-            # Check if fee schedule exists by normalized name (self.fee_schedules should be populated by _initialize_fee_schedules)
-            for sched_name_key, sched_data_val in self.fee_schedules.items(): # Iterate over items for clarity
-                if self._normalize_fee_schedule_name(sched_name_key) == normalized_name:
-                    logger.info(f"Found existing fee schedule for '{name}' (normalized: '{normalized_name}') with ID {sched_data_val['id']}")
-                    return Ok({
-                        "fee_sched_num": sched_data_val['id'],
-                        "is_new": False
-                    })
+            # Check if fee schedule exists by normalized name (the index is built by _initialize_fee_schedules)
+            sched_data_val = self._normalized_schedule_index.get(normalized_name)
+            if sched_data_val is not None:
+                logger.info(f"Found existing fee schedule for '{name}' (normalized: '{normalized_name}') with ID {sched_data_val['id']}")
+                return Ok({
+                    "fee_sched_num": sched_data_val['id'],
+                    "is_new": False
+                })
 
             # Create new fee schedule - use proper type format
             fee_type = self.FEE_SCHEDULE_TYPES.get(
@@ -315,7 +575,7 @@ class FeeScheduleManager:
             fee_sched_num = response['FeeSchedNum']
             
             # Update local cache
-            self.fee_schedules[normalized_name] = {
+            self.fee_schedules[normalized_name] = self._normalized_schedule_index[normalized_name] = {
                 'id': fee_sched_num,
                 'type': fee_type,
                 'is_hidden': "false",
@@ -348,7 +608,7 @@ class FeeScheduleManager:
             return 0
 
     def setup_fee_schedule(self, fee_schedule_data: FeeScheduleInput) -> Dict:
-        """Set up a fee schedule with fees in OpenDental, synchronously processing fees with throttling."""
+        """Set up a fee schedule with fees in OpenDental, sending the fee POSTs concurrently with throttling."""
         try:
             name = fee_schedule_data.get('name')
             fee_schedule_type_input = fee_schedule_data.get('type', 'Normal')
@@ -391,15 +651,13 @@ class FeeScheduleManager:
                 logger.info(f"No fees provided for fee schedule '{name}' (ID: {fee_sched_num_int}). Skipping fee processing.")
             else:
                 total_fees_to_process = len(fees)
-                processed_count = 0
-                logger.info(f"Processing {total_fees_to_process} fees for new fee schedule '{name}' (ID: {fee_sched_num_int}) with 0.5 req/sec throttle.")
+                logger.info(f"Processing {total_fees_to_process} fees for new fee schedule '{name}' (ID: {fee_sched_num_int}), starting requests {_FEE_REQUEST_INTERVAL_SECONDS}s apart.")
                 
-                for fee_input in fees:
-                    processed_count += 1
+                # Validate every fee up front; the valid ones are then POSTed concurrently
+                pending_fees = []  # (processed_count, code, code_num, amount_str, payload)
+                for processed_count, fee_input in enumerate(fees, start=1):
                     code = str(fee_input.get('code', '')).strip()
                     amount_input = fee_input.get('amount')
-                    status_msg = ""
-                    current_code_num = None 
 
                     try:
                         if not code or amount_input is None:
@@ -408,7 +666,6 @@ class FeeScheduleManager:
                             continue
                         
                         amount_str = self._format_amount_for_api(amount_input)
-                        api_response_ok = False
                         
                         current_code_num = self._get_code_num(code)
                         if not current_code_num:
@@ -421,29 +678,24 @@ class FeeScheduleManager:
                             "FeeSched": fee_sched_num_int,
                             "CodeNum": current_code_num
                         }
-                        response = self.make_request('/fees', 'POST', data=create_payload)
-                        if response and 'FeeNum' in response:
-                            status_msg = 'Created'
-                            api_response_ok = True
-                        else:
-                            logger.error(f"Failed to create new fee for CodeNum {current_code_num} on schedule '{name}' (ID: {fee_sched_num_int}) - invalid API response: {response}")
-                        
-                        if api_response_ok:
-                            successful_fees += 1
-                            logger.info(f"Fee {processed_count}/{total_fees_to_process} for '{name}' (ID: {fee_sched_num_int}, Code: {code}, CodeNum: {current_code_num}): {status_msg} with Amount: {amount_str}")
-                        else:
-                            if not status_msg: 
-                                logger.error(f"Fee processing failed for Code {code} (CodeNum {current_code_num}) on schedule '{name}' (ID: {fee_sched_num_int}). Action not taken.")
-                            failed_fees += 1
+                        pending_fees.append((processed_count, code, current_code_num, amount_str, create_payload))
                             
                     except ValueError as ve: 
                         logger.error(f"Failed to process fee {processed_count}/{total_fees_to_process} for schedule '{name}' (ID: {fee_sched_num_int}, Code: {code}). Error: Invalid value - {str(ve)}")
                         failed_fees += 1
-                    except Exception as e_api: 
-                        logger.error(f"Failed to process fee {processed_count}/{total_fees_to_process} for schedule '{name}' (ID: {fee_sched_num_int}, Code: {code}, CodeNum: {current_code_num if current_code_num is not None else 'N/A'}). API Error: {str(e_api)}")
+
+                responses = _run_coroutine(self._setup_fees_async([pending[4] for pending in pending_fees])) if pending_fees else []
+
+                for (processed_count, code, current_code_num, amount_str, _), response in zip(pending_fees, responses):
+                    if isinstance(response, BaseException):
+                        logger.error(f"Failed to process fee {processed_count}/{total_fees_to_process} for schedule '{name}' (ID: {fee_sched_num_int}, Code: {code}, CodeNum: {current_code_num}). API Error: {str(response)}")
+                        failed_fees += 1
+                    elif response and 'FeeNum' in response:
+                        successful_fees += 1
+                        logger.info(f"Fee {processed_count}/{total_fees_to_process} for '{name}' (ID: {fee_sched_num_int}, Code: {code}, CodeNum: {current_code_num}): Created with Amount: {amount_str}")
+                    else:
+                        logger.error(f"Failed to create new fee for CodeNum {current_code_num} on schedule '{name}' (ID: {fee_sched_num_int}) - invalid API response: {response}")
                         failed_fees += 1
-                    
-                    time.sleep(0.5) # Throttle
             
             return Ok({
                 "fee_sched_num": fee_sched_num_str,
@@ -460,7 +712,7 @@ class FeeScheduleManager:
                                 fee_sched_type: Optional[str] = None, 
                                 fees: Optional[List[Dict]] = None) -> Dict:
         """
-        Update an existing fee schedule name (if provided) and its fees synchronously with throttling.
+        Update an existing fee schedule name (if provided) and its fees, sending the fee writes concurrently with throttling.
         """
         try:
             if not fee_sched_num_str:
@@ -506,6 +758,7 @@ class FeeScheduleManager:
                             if fs_data_cache.get('id') == fee_sched_num_int:
                                 del self.fee_schedules[fs_name_cache]
                                 self.fee_schedules[name.lower()] = fs_data_cache 
+                                self._rebuild_normalized_schedule_index()
                                 break
                     else:
                         logger.error(f"Failed to update fee schedule name for {fee_sched_num_int}. Response: {name_update_response}")
@@ -517,114 +770,9 @@ class FeeScheduleManager:
             failed_fees_processed = 0
             
             if fees and isinstance(fees, list):
-                logger.info(f"Fetching existing fees for schedule {fee_sched_num_int} before update using pagination.")
-                existing_fees_map = {} 
-                all_fetched_fees_list = [] 
-                offset = 0
-                BATCH_SIZE = 100 
-                has_more_data = True
-
-                while has_more_data:
-                    try:
-                        logger.debug(f"Fetching fees for schedule {fee_sched_num_int} with offset {offset}")
-                        paginated_endpoint = f"/fees?FeeSched={fee_sched_num_int}&Offset={offset}"
-                        current_batch_fees_data = self.make_request(paginated_endpoint, method='GET')
-                        
-                        if isinstance(current_batch_fees_data, list):
-                            all_fetched_fees_list.extend(current_batch_fees_data)
-                            logger.debug(f"Fetched {len(current_batch_fees_data)} fees in this batch for schedule {fee_sched_num_int}.")
-                            if len(current_batch_fees_data) < BATCH_SIZE:
-                                has_more_data = False 
-                            else:
-                                offset += BATCH_SIZE
-                        else:
-                            logger.error(f"Unexpected response type when fetching fees for schedule {fee_sched_num_int} at offset {offset}. Response: {current_batch_fees_data}")
-                            has_more_data = False 
-
-                    except Exception as e_fetch_batch:
-                        logger.error(f"Error fetching fees batch for schedule {fee_sched_num_int} at offset {offset}: {str(e_fetch_batch)}")
-                        has_more_data = False 
-                
-                if all_fetched_fees_list:
-                    for fee_item in all_fetched_fees_list:
-                        if isinstance(fee_item, dict) and 'CodeNum' in fee_item and 'FeeNum' in fee_item and 'Amount' in fee_item:
-                            existing_fees_map[fee_item['CodeNum']] = fee_item 
-                
-                logger.info(f"Found a total of {len(existing_fees_map)} existing fees for schedule {fee_sched_num_int} after pagination.")
-                
-                total_fees_to_process = len(fees)
-                processed_count = 0
-                logger.info(f"Processing {total_fees_to_process} fee updates synchronously for schedule {fee_sched_num_int} with 0.5 req/sec throttle.")
-                
-                for fee_input in fees:
-                    processed_count += 1
-                    code = str(fee_input.get('code', '')).strip()
-                    amount_input = fee_input.get('amount')
-                    status_msg = ""
-                    current_code_num = None 
-
-                    try:
-                        if not code or amount_input is None:
-                            logger.warning(f"Skipping fee update {processed_count}/{total_fees_to_process} for schedule {fee_sched_num_int} due to missing code or amount: {fee_input}")
-                            failed_fees_processed += 1
-                            continue
-                        
-                        current_code_num = self._get_code_num(code)
-                        if not current_code_num:
-                            logger.warning(f"Could not find CodeNum for procedure code '{code}' for schedule {fee_sched_num_int}. Skipping fee update {processed_count}/{total_fees_to_process}.")
-                            failed_fees_processed += 1
-                            continue
-
-                        amount_str_new = self._format_amount_for_api(amount_input)
-                        api_response_ok = False
-                        
-                        if current_code_num in existing_fees_map:
-                            existing_fee_details = existing_fees_map[current_code_num]
-                            existing_amount_formatted = f"{float(existing_fee_details['Amount']):.2f}" # Format existing amount for comparison
-
-                            if amount_str_new == existing_amount_formatted:
-                                logger.info(f"Fee {processed_count}/{total_fees_to_process} for schedule {fee_sched_num_int} (Code: {code}, CodeNum: {current_code_num}): Amount ${amount_str_new} matches existing amount. Skipping update.")
-                                successful_fees_processed +=1 # Count as success as it's already correct
-                                continue # Skip API call
-
-                            fee_num = existing_fee_details['FeeNum']
-                            update_payload = {"Amount": amount_str_new}
-                            
-                            response = self.make_request(f'/fees/{fee_num}', 'PUT', data=update_payload)
-                            if response and (response.get('FeeNum') or response.get('_synthetic_put_ok')):
-                                status_msg = 'Updated'
-                                api_response_ok = True
-                            else:
-                                logger.error(f"Failed to update fee for CodeNum {current_code_num} on schedule {fee_sched_num_int} - invalid API response: {response}")
-                        else:
-                            create_payload = {
-                                "Amount": amount_str_new,
-                                "FeeSched": fee_sched_num_int,
-                                "CodeNum": current_code_num
-                            }
-                            response = self.make_request('/fees', 'POST', data=create_payload)
-                            if response and 'FeeNum' in response: 
-                                status_msg = 'Created'
-                                api_response_ok = True
-                            else:
-                                logger.error(f"Failed to create new fee for CodeNum {current_code_num} on schedule {fee_sched_num_int} - invalid API response: {response}")
-
-                        if api_response_ok:
-                            successful_fees_processed += 1
-                            logger.info(f"Fee {processed_count}/{total_fees_to_process} for schedule {fee_sched_num_int} (Code: {code}, CodeNum: {current_code_num}): {status_msg} with Amount: {amount_str_new}")
-                        else:
-                            if not status_msg: 
-                                logger.error(f"Fee processing failed for Code {code} (CodeNum {current_code_num}) on schedule {fee_sched_num_int} (not updated or created).")
-                            failed_fees_processed += 1
-                            
-                    except ValueError as ve: 
-                        logger.error(f"Failed to process fee {processed_count}/{total_fees_to_process} for schedule {fee_sched_num_int} (Code: {code}). Error: Invalid value - {str(ve)}")
-                        failed_fees_processed += 1
-                    except Exception as e_api: 
-                        logger.error(f"Failed to process fee {processed_count}/{total_fees_to_process} for schedule {fee_sched_num_int} (Code: {code}, CodeNum: {current_code_num if current_code_num is not None else 'N/A'}). API Error: {str(e_api)}")
-                        failed_fees_processed += 1
-                    
-                    time.sleep(0.5) 
+                successful_fees_processed, failed_fees_processed = _run_coroutine(
+                    self._update_fees_async(fee_sched_num_int, fees)
+                )
 
             return Ok({
                 "message": "Fee schedule update process completed.",
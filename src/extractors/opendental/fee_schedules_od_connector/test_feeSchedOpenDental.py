@@ -0,0 +1,211 @@
+"""Tests for the concurrent fee writes in FeeScheduleManager, run against a stubbed HTTP session."""
+import asyncio
+import json
+
+import pytest
+
+pytest.importorskip("aiohttp")
+pytest.importorskip("requests")
+pytest.importorskip("backend.logging_config")
+
+import feeSchedOpenDental
+from feeSchedOpenDental import FeeScheduleManager
+
+
+class _FakeResponse:
+    """Async context manager standing in for an aiohttp response."""
+    def __init__(self, status: int, body: bytes, delay: float):
+        self.status = status
+        self._body = body
+        self._delay = delay
+
+    async def __aenter__(self):
+        await asyncio.sleep(self._delay)
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+    async def read(self) -> bytes:
+        return self._body
+
+
+class _FakeSession:
+    """
+    Stands in for aiohttp.ClientSession. handler(method, url, payload) returns
+    (status, body, delay); every request is recorded in `requests` in start order.
+    """
+    def __init__(self, handler):
+        self.handler = handler
+        self.requests = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+    def request(self, method, url, headers=None, data=None, timeout=None):
+        payload = json.loads(data) if data else None
+        self.requests.append((method, url, payload))
+        status, body, delay = self.handler(method, url, payload)
+        if not isinstance(body, bytes):
+            body = json.dumps(body).encode('utf-8')
+        return _FakeResponse(status, body, delay)
+
+
+@pytest.fixture
+def manager(monkeypatch):
+    monkeypatch.setattr(feeSchedOpenDental, "_FEE_REQUEST_INTERVAL_SECONDS", 0)
+    pms_data = {'procedureCodes': {'D0120': 1, 'D0140': 2, 'D0150': 3, 'D1110': 4}}
+    return FeeScheduleManager("od.test", "ODFHIR key", pms_data)
+
+
+def _use_session(monkeypatch, manager, handler) -> _FakeSession:
+    session = _FakeSession(handler)
+    monkeypatch.setattr(manager, "_open_async_session", lambda: session)
+    return session
+
+
+def _new_schedule(monkeypatch, manager, fee_sched_num=77):
+    monkeypatch.setattr(
+        manager, "_get_or_create_fee_schedule",
+        lambda name, fee_schedule_type: feeSchedOpenDental.Ok({"fee_sched_num": fee_sched_num, "is_new": True})
+    )
+
+
+def _post_handler(method, url, payload):
+    # Later fees answer first, and CodeNum 3 is rejected by the API
+    code_num = payload['CodeNum']
+    if code_num == 3:
+        return 400, b"Invalid fee", 0
+    return 201, {"FeeNum": 1000 + code_num, **payload}, 0.01 * (5 - code_num)
+
+
+def test_setup_fees_async_returns_responses_in_payload_order(monkeypatch, manager):
+    _use_session(monkeypatch, manager, _post_handler)
+    payloads = [{"Amount": "10.00", "FeeSched": 77, "CodeNum": code_num} for code_num in (1, 2, 3, 4)]
+
+    responses = asyncio.run(manager._setup_fees_async(payloads))
+
+    assert [response['FeeNum'] for response in (responses[0], responses[1], responses[3])] == [1001, 1002, 1004]
+    assert isinstance(responses[2], Exception)
+
+
+def test_setup_fee_schedule_counts_successes_and_failures(monkeypatch, manager):
+    session = _use_session(monkeypatch, manager, _post_handler)
+    _new_schedule(monkeypatch, manager)
+    fees = [
+        {'code': 'D0120', 'amount': 45},
+        {'code': 'D0140', 'amount': '$60.50'},
+        {'code': 'D0150', 'amount': 80},      # rejected by the API
+        {'code': 'D9999', 'amount': 10},      # unknown procedure code
+        {'code': 'D1110', 'amount': None},    # missing amount
+        {'code': 'D1110', 'amount': 95},
+    ]
+
+    result = manager.setup_fee_schedule({'name': 'Test PPO', 'type': 'Normal', 'fees': fees})
+
+    assert result['ok']
+    assert result['value']['successful_fees'] == 3
+    assert result['value']['failed_fees'] == 3
+    assert [payload['CodeNum'] for _, _, payload in session.requests] == [1, 2, 3, 4]
+
+
+def test_setup_fee_schedule_inside_running_event_loop(monkeypatch, manager):
+    _use_session(monkeypatch, manager, _post_handler)
+    _new_schedule(monkeypatch, manager)
+    fees = [{'code': 'D0120', 'amount': 45}, {'code': 'D0150', 'amount': 80}]
+
+    async def call_from_async_code():
+        return manager.setup_fee_schedule({'name': 'Test PPO', 'fees': fees})
+
+    result = asyncio.run(call_from_async_code())
+
+    assert result['ok']
+    assert (result['value']['successful_fees'], result['value']['failed_fees']) == (1, 1)
+
+
+def _existing_fee(code_num, amount):
+    return {"FeeNum": 500 + code_num, "CodeNum": code_num, "Amount": amount, "FeeSched": 77}
+
+
+def _paged_handler(pages):
+    """GET /fees serves pages[offset] (an exception status for ints); writes succeed."""
+    def handler(method, url, payload):
+        if method == 'GET':
+            page = pages[int(url.rsplit('Offset=', 1)[1])]
+            if isinstance(page, int):
+                return page, b"Server error", 0
+            return 200, page, 0
+        if method == 'PUT':
+            return 200, b"", 0
+        return 201, {"FeeNum": 900 + payload['CodeNum'], **payload}, 0
+    return handler
+
+
+def _update_fees(monkeypatch, manager, pages):
+    monkeypatch.setattr(feeSchedOpenDental, "_FEE_PAGE_SIZE", 2)
+    monkeypatch.setattr(feeSchedOpenDental, "_FEE_PAGE_PREFETCH", 3)
+    session = _use_session(monkeypatch, manager, _paged_handler(pages))
+    fees = [{'code': code, 'amount': 45} for code in ('D0120', 'D0140', 'D0150', 'D1110')]
+    result = manager.update_fee_schedule('77', fees=fees)
+    gets = [url.rsplit('Offset=', 1)[1] for method, url, _ in session.requests if method == 'GET']
+    writes = [(method, url.rsplit('/', 1)[1], payload) for method, url, payload in session.requests if method != 'GET']
+    return result, gets, writes
+
+
+def test_update_fee_schedule_stops_at_short_page_mid_batch(monkeypatch, manager):
+    pages = {
+        0: [_existing_fee(1, "45.00"), _existing_fee(2, "40.00")],
+        2: [_existing_fee(3, "45.00")],  # short page: the listing ends here
+        4: [_existing_fee(4, "45.00"), _existing_fee(4, "45.00")],  # prefetched past the end, ignored
+    }
+
+    result, gets, writes = _update_fees(monkeypatch, manager, pages)
+
+    assert gets == ['0', '2', '4']
+    assert writes == [
+        ('PUT', '502', {"Amount": "45.00"}),
+        ('POST', 'fees', {"Amount": "45.00", "FeeSched": 77, "CodeNum": 4}),
+    ]
+    assert (result['value']['data']['updatedFees'], result['value']['data']['failedFees']) == (4, 0)
+
+
+def test_update_fee_schedule_stops_at_failed_page_mid_batch(monkeypatch, manager):
+    pages = {
+        0: [_existing_fee(1, "45.00"), _existing_fee(2, "45.00")],
+        2: 500,  # failed page: the listing ends with what was fetched before it
+        4: [_existing_fee(3, "45.00"), _existing_fee(4, "45.00")],
+    }
+
+    result, gets, writes = _update_fees(monkeypatch, manager, pages)
+
+    assert gets == ['0', '2', '4']
+    assert writes == [
+        ('POST', 'fees', {"Amount": "45.00", "FeeSched": 77, "CodeNum": 3}),
+        ('POST', 'fees', {"Amount": "45.00", "FeeSched": 77, "CodeNum": 4}),
+    ]
+    assert (result['value']['data']['updatedFees'], result['value']['data']['failedFees']) == (4, 0)
+
+
+def test_update_fee_schedule_spaces_only_the_writes(monkeypatch, manager):
+    waits = []
+    real_wait = feeSchedOpenDental._RequestThrottle.wait
+
+    async def counting_wait(throttle):
+        waits.append(throttle)
+        await real_wait(throttle)
+
+    monkeypatch.setattr(feeSchedOpenDental._RequestThrottle, "wait", counting_wait)
+    pages = {
+        0: [_existing_fee(1, "45.00"), _existing_fee(2, "40.00")],
+        2: [_existing_fee(3, "45.00"), _existing_fee(4, "45.00")],
+        4: [],
+    }
+
+    result, gets, writes = _update_fees(monkeypatch, manager, pages)
+
+    assert gets == ['0', '2', '4']
+    assert writes == [('PUT', '502', {"Amount": "45.00"})]
+    assert len(waits) == len(writes)  # page GETs take no throttle slot